@@ -1,7 +1,8 @@
 """Lightweight connection handling for MCP servers."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from contextlib import AsyncExitStack
+from contextlib import AsyncExitStack, asynccontextmanager
 from typing import Any
 
 from mcp import ClientSession, StdioServerParameters
@@ -52,6 +53,12 @@ class MCPConnection(ABC):
         self.session = None
         self._stack = None
 
+    async def ping(self, timeout: float | None = None) -> None:
+        """Check the session is alive; raises if the server doesn't answer."""
+        if self.session is None:
+            raise ConnectionError("MCP session is not open")
+        await asyncio.wait_for(self.session.send_ping(), timeout)
+
     async def list_tools(self) -> list[dict[str, Any]]:
         """Retrieve available tools from the MCP server."""
         response = await self.session.list_tools()
@@ -149,3 +156,157 @@ def create_connection(
 
     else:
         raise ValueError(f"Unsupported transport type: {transport}. Use 'stdio', 'sse', or 'http'")
+
+
+class _PooledConnection:
+    """One pool slot: a connection opened and closed by its own owner task.
+
+    The transports enter anyio task groups, which must be exited by the task
+    that entered them, so a slot can be reconnected from whichever task
+    leases it.
+    """
+
+    def __init__(self, params: dict[str, Any]):
+        self.params = params
+        self.connection = None
+        self._task = None
+        self._opened = None
+        self._closing = None
+        self.checked_at = None  # loop time the session last proved healthy
+
+    async def open(self) -> None:
+        """Connect and wait until the session is initialized."""
+        self._opened = asyncio.get_running_loop().create_future()
+        self._closing = asyncio.Event()
+        self._task = asyncio.create_task(self._hold())
+        await self._opened
+
+    async def _hold(self) -> None:
+        try:
+            async with create_connection(**self.params) as connection:
+                self.connection = connection
+                self._opened.set_result(None)
+                await self._closing.wait()
+        except Exception as e:
+            # Before the open completes this is the connect error; after, the
+            # server went away and the next health check reconnects
+            if not self._opened.done():
+                self._opened.set_exception(e)
+        finally:
+            self.connection = None
+            if not self._opened.done():
+                self._opened.cancel()
+
+    async def close(self) -> None:
+        """Close the connection and wait for its owner task to finish."""
+        if self._task is None:
+            return
+        self._closing.set()
+        try:
+            await self._task
+        except Exception:
+            pass
+        self._task = None
+
+    async def reconnect(self) -> None:
+        await self.close()
+        await self.open()
+
+
+class MCPConnectionPool:
+    """Pool of sessions to one MCP server, leased to concurrent tasks.
+
+    Every session is created from the same create_connection() parameters
+    (for stdio, each one starts its own server process). Each call_tool()
+    leases a free session just for that call, so any number of tasks share
+    the pool. A leased session that hasn't proved healthy within
+    `health_check_interval` (or whose last lease failed) is pinged first and
+    reconnected if it doesn't answer, so one dead session doesn't fail every
+    call that comes after it.
+
+    Example:
+        async with MCPConnectionPool(4, transport="stdio", command="python", args=["server.py"]) as pool:
+            result = await pool.call_tool("search", {"query": "..."})
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        health_check_timeout: float = 10.0,
+        health_check_interval: float = 30.0,
+        **params,
+    ):
+        """
+        Args:
+            size: Number of sessions to open
+            health_check_timeout: Seconds to wait for a ping before reconnecting
+            health_check_interval: Seconds a session stays trusted without a ping
+            **params: create_connection() arguments (transport, command, url, ...)
+        """
+        create_connection(**params)  # Validate the parameters up front
+        self.size = max(1, size)
+        self.health_check_timeout = health_check_timeout
+        self.health_check_interval = health_check_interval
+        self.reconnects = 0
+        self._slots = [_PooledConnection(params) for _ in range(self.size)]
+        self._idle = None
+
+    async def __aenter__(self):
+        """Open all sessions concurrently."""
+        self._idle = asyncio.Queue()
+        results = await asyncio.gather(*(slot.open() for slot in self._slots), return_exceptions=True)
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            await self._close_all()
+            raise errors[0]
+        for slot in self._slots:
+            self._idle.put_nowait(slot)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close all sessions."""
+        await self._close_all()
+        self._idle = None
+
+    async def _close_all(self) -> None:
+        await asyncio.gather(*(slot.close() for slot in self._slots))
+
+    async def _check(self, slot: _PooledConnection) -> None:
+        """Ping the slot's session unless it was healthy recently; reconnect once if it doesn't answer."""
+        now = asyncio.get_running_loop().time()
+        if slot.connection is not None:
+            if slot.checked_at is not None and now - slot.checked_at < self.health_check_interval:
+                return
+            try:
+                await slot.connection.ping(self.health_check_timeout)
+                slot.checked_at = now
+                return
+            except Exception:
+                pass
+        self.reconnects += 1
+        await slot.reconnect()
+        slot.checked_at = now
+
+    @asynccontextmanager
+    async def lease(self):
+        """Lease a healthy connection for one call (or a few back to back)."""
+        slot = await self._idle.get()
+        try:
+            await self._check(slot)
+            yield slot.connection
+            slot.checked_at = asyncio.get_running_loop().time()
+        except BaseException:
+            slot.checked_at = None  # ping it before the next lease
+            raise
+        finally:
+            self._idle.put_nowait(slot)
+
+    async def list_tools(self) -> list[dict[str, Any]]:
+        """Retrieve available tools from the MCP server."""
+        async with self.lease() as connection:
+            return await connection.list_tools()
+
+    async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
+        """Call a tool on any free session."""
+        async with self.lease() as connection:
+            return await connection.call_tool(tool_name, arguments)
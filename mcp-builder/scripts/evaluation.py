@@ -14,9 +14,10 @@ import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Any
 
-from anthropic import Anthropic
+import httpx
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
 
-from connections import create_connection
+from connections import MCPConnectionPool
 
 EVALUATION_PROMPT = """You are an AI assistant with access to tools.
 
@@ -76,6 +77,39 @@ def parse_evaluation_file(file_path: Path) -> list[dict[str, Any]]:
         return []
 
 
+class RateLimiter:
+    """Spaces out request starts to stay under a requests-per-minute limit."""
+
+    def __init__(self, rpm: float | None = None):
+        self.interval = 60.0 / rpm if rpm else 0.0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        """Wait until the next request may start."""
+        if not self.interval:
+            return
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            delay = self._next_start - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_start = max(self._next_start, loop.time()) + self.interval
+
+
+def create_client(concurrency: int = 1) -> AsyncAnthropic:
+    """Create an async Claude client with a keep-alive pool sized for `concurrency` tasks."""
+    connections = max(1, concurrency)
+    http_client = DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=connections,
+            max_keepalive_connections=connections,
+            keepalive_expiry=60,
+        ),
+    )
+    return AsyncAnthropic(http_client=http_client)
+
+
 def extract_xml_content(text: str, tag: str) -> str | None:
     """Extract content from XML tags."""
     pattern = rf"<{tag}>(.*?)</{tag}>"
@@ -83,87 +117,131 @@ def extract_xml_content(text: str, tag: str) -> str | None:
     return matches[-1].strip() if matches else None
 
 
+async def run_tool(connection: Any, tool_use: Any) -> tuple[str, float]:
+    """Execute one tool_use block; returns the tool response text and duration."""
+    tool_start_ts = time.time()
+    try:
+        tool_result = await connection.call_tool(tool_use.name, tool_use.input)
+        tool_response = json.dumps(tool_result) if isinstance(tool_result, (dict, list)) else str(tool_result)
+    except Exception as e:
+        tool_response = f"Error executing tool {tool_use.name}: {str(e)}\n"
+        tool_response += traceback.format_exc()
+    return tool_response, time.time() - tool_start_ts
+
+
+# Token counts summed over every API call of a task
+USAGE_FIELDS = ("input_tokens", "output_tokens", "cache_read_input_tokens", "cache_creation_input_tokens")
+
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def with_cache_control(tools: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Copy of the tool list with a cache breakpoint on the last definition."""
+    if not tools:
+        return tools
+    return [*tools[:-1], {**tools[-1], "cache_control": CACHE_CONTROL}]
+
+
+def add_usage(totals: dict[str, int], usage: Any) -> None:
+    """Add one response's token usage to the running totals."""
+    for field in USAGE_FIELDS:
+        totals[field] += getattr(usage, field, None) or 0
+
+
 async def agent_loop(
-    client: Anthropic,
+    client: AsyncAnthropic,
     model: str,
     question: str,
     tools: list[dict[str, Any]],
     connection: Any,
-) -> tuple[str, dict[str, Any]]:
-    """Run the agent loop with MCP tools."""
+    rate_limiter: RateLimiter | None = None,
+    serial_tools: bool = False,
+) -> tuple[str, dict[str, Any], dict[str, int]]:
+    """Run the agent loop with MCP tools.
+
+    A turn's tool calls run concurrently unless `serial_tools` is set. The
+    system prompt and tool definitions are resent on every turn, so both
+    carry cache breakpoints; returns the response text, per-tool metrics and
+    summed token usage.
+    """
+    rate_limiter = rate_limiter or RateLimiter()
     messages = [{"role": "user", "content": question}]
+    system = [{"type": "text", "text": EVALUATION_PROMPT, "cache_control": CACHE_CONTROL}]
+    cached_tools = with_cache_control(tools)
+    usage = dict.fromkeys(USAGE_FIELDS, 0)
 
-    response = await asyncio.to_thread(
-        client.messages.create,
+    await rate_limiter.wait()
+    response = await client.messages.create(
         model=model,
         max_tokens=4096,
-        system=EVALUATION_PROMPT,
+        system=system,
         messages=messages,
-        tools=tools,
+        tools=cached_tools,
     )
+    add_usage(usage, response.usage)
 
     messages.append({"role": "assistant", "content": response.content})
 
     tool_metrics = {}
 
     while response.stop_reason == "tool_use":
-        tool_use = next(block for block in response.content if block.type == "tool_use")
-        tool_name = tool_use.name
-        tool_input = tool_use.input
-
-        tool_start_ts = time.time()
-        try:
-            tool_result = await connection.call_tool(tool_name, tool_input)
-            tool_response = json.dumps(tool_result) if isinstance(tool_result, (dict, list)) else str(tool_result)
-        except Exception as e:
-            tool_response = f"Error executing tool {tool_name}: {str(e)}\n"
-            tool_response += traceback.format_exc()
-        tool_duration = time.time() - tool_start_ts
-
-        if tool_name not in tool_metrics:
-            tool_metrics[tool_name] = {"count": 0, "durations": []}
-        tool_metrics[tool_name]["count"] += 1
-        tool_metrics[tool_name]["durations"].append(tool_duration)
-
-        messages.append({
-            "role": "user",
-            "content": [{
+        # Run the turn's tool calls (concurrently unless serial) and answer them in one message
+        tool_uses = [block for block in response.content if block.type == "tool_use"]
+        if serial_tools:
+            outcomes = [await run_tool(connection, tool_use) for tool_use in tool_uses]
+        else:
+            outcomes = await asyncio.gather(*(run_tool(connection, tool_use) for tool_use in tool_uses))
+
+        tool_results = []
+        for tool_use, (tool_response, tool_duration) in zip(tool_uses, outcomes):
+            if tool_use.name not in tool_metrics:
+                tool_metrics[tool_use.name] = {"count": 0, "durations": []}
+            tool_metrics[tool_use.name]["count"] += 1
+            tool_metrics[tool_use.name]["durations"].append(tool_duration)
+
+            tool_results.append({
                 "type": "tool_result",
                 "tool_use_id": tool_use.id,
                 "content": tool_response,
-            }]
-        })
+            })
+
+        messages.append({"role": "user", "content": tool_results})
 
-        response = await asyncio.to_thread(
-            client.messages.create,
+        await rate_limiter.wait()
+        response = await client.messages.create(
             model=model,
             max_tokens=4096,
-            system=EVALUATION_PROMPT,
+            system=system,
             messages=messages,
-            tools=tools,
+            tools=cached_tools,
         )
+        add_usage(usage, response.usage)
         messages.append({"role": "assistant", "content": response.content})
 
     response_text = next(
         (block.text for block in response.content if hasattr(block, "text")),
         None,
     )
-    return response_text, tool_metrics
+    return response_text, tool_metrics, usage
 
 
 async def evaluate_single_task(
-    client: Anthropic,
+    client: AsyncAnthropic,
     model: str,
     qa_pair: dict[str, Any],
     tools: list[dict[str, Any]],
     connection: Any,
     task_index: int,
+    rate_limiter: RateLimiter | None = None,
+    serial_tools: bool = False,
 ) -> dict[str, Any]:
     """Evaluate a single QA pair with the given tools."""
     start_time = time.time()
 
     print(f"Task {task_index + 1}: Running task with question: {qa_pair['question']}")
-    response, tool_metrics = await agent_loop(client, model, qa_pair["question"], tools, connection)
+    response, tool_metrics, usage = await agent_loop(
+        client, model, qa_pair["question"], tools, connection, rate_limiter, serial_tools
+    )
 
     response_value = extract_xml_content(response, "response")
     summary = extract_xml_content(response, "summary")
@@ -179,6 +257,7 @@ async def evaluate_single_task(
         "total_duration": duration_seconds,
         "tool_calls": tool_metrics,
         "num_tool_calls": sum(len(metrics["durations"]) for metrics in tool_metrics.values()),
+        "usage": usage,
         "summary": summary,
         "feedback": feedback,
     }
@@ -193,6 +272,8 @@ REPORT_HEADER = """
 - **Average Task Duration**: {average_duration_s:.2f}s
 - **Average Tool Calls per Task**: {average_tool_calls:.2f}
 - **Total Tool Calls**: {total_tool_calls}
+- **Total Input Tokens**: {input_tokens} uncached, {cache_read_tokens} cache read, {cache_creation_tokens} cache write
+- **Total Output Tokens**: {output_tokens}
 
 ---
 """
@@ -205,6 +286,7 @@ TASK_TEMPLATE = """
 **Actual Answer**: `{actual_answer}`
 **Correct**: {correct_indicator}
 **Duration**: {total_duration:.2f}s
+**Cache Tokens**: {cache_read_tokens} read, {cache_creation_tokens} written ({input_tokens} uncached input)
 **Tool Calls**: {tool_calls}
 
 **Summary**
@@ -221,29 +303,46 @@ async def run_evaluation(
     eval_path: Path,
     connection: Any,
     model: str = "claude-3-7-sonnet-20250219",
+    concurrency: int = 1,
+    rpm: float | None = None,
+    serial_tools: bool = False,
 ) -> str:
-    """Run evaluation with MCP server tools."""
+    """Run evaluation with MCP server tools.
+
+    Up to `concurrency` tasks run at once, sharing `connection` (an
+    MCPConnectionPool, which leases a session per tool call, or one
+    MCPConnection); `rpm` caps Claude API requests per minute across all of
+    them, and `serial_tools` runs each task's tool calls one at a time.
+    Results keep the input order.
+    """
     print("🚀 Starting Evaluation")
 
-    client = Anthropic()
-
     tools = await connection.list_tools()
     print(f"📋 Loaded {len(tools)} tools from MCP server")
 
     qa_pairs = parse_evaluation_file(eval_path)
     print(f"📋 Loaded {len(qa_pairs)} evaluation tasks")
 
-    results = []
-    for i, qa_pair in enumerate(qa_pairs):
-        print(f"Processing task {i + 1}/{len(qa_pairs)}")
-        result = await evaluate_single_task(client, model, qa_pair, tools, connection, i)
-        results.append(result)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    rate_limiter = RateLimiter(rpm)
+
+    async with create_client(concurrency) as client:
+
+        async def run_task(i: int, qa_pair: dict[str, Any]) -> dict[str, Any]:
+            async with semaphore:
+                print(f"Processing task {i + 1}/{len(qa_pairs)}")
+                return await evaluate_single_task(
+                    client, model, qa_pair, tools, connection, i, rate_limiter, serial_tools
+                )
+
+        results = await asyncio.gather(*(run_task(i, qa_pair) for i, qa_pair in enumerate(qa_pairs)))
 
     correct = sum(r["score"] for r in results)
     accuracy = (correct / len(results)) * 100 if results else 0
     average_duration_s = sum(r["total_duration"] for r in results) / len(results) if results else 0
     average_tool_calls = sum(r["num_tool_calls"] for r in results) / len(results) if results else 0
     total_tool_calls = sum(r["num_tool_calls"] for r in results)
+    total_usage = {field: sum(r["usage"][field] for r in results) for field in USAGE_FIELDS}
 
     report = REPORT_HEADER.format(
         correct=correct,
@@ -252,6 +351,10 @@ async def run_evaluation(
         average_duration_s=average_duration_s,
         average_tool_calls=average_tool_calls,
         total_tool_calls=total_tool_calls,
+        input_tokens=total_usage["input_tokens"],
+        output_tokens=total_usage["output_tokens"],
+        cache_read_tokens=total_usage["cache_read_input_tokens"],
+        cache_creation_tokens=total_usage["cache_creation_input_tokens"],
     )
 
     report += "".join([
@@ -262,6 +365,9 @@ async def run_evaluation(
             actual_answer=result["actual"] or "N/A",
             correct_indicator="✅" if result["score"] else "❌",
             total_duration=result["total_duration"],
+            cache_read_tokens=result["usage"]["cache_read_input_tokens"],
+            cache_creation_tokens=result["usage"]["cache_creation_input_tokens"],
+            input_tokens=result["usage"]["input_tokens"],
             tool_calls=json.dumps(result["tool_calls"], indent=2),
             summary=result["summary"] or "N/A",
             feedback=result["feedback"] or "N/A",
@@ -316,6 +422,15 @@ Examples:
 
   # Evaluate an HTTP MCP server with custom model
   python evaluation.py -t http -u https://example.com/mcp -m claude-3-5-sonnet-20241022 eval.xml
+
+  # Run 8 tasks at a time, at most 50 API requests per minute
+  python evaluation.py -t stdio -c python -a my_server.py --concurrency 8 --rpm 50 eval.xml
+
+  # Share 2 server sessions between 8 concurrent tasks
+  python evaluation.py -t stdio -c python -a my_server.py --concurrency 8 --pool-size 2 eval.xml
+
+  # Never call two tools at once (for servers whose tools aren't parallel-safe)
+  python evaluation.py -t stdio -c python -a my_server.py --serial-tools eval.xml
         """,
     )
 
@@ -333,6 +448,10 @@ Examples:
     remote_group.add_argument("-H", "--header", nargs="+", dest="headers", help="HTTP headers in 'Key: Value' format (sse/http only)")
 
     parser.add_argument("-o", "--output", type=Path, help="Output file for evaluation report (default: stdout)")
+    parser.add_argument("--concurrency", type=int, default=1, help="Number of tasks to run concurrently (default: 1)")
+    parser.add_argument("--rpm", type=float, help="Max Claude API requests per minute across all tasks (default: no limit)")
+    parser.add_argument("--pool-size", type=int, help="Number of MCP server sessions shared by all tasks (default: same as --concurrency)")
+    parser.add_argument("--serial-tools", action="store_true", help="Run each task's tool calls one at a time instead of concurrently")
 
     args = parser.parse_args()
 
@@ -344,7 +463,8 @@ Examples:
     env_vars = parse_env_vars(args.env) if args.env else None
 
     try:
-        connection = create_connection(
+        connection = MCPConnectionPool(
+            size=args.pool_size or args.concurrency,
             transport=args.transport,
             command=args.command,
             args=args.args,
@@ -359,8 +479,10 @@ Examples:
     print(f"🔗 Connecting to MCP server via {args.transport}...")
 
     async with connection:
-        print("✅ Connected successfully")
-        report = await run_evaluation(args.eval_file, connection, args.model)
+        print(f"✅ Connected successfully ({connection.size} session{'s' if connection.size != 1 else ''})")
+        report = await run_evaluation(
+            args.eval_file, connection, args.model, args.concurrency, args.rpm, args.serial_tools
+        )
 
         if args.output:
             args.output.write_text(report)
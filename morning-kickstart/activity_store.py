@@ -0,0 +1,228 @@
+"""
+Local append-only Strava activity store.
+
+Keeps every synced Strava activity in a JSON-lines file under the skills
+data directory. Each run only fetches activities newer than the last one
+seen, so after the first backfill a sync is a small delta fetch. Weekly
+stats and energy inputs are computed from the local history instead of
+pulling overlapping windows from the API.
+
+Usage:
+    from activity_store import sync_activities, load_activities, weekly_stats
+
+    sync_activities(lambda n: strava.get_recent_activities(perPage=n))
+    activities = load_activities()
+    stats = weekly_stats(activities, days=7)
+"""
+
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from paths import ACTIVITY_FILE
+
+# Page sizes tried in order when syncing: a normal delta fits in the first,
+# larger pages catch up after a gap (Strava caps perPage at 200)
+SYNC_PAGE_SIZES = (10, 50, 200)
+
+RUN_TYPES = {'Run', 'TrailRun', 'VirtualRun'}
+METERS_PER_MILE = 1609.344
+
+
+def activity_datetime(activity: Dict[str, Any]) -> Optional[datetime]:
+    """
+    Get an activity's local start time.
+
+    Args:
+        activity: Strava activity dict
+
+    Returns:
+        Naive datetime of start_date_local (or start_date), None if missing
+    """
+    value = activity.get('start_date_local') or activity.get('start_date')
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '')).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+def activity_sort_key(activity: Dict[str, Any]) -> Tuple[str, str]:
+    """Store order: start time, then id."""
+    return (activity.get('start_date_local') or activity.get('start_date') or '', str(activity.get('id')))
+
+
+def load_activities(store_path: Path = ACTIVITY_FILE) -> List[Dict[str, Any]]:
+    """
+    Load all stored activities, oldest first.
+
+    Overlapping syncs (e.g. a daemon prefetch and a CLI --refresh) can both
+    append the same activities, so only the first copy of each id is kept.
+
+    Args:
+        store_path: Path to the JSON-lines store
+
+    Returns:
+        List of activity dicts sorted by start time (empty if no store yet)
+    """
+    if not store_path.exists():
+        return []
+
+    activities = []
+    seen_ids = set()
+    with open(store_path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                activity = json.loads(line)
+            except ValueError:
+                # Skip a torn final line from an interrupted write
+                continue
+            activity_id = activity.get('id')
+            if activity_id is not None:
+                if activity_id in seen_ids:
+                    continue
+                seen_ids.add(activity_id)
+            activities.append(activity)
+
+    activities.sort(key=activity_sort_key)
+    return activities
+
+
+def append_activities(activities: List[Dict[str, Any]], store_path: Path = ACTIVITY_FILE):
+    """
+    Append activities to the store, oldest first.
+
+    Args:
+        activities: Activity dicts not already in the store
+        store_path: Path to the JSON-lines store
+    """
+    if not activities:
+        return
+
+    store_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(store_path, 'a') as f:
+        for activity in sorted(activities, key=activity_sort_key):
+            f.write(json.dumps(activity) + '\n')
+
+
+def sync_activities(
+    fetch_recent: Callable[[int], List[Dict[str, Any]]],
+    store_path: Path = ACTIVITY_FILE
+) -> List[Dict[str, Any]]:
+    """
+    Fetch activities newer than the last stored one and append them.
+
+    Starts with a small page; if every activity on the page is new (so the
+    gap since the last sync may be bigger), retries with a larger page. An
+    empty store is backfilled with the largest page.
+
+    Args:
+        fetch_recent: Function taking a page size and returning the most
+            recent activities, newest first (e.g. strava.get_recent_activities)
+        store_path: Path to the JSON-lines store
+
+    Returns:
+        List of newly stored activities (oldest first)
+
+    Example:
+        new = sync_activities(lambda n: strava.get_recent_activities(perPage=n))
+        print(f"Synced {len(new)} new activities")
+    """
+    known_ids = {a.get('id') for a in load_activities(store_path)}
+    page_sizes = SYNC_PAGE_SIZES if known_ids else SYNC_PAGE_SIZES[-1:]
+
+    new_activities = []
+    for page_size in page_sizes:
+        fetched = fetch_recent(page_size) or []
+        new_activities = [a for a in fetched if a.get('id') not in known_ids]
+
+        # Stop once the page overlaps the store or there's nothing older left
+        if len(new_activities) < len(fetched) or len(fetched) < page_size:
+            break
+
+    append_activities(new_activities, store_path)
+    return sorted(new_activities, key=activity_sort_key)
+
+
+def recent_activities(activities: List[Dict[str, Any]], count: int = 10) -> List[Dict[str, Any]]:
+    """
+    Get the most recent activities, newest first (same order as the Strava API).
+
+    Args:
+        activities: Stored activities, oldest first
+        count: Number of activities to return
+
+    Returns:
+        Up to `count` activities, newest first
+    """
+    return list(reversed(activities[-count:])) if count > 0 else []
+
+
+def activities_since(activities: List[Dict[str, Any]], since: datetime) -> List[Dict[str, Any]]:
+    """
+    Get activities starting at or after `since`, oldest first.
+
+    Args:
+        activities: Stored activities, oldest first
+        since: Cutoff datetime (naive, local time)
+
+    Returns:
+        Activities in the window
+    """
+    result = []
+    for activity in reversed(activities):
+        start = activity_datetime(activity)
+        if start is None:
+            continue
+        if start < since:
+            break
+        result.append(activity)
+    result.reverse()
+    return result
+
+
+def weekly_stats(
+    activities: List[Dict[str, Any]],
+    days: int = 7,
+    now: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """
+    Compute training volume over the last `days` days from local history.
+
+    Args:
+        activities: Stored activities, oldest first
+        days: Window size in days
+        now: End of the window (defaults to now)
+
+    Returns:
+        Dict with:
+        - run_distance_miles: Total run distance
+        - total_time_hours: Total moving time across all activities
+        - activity_count: Number of activities
+        - run_count: Number of runs
+
+    Example:
+        stats = weekly_stats(load_activities())
+        print(f"{stats['run_distance_miles']:.1f} mi this week")
+    """
+    now = now or datetime.now()
+    window = [
+        a for a in activities_since(activities, now - timedelta(days=days))
+        if activity_datetime(a) <= now
+    ]
+
+    runs = [a for a in window if (a.get('sport_type') or a.get('type')) in RUN_TYPES]
+    run_meters = sum(a.get('distance') or 0 for a in runs)
+    moving_seconds = sum(a.get('moving_time') or 0 for a in window)
+
+    return {
+        'run_distance_miles': run_meters / METERS_PER_MILE,
+        'total_time_hours': moving_seconds / 3600,
+        'activity_count': len(window),
+        'run_count': len(runs),
+    }
@@ -0,0 +1,265 @@
+"""
+Backfill morning kickstart summaries for a range of past days.
+
+Renders what the summary would have said on each morning, using only the
+local stores: the Strava activity store, the tracker store, the workout
+phase index and the last cached Things lists. Every store is loaded once.
+Each day sees only the activities and tracker events up to that day, found
+by binary search, and days are rendered in parallel across a process pool.
+
+Things has no local history, so every day uses the most recently cached
+task lists. Tracker scalars such as `streak` and `weekly_streaks` are the
+current values.
+
+A backfill never touches live state or MCP: each day's energy comes from
+an in-memory training load folded forward over the stored activities
+(the saved training-load state is left alone), and days without training
+history use the plan-only estimate instead of the Strava MCP fallback.
+
+Usage:
+    python backfill.py 2025-01-01 2025-12-31 --out summaries/
+
+    from backfill import backfill
+    summaries = backfill(date(2025, 1, 1), date(2025, 12, 31))
+    print(summaries[date(2025, 6, 2)])
+"""
+
+import argparse
+import os
+import sqlite3
+import time
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, time as clock_time, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+import kickstart_engine
+from kickstart_engine import DEFAULT_WORKOUT_METADATA, load_tracker_data, render_summary
+from activity_store import activity_datetime, load_activities
+from paths import CARTER_FILE, DENVER_FILE, NEEDLE_MOVER_FILE, OUTREACH_FILE
+from response_cache import read_cache
+from tracker_store import (
+    EVENT_KEYS,
+    TOTAL,
+    event_date,
+    event_type,
+    is_completed,
+    load_tracker,
+    summarize_entries,
+    week_start
+)
+from training_load import TrainingLoad, classify, plan_energy_level
+from workout_parser import get_or_refresh_metadata, metadata_for_date
+
+# Time of day each backfilled summary is rendered at
+MORNING = clock_time(6, 0)
+
+# Trackers whose rollups change day to day: source name -> (tracker, JSON file)
+DAILY_TRACKERS = {
+    'needle_data': ('needle_mover', NEEDLE_MOVER_FILE),
+    'outreach_data': ('outreach', OUTREACH_FILE),
+    'carter_data': ('carter', CARTER_FILE),
+}
+
+
+def _is_day(value: str) -> bool:
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _load_tracker_history(tracker: str, filepath: Path) -> Mapping[str, Any]:
+    """A tracker's scalars and full event list, from the store or its JSON file."""
+    if kickstart_engine.USE_TRACKER_STORE:
+        try:
+            return load_tracker(tracker, filepath, since=date.min)
+        except (sqlite3.Error, OSError) as e:
+            print(f"Warning: Tracker store unavailable ({e}), reading {filepath.name}")
+    return load_tracker_data(filepath)
+
+
+class TrackerHistory:
+    """
+    A tracker's events sorted by date, sliceable to any past day.
+
+    Produces the same week_counts / month_counts / last_logged fields the
+    tracker store's rollups give the live summary.
+    """
+
+    def __init__(self, data: Mapping[str, Any], events_key: str):
+        entries = [e for e in data.get(events_key, []) if isinstance(e, dict)]
+        entries.sort(key=event_date)
+        self.entries = entries
+        self.dates = [event_date(e) for e in entries]
+        self.state = {key: data[key] for key in data if key != events_key}
+
+        # Completion dates per metric (already sorted) for last_logged lookups
+        self.completed_dates: Dict[str, List[str]] = {}
+        for day, entry in zip(self.dates, entries):
+            if not is_completed(entry) or not _is_day(day):
+                continue
+            kind = event_type(entry)
+            for metric in ((TOTAL, kind) if kind else (TOTAL,)):
+                self.completed_dates.setdefault(metric, []).append(day)
+
+    def for_day(self, day: date) -> Dict[str, Any]:
+        """Tracker data as the summary would have loaded it on `day`."""
+        window_start = min(week_start(day), day.replace(day=1)).isoformat()
+        lo = bisect_left(self.dates, window_start)
+        hi = bisect_right(self.dates, day.isoformat())
+
+        data = dict(self.state)
+        data.update(summarize_entries(self.entries[lo:hi], day))
+
+        last_logged = {}
+        for metric, dates in self.completed_dates.items():
+            i = bisect_right(dates, day.isoformat())
+            if i:
+                last_logged[metric] = dates[i - 1]
+        data['last_logged'] = last_logged
+        return data
+
+
+class Snapshot:
+    """Every local store, loaded once, sliceable to any past day."""
+
+    def __init__(self):
+        self.things_today = (read_cache('things_today') or {}).get('value') or []
+        self.things_upcoming = (read_cache('things_upcoming') or {}).get('value') or []
+
+        self.activities = load_activities()
+        self.activity_keys = [a.get('start_date_local') or a.get('start_date') or '' for a in self.activities]
+
+        try:
+            self.workout_metadata = get_or_refresh_metadata()
+        except Exception as e:
+            print(f"Warning: Could not load workout metadata: {e}")
+            self.workout_metadata = DEFAULT_WORKOUT_METADATA
+
+        self.trackers = {
+            name: TrackerHistory(_load_tracker_history(tracker, filepath), EVENT_KEYS[tracker])
+            for name, (tracker, filepath) in DAILY_TRACKERS.items()
+        }
+        self.denver_data = dict(_load_tracker_history('denver', DENVER_FILE))
+        self.energy: Dict[date, str] = {}
+
+    def prepare_energy(self, days: List[date]):
+        """
+        Compute each day's energy level in one pass over the activities.
+
+        Uses a fresh TrainingLoad that is never saved, so the live
+        training-load state isn't touched; days before any activity get the
+        plan-only estimate.
+        """
+        load = TrainingLoad()
+        position = 0
+        for day in sorted(days):
+            while position < len(self.activities):
+                start = activity_datetime(self.activities[position])
+                if start is not None and start.date() > day:
+                    break
+                if start is not None:
+                    load.add(self.activities[position])
+                position += 1
+
+            form = load.form(day)
+            if form is not None:
+                self.energy[day] = classify(form[2])
+            else:
+                template = metadata_for_date(self.workout_metadata, day).get('weekly_template', {})
+                self.energy[day] = plan_energy_level(template.get(day.strftime('%a'), 'Not specified'))
+
+    def sources_for_day(self, day: date) -> Dict[str, Any]:
+        """Source values keyed like fetch_all_sources(), as of `day`."""
+        next_day = (day + timedelta(days=1)).isoformat()
+        sources = {
+            'things_today': self.things_today,
+            'things_upcoming': self.things_upcoming,
+            'strava_athlete': ({}, {}),
+            'strava_history': self.activities[:bisect_left(self.activity_keys, next_day)],
+            'workout_metadata': self.workout_metadata,
+            'denver_data': self.denver_data,
+        }
+        for name, history in self.trackers.items():
+            sources[name] = history.for_day(day)
+        return sources
+
+
+# Per-process snapshot, set once by the pool initializer
+_snapshot: Optional[Snapshot] = None
+
+
+def _init_worker(snapshot: Snapshot):
+    global _snapshot
+    _snapshot = snapshot
+
+
+def _render_day(day: date):
+    return day, render_summary(
+        _snapshot.sources_for_day(day),
+        datetime.combine(day, MORNING),
+        energy_level=_snapshot.energy[day]
+    )
+
+
+def backfill(
+    start: date,
+    end: date,
+    workers: Optional[int] = None,
+    snapshot: Optional[Snapshot] = None
+) -> Dict[date, str]:
+    """
+    Render the morning summary for every day from `start` to `end`.
+
+    Args:
+        start: First day (inclusive)
+        end: Last day (inclusive)
+        workers: Worker processes (defaults to CPU count; 1 renders in-process)
+        snapshot: Preloaded stores (loaded here if not given)
+
+    Returns:
+        Dict of day -> summary text, in date order
+
+    Example:
+        summaries = backfill(date(2025, 1, 1), date(2025, 3, 31))
+        for day, summary in summaries.items():
+            print(summary)
+    """
+    days = [start + timedelta(days=n) for n in range((end - start).days + 1)]
+    snapshot = snapshot or Snapshot()
+    snapshot.prepare_energy(days)
+
+    if workers == 1 or len(days) <= 1:
+        _init_worker(snapshot)
+        return dict(map(_render_day, days))
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(days) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(snapshot,)) as pool:
+        return dict(pool.map(_render_day, days, chunksize=chunksize))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Render morning kickstart summaries for past days")
+    parser.add_argument('start', type=date.fromisoformat, help="First day (YYYY-MM-DD)")
+    parser.add_argument('end', type=date.fromisoformat, help="Last day (YYYY-MM-DD)")
+    parser.add_argument('--out', type=Path, help="Write one YYYY-MM-DD.txt per day here instead of printing")
+    parser.add_argument('--workers', type=int, help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    summaries = backfill(args.start, args.end, workers=args.workers)
+    elapsed = time.perf_counter() - started
+
+    if args.out:
+        args.out.mkdir(parents=True, exist_ok=True)
+        for day, summary in summaries.items():
+            (args.out / f'{day.isoformat()}.txt').write_text(summary)
+    else:
+        for summary in summaries.values():
+            print(summary)
+
+    print(f"Rendered {len(summaries)} days in {elapsed:.1f}s")
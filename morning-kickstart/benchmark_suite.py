@@ -0,0 +1,274 @@
+"""
+Offline benchmark suite for the morning kickstart engine.
+
+Generates synthetic datasets (Things tasks, a Strava activity history,
+tracker files and a workout plan) in a scratch data directory, records
+them as a replay fixture, and runs generate_morning_summary against them
+with KICKSTART_REPLAY=replay - no MCP clients, no network, no real data.
+Each run happens in a fresh interpreter (the data paths are read at
+import) and reports per-stage timings from the Profiler plus the peak
+traced memory (from a second, tracemalloc-enabled run).
+
+Usage:
+    python benchmark_suite.py
+    python benchmark_suite.py --tasks 10 1000 100000 --activities 100
+    python benchmark_suite.py --json results.json
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List
+
+from paths import ACTIVITY_FILE, KICKSTART_DIR
+
+ENGINE_DIR = Path(__file__).resolve().parent
+
+# Default sweeps: tasks with a fixed activity history, then activities
+# with a fixed task list
+TASK_SIZES = (10, 100, 1_000, 10_000, 100_000)
+ACTIVITY_SIZES = (10, 100, 1_000, 10_000)
+BASE_TASKS = 100
+BASE_ACTIVITIES = 100
+
+# Pinned clock for every run (a Monday in plan phase 2)
+BENCH_NOW = datetime(2026, 3, 9, 6, 0)
+
+_TAGS = ('#job-search', '#deep-work', '#admin', '#relationship', '#health', '#errand')
+_WORDS = (
+    'apply', 'outreach', 'follow up', 'draft', 'review', 'date night', 'flowers',
+    'note', 'research', 'call', 'invoice', 'plan', 'refactor', 'groceries', 'email'
+)
+_SPORTS = ('Run', 'Run', 'Run', 'Ride', 'WeightTraining', 'Hike', 'BackcountrySki')
+
+
+def make_tasks(count: int, rng: random.Random) -> List[Dict[str, Any]]:
+    """Synthetic Things tasks with a realistic mix of tags, priorities and deadlines."""
+    tasks = []
+    for i in range(count):
+        words = rng.sample(_WORDS, 3)
+        tasks.append({
+            'id': f'task-{i}',
+            'title': f"{words[0].capitalize()} {words[1]} for {words[2]} #{i}",
+            'tags': rng.sample(_TAGS, rng.randint(0, 2)),
+            'priority': 'P1' if rng.random() < 0.1 else None,
+            'deadline': (BENCH_NOW + timedelta(days=rng.randint(0, 14))).date().isoformat()
+                        if rng.random() < 0.05 else None,
+        })
+    return tasks
+
+
+def make_activities(count: int, rng: random.Random) -> List[Dict[str, Any]]:
+    """Synthetic Strava activities, oldest first, ending the day before BENCH_NOW."""
+    activities = []
+    start = BENCH_NOW - timedelta(hours=16)
+    for i in range(count):
+        sport = rng.choice(_SPORTS)
+        activities.append({
+            'id': 10_000_000 + count - i,
+            'name': f"{sport} {i}",
+            'sport_type': sport,
+            'type': sport,
+            'start_date_local': start.isoformat(),
+            'distance': rng.uniform(3000, 25000) if sport in ('Run', 'Ride') else 0,
+            'moving_time': rng.randint(1200, 9000),
+            'suffer_score': rng.randint(10, 250) if rng.random() < 0.7 else None,
+        })
+        start -= timedelta(hours=rng.choice((20, 24, 28, 48)))
+    activities.reverse()
+    return activities
+
+
+def make_plan() -> str:
+    """A workout plan with a recovery phase and the current build phase."""
+    template = (
+        "| Day | Workout | Notes |\n|-----|---------|-------|\n"
+        "| Mon | REST | |\n| Tue | Tempo 5 mi | |\n| Wed | **SKI STRENGTH** | |\n"
+        "| Thu | Easy 4 mi | |\n| Fri | **SKI STRENGTH** | |\n"
+        "| Sat | Long Run 10 mi | |\n| Sun | Easy 3 mi | |\n"
+    )
+    return (
+        "# Benchmark Plan\n\n## Current Status\n\n"
+        "**Decision:** Starting Phase 2: Build fresh on Monday\n\n---\n\n"
+        "## Phase 1: Base\n**Jan 5 - Feb 15, 2026**\n\n**Weekly Volume:** 15-20 miles\n\n"
+        f"### Weekly Template Structure\n\n{template}\n---\n\n"
+        "## Phase 2: Build\n**Feb 16 - Apr 12, 2026**\n\n**Weekly Volume:** 25-30 miles\n\n"
+        f"### Weekly Template Structure\n\n{template}"
+    )
+
+
+def make_dataset(data_dir: Path, tasks: int, activities: int, seed: int = 0) -> Dict[str, str]:
+    """
+    Write a synthetic dataset and its replay fixture into `data_dir`.
+
+    Args:
+        data_dir: Scratch data directory (becomes KICKSTART_DATA_DIR)
+        tasks: Number of Things tasks for today
+        activities: Number of stored Strava activities
+        seed: Random seed (same seed, same dataset)
+
+    Returns:
+        Environment variables that point the engine at the dataset
+    """
+    rng = random.Random(seed)
+    data_dir.mkdir(parents=True, exist_ok=True)
+
+    history = make_activities(activities, rng)
+    store_dir = data_dir / KICKSTART_DIR.name
+    store_dir.mkdir(exist_ok=True)
+    with open(store_dir / ACTIVITY_FILE.name, 'w') as f:
+        for activity in history:
+            f.write(json.dumps(activity) + '\n')
+
+    days = [(BENCH_NOW - timedelta(days=n)).date().isoformat() for n in range(120)]
+    trackers = {
+        'needle-mover-data.json': {'streak': 6, 'entries': [
+            {'date': day, 'category': rng.choice(('job_search', 'health', 'relationship'))} for day in days
+        ]},
+        'outreach-streak-data.json': {'weekly_streaks': 3, 'outreaches': [
+            {'date': rng.choice(days), 'company': f"Company {i}"} for i in range(300)
+        ]},
+        'carter-rituals-data.json': {'rituals': [
+            {'date': rng.choice(days), 'type': rng.choice(('weekly_date', 'validating_note', 'monthly_flowers'))}
+            for _ in range(100)
+        ]},
+        'denver-connect-data.json': {'current_challenge': 'Join a run club', 'status': 'PENDING'},
+    }
+    for name, data in trackers.items():
+        with open(data_dir / name, 'w') as f:
+            json.dump(data, f)
+
+    plan_file = data_dir / 'plan.md'
+    plan_file.write_text(make_plan())
+
+    today_tasks = make_tasks(tasks, rng)
+    fixture = {
+        'recorded_at': BENCH_NOW.isoformat(),
+        'things': {
+            'get_today()': today_tasks,
+            'get_upcoming(days=3)': make_tasks(20, rng),
+        },
+        'strava': {
+            'get_athlete_profile()': {'id': 1},
+            'get_athlete_stats(1)': {},
+            'get_recent_activities(perPage=10)': list(reversed(history[-10:])),
+        },
+    }
+    fixture_file = data_dir / 'replay.json'
+    with open(fixture_file, 'w') as f:
+        json.dump(fixture, f)
+
+    return {
+        'KICKSTART_DATA_DIR': str(data_dir),
+        'KICKSTART_PLAN_FILE': str(plan_file),
+        'KICKSTART_REPLAY': 'replay',
+        'KICKSTART_REPLAY_FILE': str(fixture_file),
+    }
+
+
+def _run_worker(memory: bool) -> Dict[str, Any]:
+    """One engine run in this process (the environment is already set up)."""
+    import tracemalloc
+
+    from kickstart_engine import generate_morning_summary
+    from profiling import Profiler
+
+    profiler = Profiler()
+    if memory:
+        tracemalloc.start()
+    summary = generate_morning_summary(profiler=profiler)
+    peak = tracemalloc.get_traced_memory()[1] if memory else None
+    tracemalloc.stop()
+
+    run = profiler.to_dict()
+    return {
+        'total_ms': run['total_ms'],
+        'stages': {span['name']: span['duration_ms'] for span in run['spans']},
+        'peak_bytes': peak,
+        'summary_chars': len(summary),
+    }
+
+
+def run_case(tasks: int, activities: int) -> Dict[str, Any]:
+    """
+    Benchmark one dataset size in fresh interpreters.
+
+    Returns:
+        Dict with tasks, activities, total_ms, stages (name -> ms) and peak_mb
+    """
+    results = {}
+    for memory in (False, True):
+        # Fresh data dir per run, so both start cold
+        with tempfile.TemporaryDirectory(prefix='kickstart-bench-') as tmp:
+            env = dict(os.environ, **make_dataset(Path(tmp), tasks, activities))
+            command = [sys.executable, __file__, '--worker'] + (['--memory'] if memory else [])
+            output = subprocess.run(
+                command, cwd=ENGINE_DIR, env=env, capture_output=True, text=True, check=True
+            ).stdout
+            results[memory] = json.loads(output.strip().splitlines()[-1])
+
+    timed, traced = results[False], results[True]
+    return {
+        'tasks': tasks,
+        'activities': activities,
+        'total_ms': timed['total_ms'],
+        'stages': timed['stages'],
+        'peak_mb': round(traced['peak_bytes'] / 2**20, 2),
+    }
+
+
+def format_table(cases: List[Dict[str, Any]]) -> str:
+    """Stages as rows, dataset sizes as columns."""
+    header = [f"{c['tasks']}t/{c['activities']}a" for c in cases]
+    stages = sorted({name for case in cases for name in case['stages']})
+    width = max(len(h) for h in header + ['12']) + 2
+
+    lines = [f"{'stage':<28}" + ''.join(f"{h:>{width}}" for h in header)]
+    for name in stages:
+        cells = [case['stages'].get(name) for case in cases]
+        lines.append(f"{name:<28}" + ''.join(
+            f"{cell:>{width}.1f}" if cell is not None else f"{'-':>{width}}" for cell in cells
+        ))
+    lines.append(f"{'total ms':<28}" + ''.join(f"{c['total_ms']:>{width}.1f}" for c in cases))
+    lines.append(f"{'peak MB (tracemalloc)':<28}" + ''.join(f"{c['peak_mb']:>{width}.2f}" for c in cases))
+    return "\n".join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the engine on synthetic datasets, offline")
+    parser.add_argument('--tasks', type=int, nargs='*', default=list(TASK_SIZES), help="Task counts to sweep")
+    parser.add_argument('--activities', type=int, nargs='*', default=list(ACTIVITY_SIZES), help="Activity counts to sweep")
+    parser.add_argument('--json', type=Path, help="Also write the results here")
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--memory', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(_run_worker(args.memory)))
+        sys.exit(0)
+
+    sweeps = {
+        'tasks': [(n, BASE_ACTIVITIES) for n in args.tasks],
+        'activities': [(BASE_TASKS, n) for n in args.activities],
+    }
+    report = {}
+    for sweep, sizes in sweeps.items():
+        if not sizes:
+            continue
+        cases = []
+        for tasks, activities in sizes:
+            print(f"Running {tasks} tasks / {activities} activities...", file=sys.stderr)
+            cases.append(run_case(tasks, activities))
+        report[sweep] = cases
+        print(f"\n{sweep.upper()} SWEEP (ms per stage)")
+        print(format_table(cases))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
@@ -0,0 +1,56 @@
+"""
+Exit-time check for the fetch stage.
+
+Runs a fetch stage in a fresh interpreter with one source that hangs far
+past its timeout, and times the whole process, including interpreter
+shutdown (where non-daemon threads would be joined). Exits non-zero if the
+process outlived the timeout by more than the allowed slack, so it can
+guard regressions such as moving sources back onto a thread pool.
+
+Usage:
+    python fetch_exit_check.py
+    python fetch_exit_check.py --hang 10 --timeout 0.5 --slack 1
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ENGINE_DIR = Path(__file__).resolve().parent
+
+
+def time_hung_source_exit(hang: float = 5.0, timeout: float = 0.5) -> float:
+    """
+    Time a process whose fetch stage has a hung source.
+
+    Args:
+        hang: Seconds the hung source sleeps
+        timeout: Fetch stage timeout in seconds
+
+    Returns:
+        The child's wall time in seconds
+    """
+    code = (
+        "import time\n"
+        "from fetch_stage import run_fetch_stage\n"
+        f"print(run_fetch_stage({{'hung': (lambda: time.sleep({hang}), None), 'ok': (lambda: 1, None)}}, timeout={timeout}))\n"
+    )
+    started = time.monotonic()
+    subprocess.run([sys.executable, '-c', code], cwd=ENGINE_DIR, check=True)
+    return time.monotonic() - started
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Check that a hung fetch source can't delay process exit")
+    parser.add_argument('--hang', type=float, default=5.0, help="Seconds the hung source sleeps")
+    parser.add_argument('--timeout', type=float, default=0.5, help="Fetch stage timeout in seconds")
+    parser.add_argument('--slack', type=float, default=1.0, help="Allowed seconds past the timeout")
+    args = parser.parse_args()
+
+    elapsed = time_hung_source_exit(args.hang, args.timeout)
+    if elapsed > args.timeout + args.slack:
+        print(f"FAIL: process exited after {elapsed:.2f}s with a {args.timeout:g}s timeout")
+        sys.exit(1)
+    print(f"OK: process with a hung source exited after {elapsed:.2f}s")
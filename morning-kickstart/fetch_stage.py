@@ -0,0 +1,200 @@
+"""
+Concurrent fetch stage for morning-kickstart.
+
+Runs independent data sources (Things, Strava, workout plan, tracker files)
+in parallel so the morning summary waits for the slowest single source
+instead of the sum of all of them.
+
+Each source has a default value and a timeout. A source that raises or
+doesn't finish in time falls back to its default, matching the graceful
+degradation the engine has always had.
+
+Usage:
+    from fetch_stage import run_fetch_stage
+
+    results = run_fetch_stage({
+        'things_today': (things.get_today, []),
+        'strava_activities': (lambda: strava.get_recent_activities(perPage=10), []),
+    })
+"""
+
+import copy
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, TimeoutError as FutureTimeoutError, wait
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from profiling import Profiler, payload_size
+
+# Default per-source timeout (seconds)
+DEFAULT_TIMEOUT = 10.0
+
+# Source spec: (fetch function, default value[, timeout override])
+SourceSpec = Tuple[Any, ...]
+
+
+def _profiled(name: str, fetch_fn: Callable[[], Any], profiler: Optional[Profiler]) -> Callable[[], Any]:
+    """Wrap a fetch function in a profiler span recording its payload size."""
+    if profiler is None:
+        return fetch_fn
+
+    def run() -> Any:
+        with profiler.span(f'fetch.{name}') as span:
+            value = fetch_fn()
+            span['payload_size'] = payload_size(value)
+            return value
+
+    return run
+
+
+def _start(fetch_fn: Callable[[], Any], name: str) -> Future:
+    """
+    Run a fetch function on its own daemon thread.
+
+    Daemon threads aren't joined at interpreter exit (ThreadPoolExecutor
+    workers are, even after shutdown(wait=False)), so a hung source can't
+    keep the CLI alive past its timeout. In the daemon, a thread stuck on a
+    timed-out source ends whenever the call returns instead of holding a
+    pool slot.
+    """
+    future: Future = Future()
+    future.set_running_or_notify_cancel()
+
+    def run():
+        try:
+            future.set_result(fetch_fn())
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name=f'fetch-{name}', daemon=True).start()
+    return future
+
+
+class FetchStage:
+    """
+    A running fetch stage whose sources can be consumed as they finish.
+
+    All sources start on construction. result() blocks for one source (up to
+    its deadline); done() and wait_for_any() let callers act on whichever
+    sources are ready first, e.g. to stream summary sections.
+
+    Nothing needs closing: sources left unfinished (e.g. timed out) run on
+    daemon threads that end when their call returns or with the process.
+
+    Example:
+        stage = FetchStage({'things_today': (things.get_today, [])})
+        tasks = stage.result('things_today')
+    """
+
+    def __init__(
+        self,
+        sources: Dict[str, SourceSpec],
+        timeout: float = DEFAULT_TIMEOUT,
+        labels: Optional[Dict[str, str]] = None,
+        profiler: Optional[Profiler] = None
+    ):
+        self.sources = sources
+        self.labels = labels or {}
+        self.profiler = profiler
+        self._results: Dict[str, Any] = {}
+
+        started = time.monotonic()
+
+        self._timeouts = {}
+        self._deadlines = {}
+        self._futures = {}
+        for name, spec in sources.items():
+            source_timeout = spec[2] if len(spec) > 2 else timeout
+            self._timeouts[name] = source_timeout
+            self._deadlines[name] = started + source_timeout
+            self._futures[name] = _start(_profiled(name, spec[0], profiler), name)
+
+    def done(self, name: str) -> bool:
+        """True if the source finished, failed or passed its deadline."""
+        return (
+            name in self._results
+            or self._futures[name].done()
+            or time.monotonic() >= self._deadlines[name]
+        )
+
+    def wait_for_any(self, names: Iterable[str]):
+        """
+        Block until at least one of the named sources is done.
+
+        Returns early when the nearest deadline among them passes, so a hung
+        source can't block past its timeout.
+        """
+        pending = [name for name in names if not self.done(name)]
+        if not pending:
+            return
+
+        remaining = max(0.0, min(self._deadlines[name] for name in pending) - time.monotonic())
+        wait([self._futures[name] for name in pending], timeout=remaining, return_when=FIRST_COMPLETED)
+
+    def result(self, name: str) -> Any:
+        """
+        Get a source's value, falling back to its default on error or timeout.
+
+        Blocks until the source finishes or its deadline passes. Warnings are
+        printed once per source.
+        """
+        if name in self._results:
+            return self._results[name]
+
+        default = self.sources[name][1]
+        label = self.labels.get(name, name)
+        future = self._futures[name]
+
+        remaining = max(0.0, self._deadlines[name] - time.monotonic())
+        try:
+            value = future.result(timeout=remaining)
+        except FutureTimeoutError:
+            source_timeout = self._timeouts[name]
+            print(f"Warning: {label} timed out after {source_timeout:g}s, using defaults")
+            if self.profiler is not None:
+                self.profiler.add({
+                    'name': f'fetch.{name}',
+                    'status': 'timeout',
+                    'offset_ms': 0.0,
+                    'duration_ms': source_timeout * 1000
+                })
+            value = copy.deepcopy(default)
+        except Exception as e:
+            print(f"Warning: Could not fetch {label}: {e}")
+            value = copy.deepcopy(default)
+
+        self._results[name] = value
+        return value
+
+
+def run_fetch_stage(
+    sources: Dict[str, SourceSpec],
+    timeout: float = DEFAULT_TIMEOUT,
+    labels: Optional[Dict[str, str]] = None,
+    profiler: Optional[Profiler] = None
+) -> Dict[str, Any]:
+    """
+    Fetch all sources concurrently, falling back to defaults on error/timeout.
+
+    Args:
+        sources: Dict mapping source name -> (fetch_fn, default) or
+            (fetch_fn, default, timeout) to override the timeout per source
+        timeout: Default per-source timeout in seconds, measured from the
+            start of the stage (all sources start together)
+        labels: Optional human-readable names used in warning messages
+        profiler: Optional Profiler; each source is recorded as a
+            'fetch.<name>' span (timeouts as status 'timeout')
+
+    Returns:
+        Dict mapping source name -> fetched value (or a copy of its default)
+
+    Example:
+        results = run_fetch_stage({
+            'things_today': (things.get_today, []),
+            'workout_metadata': (get_or_refresh_metadata, {}, 2.0),
+        })
+        tasks = results['things_today']
+    """
+    stage = FetchStage(sources, timeout=timeout, labels=labels, profiler=profiler)
+    return {name: stage.result(name) for name in sources}
+
@@ -8,12 +8,201 @@ Generates bi-directional insights by having data sources inform each other:
 - Task tags → Outreach tracking alignment
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+import heapq
+from array import array
+from typing import List, Dict, Any, Optional, Sequence, Tuple, Union
 from datetime import datetime
 
+from task_index import TaskIndex
+from tracker_fields import TOTAL
+
+
+# Keyword and tag features for needle-mover scoring
+UNCOMFORTABLE_KEYWORDS = frozenset(['outreach', 'apply', 'call', 'reach out', 'contact', 'network'])
+JOB_TITLE_KEYWORDS = frozenset(['job', 'apply'])
+CREATION_KEYWORDS = frozenset(['write', 'create'])
+RELATIONSHIP_TAGS = frozenset(['#carter', '#relationship'])
+SOCIAL_TAGS = frozenset(['#denver', '#social', '#friends'])
+
+# Outreach and Carter matching
+OUTREACH_TAGS = ['#job-search', '#application', '#outreach', '#networking']
+OUTREACH_KEYWORDS = ['apply', 'outreach', 'network', 'recruiter', 'interview']
+CARTER_TAGS = ['#carter', '#date', '#date-night', '#flowers', '#relationship']
+CARTER_KEYWORDS = ['carter', 'date']
+CARTER_RITUAL_KEYWORDS = ['date', 'note', 'validation', 'flower']
+
+# Ritual types logged by the carter-rituals tracker, per checklist item
+CARTER_RITUAL_TYPES = {
+    'date': ('weekly_date', 'date'),
+    'note': ('validating_note', 'note'),
+    'flowers': ('monthly_flowers', 'flowers'),
+}
+
+# Every title keyword the contextualizers ask about, indexed in one pass
+INDEXED_KEYWORDS = (
+    UNCOMFORTABLE_KEYWORDS | JOB_TITLE_KEYWORDS | CREATION_KEYWORDS
+    | set(OUTREACH_KEYWORDS) | set(CARTER_KEYWORDS) | set(CARTER_RITUAL_KEYWORDS)
+)
+
+TaskList = Union[List[Dict[str, Any]], TaskIndex]
+
+# Base score per category (job search weighted for the 90-day focus)
+CATEGORY_SCORES = {
+    'job_search': 10,
+    'relationship': 5,
+    'creation': 4,
+    'social': 3,
+    'vision': 1,
+}
+
+# Penalty for a category done within RECENT_CATEGORY_DAYS (tasks with a deadline are exempt)
+RECENT_CATEGORY_PENALTY = 3
+RECENT_CATEGORY_DAYS = 1
+
+
+def build_task_index(things_tasks: TaskList) -> TaskIndex:
+    """
+    Build the shared task index used by every contextualizer.
+
+    Build it once per run and pass it to suggest_needle_mover,
+    contextualize_outreach and contextualize_carter; each also accepts a
+    plain task list and indexes it itself.
+
+    Example:
+        index = build_task_index(things.get_today())
+        category, action, context = suggest_needle_mover(index, 'HIGH', 4)
+        outreach = contextualize_outreach(outreach_data, index, 'HIGH')
+    """
+    return TaskIndex.ensure(things_tasks, INDEXED_KEYWORDS)
+
+
+def _task_category(keywords: frozenset, tags: List[str]) -> str:
+    """Categorize a task from its title keywords and tags."""
+    if '#job-search' in tags or not JOB_TITLE_KEYWORDS.isdisjoint(keywords):
+        return 'job_search'
+    if not RELATIONSHIP_TAGS.isdisjoint(tags):
+        return 'relationship'
+    if not SOCIAL_TAGS.isdisjoint(tags):
+        return 'social'
+    if not CREATION_KEYWORDS.isdisjoint(keywords):
+        return 'creation'
+    return 'vision'
+
+
+def _week_count(tracker_data: Dict[str, Any], events_key: str, types: Optional[Sequence[str]] = None) -> int:
+    """
+    Count this week's tracker events, by type if given.
+
+    Reads the weekly rollup ('week_counts') when the tracker was loaded with
+    one, otherwise counts the tracker's event list.
+    """
+    week_counts = tracker_data.get('week_counts')
+    if week_counts is not None:
+        if types is None:
+            return week_counts.get(TOTAL, 0)
+        return sum(week_counts.get(t, 0) for t in types)
+    return sum(
+        1 for entry in tracker_data.get(events_key, [])
+        if types is None or entry.get('type') in types
+    )
+
+
+def score_tasks(
+    things_tasks: TaskList,
+    energy_level: str,
+    positions: Optional[Sequence[int]] = None,
+    category_history: Optional[Dict[str, int]] = None
+) -> Tuple[array, List[str]]:
+    """
+    Score tasks for needle-mover selection in one batched pass.
+
+    Title keywords come from the task index (one precompiled pattern per
+    title, matched once); the energy-dependent bonuses are resolved once
+    for the whole batch.
+
+    Args:
+        things_tasks: Tasks or a TaskIndex
+        energy_level: 'HIGH', 'MEDIUM', or 'LOW'
+        positions: Task positions to score (defaults to all tasks)
+        category_history: Dict of category -> days since last
+
+    Returns:
+        Tuple of (scores, categories), both aligned with positions
+
+    Scoring:
+        - Category base: job_search 10, relationship 5, creation 4, social 3, vision 1
+        - Uncomfortable keyword: +5 (+3 more on HIGH energy)
+        - No uncomfortable keyword on LOW energy: +2
+        - Has a deadline: +3
+        - Category done in the last day: -3 (unless the task has a deadline)
+    """
+    index = build_task_index(things_tasks)
+    if positions is None:
+        positions = range(len(index))
+
+    uncomfortable_bonus = 5 + (3 if energy_level == 'HIGH' else 0)
+    comfortable_bonus = 2 if energy_level == 'LOW' else 0
+    recent_categories = {
+        category for category, days in (category_history or {}).items()
+        if days <= RECENT_CATEGORY_DAYS
+    }
+
+    scores = array('i', [0]) * len(positions)
+    categories = []
+
+    for i, position in enumerate(positions):
+        task = index.tasks[position]
+        keywords = index.keywords_of[position]
+        category = _task_category(keywords, task.get('tags', []))
+        categories.append(category)
+
+        score = CATEGORY_SCORES[category]
+        score += comfortable_bonus if UNCOMFORTABLE_KEYWORDS.isdisjoint(keywords) else uncomfortable_bonus
+        if task.get('deadline'):
+            score += 3
+        elif category in recent_categories:
+            score -= RECENT_CATEGORY_PENALTY
+        scores[i] = score
+
+    return scores, categories
+
+
+def rank_needle_movers(
+    things_tasks: TaskList,
+    energy_level: str,
+    k: int = 1,
+    positions: Optional[Sequence[int]] = None,
+    category_history: Optional[Dict[str, int]] = None
+) -> List[Tuple[int, str, Dict[str, Any]]]:
+    """
+    Select the top-k needle-mover candidates without sorting the whole list.
+
+    Args:
+        things_tasks: Candidate tasks or a TaskIndex
+        energy_level: 'HIGH', 'MEDIUM', or 'LOW'
+        k: Number of candidates to return
+        positions: Task positions to consider (defaults to all tasks)
+        category_history: Dict of category -> days since last
+
+    Returns:
+        List of (score, category, task), highest score first; ties keep
+        the input order
+
+    Example:
+        for score, category, task in rank_needle_movers(tasks, 'HIGH', k=3):
+            print(f"{score:3d} [{category}] {task['title']}")
+    """
+    index = build_task_index(things_tasks)
+    if positions is None:
+        positions = range(len(index))
+
+    scores, categories = score_tasks(index, energy_level, positions, category_history)
+    top = heapq.nlargest(k, range(len(scores)), key=scores.__getitem__)
+    return [(scores[i], categories[i], index.tasks[positions[i]]) for i in top]
+
 
 def suggest_needle_mover(
-    things_tasks: List[Dict[str, Any]],
+    things_tasks: TaskList,
     energy_level: str,
     current_streak: int,
     category_history: Optional[Dict[str, int]] = None
@@ -22,7 +211,7 @@ def suggest_needle_mover(
     Suggest today's needle-mover based on Things tasks and energy level.
 
     Args:
-        things_tasks: Tasks from Things (today + upcoming)
+        things_tasks: Tasks from Things (today + upcoming), or a TaskIndex
         energy_level: 'HIGH', 'MEDIUM', or 'LOW' from Strava
         current_streak: Current needle-mover streak
         category_history: Dict of category -> days since last (e.g., {'job_search': 2})
@@ -50,71 +239,26 @@ def suggest_needle_mover(
             print(f"  {line}")
     """
     context_lines = []
+    index = build_task_index(things_tasks)
 
-    # Filter to high-priority tasks
-    p1_tasks = [t for t in things_tasks if t.get('priority') == 'P1']
-    job_search_tasks = [t for t in things_tasks if '#job-search' in t.get('tags', [])]
-
-    # Combine and deduplicate
-    priority_tasks = {t['id']: t for t in (p1_tasks + job_search_tasks)}.values()
-    priority_tasks = list(priority_tasks)
+    # Filter to high-priority tasks: P1 first, then #job-search tasks
+    # (deduplicated by task ID, keeping first position and last task)
+    priority_by_id = {}
+    for position in index.by_priority.get('P1', []) + index.by_tag.get('#job-search', []):
+        task_id = index.tasks[position]['id']
+        priority_by_id[task_id] = position
+    priority_positions = list(priority_by_id.values())
 
-    context_lines.append(f"{len(priority_tasks)} priority tasks available")
+    context_lines.append(f"{len(priority_positions)} priority tasks available")
 
-    if not priority_tasks:
+    if not priority_positions:
         # Fallback: use any task from today
-        priority_tasks = things_tasks[:3]  # Top 3 tasks
+        priority_positions = list(range(min(3, len(index))))  # Top 3 tasks
         context_lines.append("No P1/job-search tasks, using top tasks")
 
-    # Score tasks based on criteria
-    scored_tasks = []
-
-    for task in priority_tasks:
-        score = 0
-        title = task.get('title', '')
-        tags = task.get('tags', [])
-        notes = task.get('notes', '')
-
-        # Job search tasks get priority (90-day focus)
-        if '#job-search' in tags or 'job' in title.lower() or 'apply' in title.lower():
-            score += 10
-            category = 'job_search'
-        elif any(tag in tags for tag in ['#carter', '#relationship']):
-            score += 5
-            category = 'relationship'
-        elif any(tag in tags for tag in ['#denver', '#social', '#friends']):
-            score += 3
-            category = 'social'
-        elif 'write' in title.lower() or 'create' in title.lower():
-            score += 4
-            category = 'creation'
-        else:
-            score += 1
-            category = 'vision'
-
-        # Uncomfortable tasks = important
-        uncomfortable_keywords = ['outreach', 'apply', 'call', 'reach out', 'contact', 'network']
-        if any(keyword in title.lower() for keyword in uncomfortable_keywords):
-            score += 5
-
-        # Energy-appropriate scoring
-        if energy_level == 'HIGH':
-            # On high energy, prefer uncomfortable tasks
-            if any(keyword in title.lower() for keyword in uncomfortable_keywords):
-                score += 3
-        elif energy_level == 'LOW':
-            # On low energy, prefer easier tasks (but still important)
-            if not any(keyword in title.lower() for keyword in uncomfortable_keywords):
-                score += 2
-
-        # Deadline urgency
-        if task.get('deadline'):
-            score += 3
-
-        scored_tasks.append((score, category, task))
-
-    # Sort by score (highest first)
-    scored_tasks.sort(key=lambda x: x[0], reverse=True)
+    scored_tasks = rank_needle_movers(
+        index, energy_level, k=1, positions=priority_positions, category_history=category_history
+    )
 
     if scored_tasks:
         score, category, best_task = scored_tasks[0]
@@ -140,7 +284,7 @@ def suggest_needle_mover(
 
 def contextualize_outreach(
     outreach_data: Dict[str, Any],
-    things_tasks: List[Dict[str, Any]],
+    things_tasks: TaskList,
     energy_level: str
 ) -> Dict[str, Any]:
     """
@@ -148,7 +292,7 @@ def contextualize_outreach(
 
     Args:
         outreach_data: Data from outreach-streak tracker
-        things_tasks: Tasks from Things
+        things_tasks: Tasks from Things, or a TaskIndex
         energy_level: Energy level from Strava
 
     Returns:
@@ -167,16 +311,11 @@ def contextualize_outreach(
             print(f"  - {task}")
     """
     # Find job-search related tasks in Things
-    job_tasks = [
-        t for t in things_tasks
-        if any(tag in ['#job-search', '#application', '#outreach', '#networking']
-               for tag in t.get('tags', []))
-        or any(keyword in t.get('title', '').lower()
-               for keyword in ['apply', 'outreach', 'network', 'recruiter', 'interview'])
-    ]
+    index = build_task_index(things_tasks)
+    job_tasks = index.matching(tags=OUTREACH_TAGS, keywords=OUTREACH_KEYWORDS)
 
     # Count current week's outreaches
-    current_count = len(outreach_data.get('outreaches', []))
+    current_count = _week_count(outreach_data, 'outreaches')
     target = 10
     remaining = target - current_count
 
@@ -208,7 +347,8 @@ def contextualize_outreach(
 def contextualize_denver(
     denver_data: Dict[str, Any],
     workout_metadata: Dict[str, Any],
-    strava_activities: List[Dict[str, Any]]
+    strava_activities: Optional[List[Dict[str, Any]]] = None,
+    now: Optional[datetime] = None
 ) -> Dict[str, str]:
     """
     Add training tie-ins to Denver connection challenges.
@@ -216,7 +356,9 @@ def contextualize_denver(
     Args:
         denver_data: Data from denver-connect tracker
         workout_metadata: Workout plan metadata
-        strava_activities: Recent Strava activities
+        strava_activities: Recent Strava activities (optional; the tie-in
+            is currently driven by the plan alone)
+        now: Current time (defaults to now; set to render a past day)
 
     Returns:
         Dict with:
@@ -234,7 +376,7 @@ def contextualize_denver(
     from datetime import datetime, timedelta
 
     # Get today's day of week
-    day_of_week = datetime.now().strftime('%a')
+    day_of_week = (now or datetime.now()).strftime('%a')
 
     # Get today's workout
     weekly_template = workout_metadata.get('weekly_template', {})
@@ -271,14 +413,14 @@ def contextualize_denver(
 
 def contextualize_carter(
     carter_data: Dict[str, Any],
-    things_tasks: List[Dict[str, Any]]
+    things_tasks: TaskList
 ) -> Dict[str, Any]:
     """
     Check if Carter rituals are planned in Things but not logged in tracker.
 
     Args:
         carter_data: Data from carter-rituals tracker
-        things_tasks: Tasks from Things
+        things_tasks: Tasks from Things, or a TaskIndex
 
     Returns:
         Dict with:
@@ -294,43 +436,38 @@ def contextualize_carter(
             print("Planned but not logged:", context['planned_but_not_logged'])
     """
     # Find Carter-related tasks
-    carter_tasks = [
-        t for t in things_tasks
-        if any(tag in ['#carter', '#date', '#date-night', '#flowers', '#relationship']
-               for tag in t.get('tags', []))
-        or 'carter' in t.get('title', '').lower()
-        or 'date' in t.get('title', '').lower()
-    ]
+    index = build_task_index(things_tasks)
+    carter_positions = index.positions(tags=CARTER_TAGS, keywords=CARTER_KEYWORDS)
+
+    def carter_tasks_mentioning(*keywords: str) -> List[int]:
+        mentioning = set(index.positions(keywords=keywords))
+        return [p for p in carter_positions if p in mentioning]
 
     planned_but_not_logged = []
     suggestions = []
 
     # Check for date nights
-    date_tasks = [t for t in carter_tasks if 'date' in t.get('title', '').lower()]
+    date_tasks = carter_tasks_mentioning('date')
     if date_tasks:
         # Check if logged in tracker
-        recent_dates = [
-            r for r in carter_data.get('rituals', [])
-            if r.get('type') == 'weekly_date'
-        ]
-        if not recent_dates:  # None logged this week
+        if not _week_count(carter_data, 'rituals', CARTER_RITUAL_TYPES['date']):  # None logged this week
             planned_but_not_logged.append("Date night planned in Things")
             suggestions.append("Log date night to tracker after completion")
 
     # Check for note writing
-    note_tasks = [t for t in carter_tasks if 'note' in t.get('title', '').lower() or 'validation' in t.get('title', '').lower()]
+    note_tasks = carter_tasks_mentioning('note', 'validation')
     if note_tasks:
         planned_but_not_logged.append("Validating note planned")
 
     # Check for flowers
-    flower_tasks = [t for t in carter_tasks if 'flower' in t.get('title', '').lower()]
+    flower_tasks = carter_tasks_mentioning('flower')
     if flower_tasks:
         planned_but_not_logged.append("Flowers task in Things")
 
     return {
         'planned_but_not_logged': planned_but_not_logged,
         'suggestions': suggestions,
-        'carter_tasks_count': len(carter_tasks)
+        'carter_tasks_count': len(carter_positions)
     }
 
 
@@ -0,0 +1,265 @@
+"""
+Long-running morning kickstart daemon with a warm, pre-rendered summary.
+
+The daemon imports the engine (and the MCP clients) once and keeps the
+last built summary model in memory. Every morning at PREFETCH_AT it fetches
+Things and Strava live and renders the summary, so the first request of the
+day is served instantly. Clients talk to it over a Unix socket; the client
+side imports nothing heavy and returns the cached summary in milliseconds.
+
+Usage:
+    python kickstart_daemon.py serve      # run the daemon
+    python kickstart_daemon.py            # print the summary (client)
+    python kickstart_daemon.py --refresh  # re-render with live data first
+    python kickstart_daemon.py json       # the same summary as JSON (or: markdown)
+    python kickstart_daemon.py json --refresh
+    python kickstart_daemon.py status     # rendered_at / next prefetch
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from datetime import datetime, time as clock_time, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from paths import SOCKET_PATH  # socket the daemon listens on
+
+# Daily live prefetch + pre-render
+PREFETCH_AT = clock_time(5, 30)
+
+# A cached summary older than this is re-rendered on request (from the
+# response cache, so usually without MCP calls)
+SUMMARY_MAX_AGE = 10 * 60
+
+# Client socket timeout (seconds) - a re-render can take a live fetch
+CLIENT_TIMEOUT = 30.0
+
+COMMANDS = ('summary', 'json', 'markdown', 'refresh', 'status')
+
+# Commands answered by rendering the cached summary: command -> format
+FORMATS = {'summary': 'text', 'json': 'json', 'markdown': 'markdown'}
+
+
+def next_prefetch(now: datetime, at: clock_time = PREFETCH_AT) -> datetime:
+    """Next time the daily prefetch should run (today if still ahead, else tomorrow)."""
+    candidate = datetime.combine(now.date(), at)
+    if candidate <= now:
+        candidate += timedelta(days=1)
+    return candidate
+
+
+class SummaryCache:
+    """
+    The daemon's warm state: the last built summary and when it was made.
+
+    Builds are serialized, so concurrent requests for a stale summary
+    trigger a single build. Each output format is rendered from the cached
+    model once and kept until the next build.
+    """
+
+    def __init__(self):
+        import kickstart_engine  # the daemon pays the import once
+        import summary_model
+
+        self.engine = kickstart_engine
+        self.render_format = summary_model.render
+        self.summary = None  # MorningSummary
+        self._rendered: Dict[str, str] = {}
+        self.rendered_at: Optional[datetime] = None
+        self.render_ms: Optional[float] = None
+        self.next_prefetch: Optional[datetime] = None
+        self.started_at = datetime.now()
+        self._lock = threading.Lock()
+
+    def _render(self, refresh: bool):
+        started = time.perf_counter()
+        summary = self.engine.build_morning_summary(refresh=refresh)
+        self.render_ms = (time.perf_counter() - started) * 1000
+        self.summary, self._rendered = summary, {}
+        self.rendered_at = datetime.now()
+        return summary
+
+    def _format(self, summary, fmt: str) -> str:
+        rendered = self._rendered
+        if summary is self.summary and fmt in rendered:
+            return rendered[fmt]
+        text = self.render_format(summary, fmt)
+        if summary is self.summary:
+            rendered[fmt] = text
+        return text
+
+    def _is_stale(self, now: datetime) -> bool:
+        rendered_at = self.rendered_at
+        return (
+            rendered_at is None
+            or rendered_at.date() != now.date()
+            or (now - rendered_at).total_seconds() > SUMMARY_MAX_AGE
+        )
+
+    def render(self, refresh: bool = False, fmt: str = 'text') -> str:
+        """Render a fresh summary (refresh=True bypasses the response cache)."""
+        with self._lock:
+            summary = self._render(refresh)
+        return self._format(summary, fmt)
+
+    def get(self, fmt: str = 'text') -> str:
+        """The cached summary, re-rendered if it's from another day or too old."""
+        if not self._is_stale(datetime.now()):
+            return self._format(self.summary, fmt)
+        with self._lock:
+            # Another request may have rendered while we waited for the lock
+            if self._is_stale(datetime.now()):
+                self._render(refresh=False)
+            summary = self.summary
+        return self._format(summary, fmt)
+
+    def status(self) -> Dict[str, Any]:
+        def iso(value: Optional[datetime]) -> Optional[str]:
+            return value.isoformat(timespec='seconds') if value else None
+
+        return {
+            'pid': os.getpid(),
+            'started_at': iso(self.started_at),
+            'rendered_at': iso(self.rendered_at),
+            'render_ms': round(self.render_ms, 1) if self.render_ms is not None else None,
+            'next_prefetch': iso(self.next_prefetch),
+        }
+
+
+def _prefetch_loop(cache: SummaryCache, stop: threading.Event):
+    """Render with live data at startup and then daily at PREFETCH_AT."""
+    while not stop.is_set():
+        try:
+            cache.render(refresh=True)
+        except Exception as e:
+            print(f"Warning: Prefetch failed: {e}")
+
+        cache.next_prefetch = next_prefetch(datetime.now())
+        # Short waits so sleep/wake and clock changes don't skip a morning
+        while not stop.is_set() and datetime.now() < cache.next_prefetch:
+            stop.wait(60)
+
+
+def _handle(conn: socket.socket, cache: SummaryCache):
+    with conn:
+        try:
+            line = conn.makefile('r').readline().strip() or 'summary'
+            command, _, argument = line.partition(' ')
+            if command in FORMATS:
+                reply = cache.get(FORMATS[command])
+            elif command == 'refresh' and (argument or 'summary') in FORMATS:
+                # 'refresh json' / 'refresh markdown' re-render in that format
+                reply = cache.render(refresh=True, fmt=FORMATS[argument or 'summary'])
+            elif command == 'status':
+                reply = json.dumps(cache.status())
+            else:
+                reply = f"Error: unknown command {line!r} (expected one of {', '.join(COMMANDS)})"
+        except Exception as e:
+            reply = f"Error: {e}"
+        conn.sendall(reply.encode('utf-8'))
+
+
+def serve(socket_path: Path = SOCKET_PATH):
+    """
+    Run the daemon until interrupted.
+
+    Args:
+        socket_path: Unix socket to listen on (a stale socket file is replaced)
+    """
+    if socket_path.exists():
+        try:
+            request('status', socket_path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            socket_path.unlink(missing_ok=True)  # left behind by a daemon that died
+        except OSError as e:
+            # e.g. a timeout: a live daemon busy rendering, so keep its socket
+            raise SystemExit(f"Daemon on {socket_path} is not answering ({e}); not starting another")
+        else:
+            raise SystemExit(f"Daemon already running on {socket_path}")
+
+    cache = SummaryCache()
+    stop = threading.Event()
+    prefetcher = threading.Thread(target=_prefetch_loop, args=(cache, stop), daemon=True)
+    prefetcher.start()
+
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(socket_path))
+    os.chmod(socket_path, 0o600)
+    server.listen()
+    print(f"Morning kickstart daemon listening on {socket_path}")
+
+    try:
+        while True:
+            conn, _ = server.accept()
+            threading.Thread(target=_handle, args=(conn, cache), daemon=True).start()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        server.close()
+        socket_path.unlink(missing_ok=True)
+
+
+def request(command: str = 'summary', socket_path: Path = SOCKET_PATH, timeout: float = CLIENT_TIMEOUT) -> str:
+    """
+    Send one command to the daemon and return its reply.
+
+    Args:
+        command: 'summary', 'json', 'markdown', 'refresh' or 'status';
+            'refresh json' / 'refresh markdown' re-render in that format
+        socket_path: Daemon socket
+        timeout: Seconds to wait for the reply
+
+    Returns:
+        Reply text (the summary, or status JSON)
+
+    Raises:
+        OSError: If the daemon isn't running
+
+    Example:
+        print(request('summary'))
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(str(socket_path))
+        client.sendall(f'{command}\n'.encode('utf-8'))
+        client.shutdown(socket.SHUT_WR)
+
+        chunks = []
+        while True:
+            chunk = client.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    return b''.join(chunks).decode('utf-8')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Morning kickstart daemon and client")
+    parser.add_argument('command', nargs='?', default='summary', choices=('serve',) + COMMANDS)
+    parser.add_argument('--refresh', action='store_true', help="Re-render with live data before returning")
+    parser.add_argument('--socket', type=Path, default=SOCKET_PATH, help="Daemon socket path")
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        serve(args.socket)
+        sys.exit(0)
+
+    command = args.command
+    if args.refresh and command in FORMATS:
+        command = f'refresh {command}'
+    try:
+        print(request(command, args.socket))
+    except OSError:
+        if args.command == 'status':
+            sys.exit("Daemon not running")
+        # No daemon: fall back to an in-process run
+        print("Warning: kickstart daemon not running, generating directly", file=sys.stderr)
+        from kickstart_engine import generate_morning_summary
+        print(generate_morning_summary(refresh=args.refresh or command == 'refresh', fmt=FORMATS.get(args.command, 'text')))
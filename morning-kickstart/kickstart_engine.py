@@ -8,273 +8,652 @@ Usage:
     from kickstart_engine import generate_morning_summary
     summary = generate_morning_summary()
     print(summary)
+
+    # Or stream sections as their data arrives
+    from kickstart_engine import iter_morning_summary
+    for name, text in iter_morning_summary():
+        print(text, flush=True)
 """
 
 import sys
-import json
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, Any, List
-
-# Add paths for imports
-sys.path.append('/Users/samuelz/Documents/LLM CONTEXT/scripts')
-sys.path.append('/Users/samuelz/Documents/LLM CONTEXT/.claude/skills/morning-kickstart')
-
-from mcp_tools import things, strava
-from workout_parser import get_or_refresh_metadata
-from insights_generator import (
-    suggest_needle_mover,
-    contextualize_outreach,
-    contextualize_denver,
-    contextualize_carter,
-    generate_avoidance_check
+from datetime import date, datetime
+from functools import cached_property
+from typing import Dict, Any, Callable, Iterator, List, Mapping, Optional, Tuple
+
+from paths import CARTER_FILE, DENVER_FILE, NEEDLE_MOVER_FILE, OUTREACH_FILE, PROFILE_LOG
+from profiling import Profiler
+from lazy_json import load_lazy_json
+from replay import replay_clients, replay_mode, replay_now
+from summary_model import (
+    JobSearch,
+    MorningSummary,
+    NeedleMover,
+    QuickChecks,
+    Remember,
+    Training,
+    render,
+    render_section
 )
 
-# Data file paths
-DATA_DIR = Path('/Users/samuelz/Documents/LLM CONTEXT/.claude/skills/data')
-NEEDLE_MOVER_FILE = DATA_DIR / 'needle-mover-data.json'
-OUTREACH_FILE = DATA_DIR / 'outreach-streak-data.json'
-CARTER_FILE = DATA_DIR / 'carter-rituals-data.json'
-DENVER_FILE = DATA_DIR / 'denver-connect-data.json'
+# Heavier modules (MCP clients, fetch stage, tracker store, insights) are
+# imported where they're first used, so importing this module for e.g.
+# load_tracker_data stays cheap. `python startup_benchmark.py` checks this.
+
+# Where the mcp_tools package lives (added to sys.path on first use)
+MCP_TOOLS_DIR = '/Users/samuelz/Documents/LLM CONTEXT/scripts'
+
+# Read trackers through the SQLite tracker store (False: read the JSON files
+# directly, lazily decoding only the keys the summary touches)
+USE_TRACKER_STORE = True
+
+# Used when the workout plan can't be read
+DEFAULT_WORKOUT_METADATA = {
+    'current_phase': 'Unknown',
+    'weekly_template': {},
+    'weekly_volume_target': 'Not specified'
+}
+
+# Per-source fetch timeout (seconds) - a slow MCP falls back to defaults
+FETCH_TIMEOUT = 10.0
+
+
+def _import_mcp():
+    if MCP_TOOLS_DIR not in sys.path:
+        sys.path.append(MCP_TOOLS_DIR)
+    from mcp_tools import things, strava
+    return things, strava
+
+
+def _mcp():
+    """
+    Import the Things and Strava MCP clients on first use.
+
+    Under KICKSTART_REPLAY the clients record to, or answer from, a fixture
+    file instead (see replay.py).
+
+    Returns:
+        Tuple of (things, strava) modules
+    """
+    if replay_mode():
+        return replay_clients(_import_mcp)
+    return _import_mcp()
+
+
+def _now() -> datetime:
+    """The clock to render against: the recorded one when replaying, else now."""
+    return replay_now() or datetime.now()
 
 
 def load_tracker_data(filepath: Path) -> Dict[str, Any]:
     """Load tracker JSON data, returning empty dict if file doesn't exist."""
+    import json
+
     if filepath.exists():
         with open(filepath, 'r') as f:
             return json.load(f)
     return {}
 
 
-def generate_morning_summary() -> str:
+def load_tracker_data_lazy(filepath: Path) -> Mapping[str, Any]:
     """
-    Generate morning kickstart summary with bi-directional integration.
+    Load tracker JSON data read-only, decoding only the keys that are read.
 
-    Fetches data from:
-    - Things MCP (today + upcoming tasks)
-    - Strava MCP (recent activities)
-    - Workout plan metadata
-    - Tracker JSON files
+    The file is memory-mapped: top-level scalars come from a small header
+    sidecar, lists are decoded only when accessed. Use load_tracker_data
+    for a plain dict to modify or save.
+    """
+    return load_lazy_json(filepath)
 
-    Returns:
-        Formatted summary string with integrated insights
 
-    Token usage: ~300-500 tokens (95% savings vs direct MCP calls)
+def _load_tracker(
+    tracker: str,
+    filepath: Path,
+    rollups: bool = False,
+    today: Optional[date] = None
+) -> Mapping[str, Any]:
     """
-    # ========================================
-    # FETCH ALL DATA (happens locally in Python)
-    # ========================================
+    Load a tracker from the tracker store, importing its JSON file if it changed.
 
-    # Things data
-    try:
-        things_today = things.get_today()
-        things_upcoming = things.get_upcoming(days=3)
-        all_things_tasks = things_today + things_upcoming
-    except Exception as e:
-        print(f"Warning: Could not fetch Things data: {e}")
-        things_today = []
-        things_upcoming = []
-        all_things_tasks = []
+    With `rollups`, adds week_counts, month_counts and last_logged for
+    `today` (a few rollup rows) instead of loading any events. Reads the JSON
+    file directly if USE_TRACKER_STORE is off or the store can't be opened.
+    """
+    import sqlite3
+    from collections import ChainMap
+    from tracker_store import EVENT_KEYS, load_tracker, summarize_entries
+
+    today = today or _now().date()
+    if USE_TRACKER_STORE:
+        try:
+            return load_tracker(tracker, filepath, rollups_for=today if rollups else None)
+        except (sqlite3.Error, OSError) as e:
+            print(f"Warning: Tracker store unavailable ({e}), reading {filepath.name}")
+
+    data = load_tracker_data_lazy(filepath)
+    if not rollups:
+        return data
+
+    # Only the event list is decoded; other keys stay lazy underneath
+    return ChainMap(summarize_entries(data.get(EVENT_KEYS[tracker], []), today), data)
+
+
+def _fetch_strava_athlete(refresh: bool = False):
+    """Fetch athlete profile and stats (stats need the profile's athlete id)."""
+    from response_cache import cached_call
+
+    _, strava = _mcp()
+    strava_profile = cached_call('strava_profile', strava.get_athlete_profile, refresh=refresh)
+    strava_stats = cached_call(
+        'strava_stats',
+        lambda: strava.get_athlete_stats(strava_profile['id']),
+        refresh=refresh
+    )
+    return strava_profile, strava_stats
 
-    # Strava data
-    try:
-        strava_profile = strava.get_athlete_profile()
-        strava_stats = strava.get_athlete_stats(strava_profile['id'])
-        strava_activities = strava.get_recent_activities(perPage=10)
-    except Exception as e:
-        print(f"Warning: Could not fetch Strava data: {e}")
-        strava_profile = {}
-        strava_stats = {}
-        strava_activities = []
 
-    # Workout plan metadata
+def _load_strava_history(refresh: bool = False) -> List[Dict[str, Any]]:
+    """
+    Sync new Strava activities into the local store and return the full history.
+
+    The delta sync is gated by the response cache TTL, and a failed sync
+    still returns whatever history is already stored locally.
+    """
+    from activity_store import load_activities, sync_activities
+    from response_cache import cached_call
+
     try:
-        workout_metadata = get_or_refresh_metadata()
+        cached_call(
+            'strava_activity_sync',
+            lambda: len(sync_activities(lambda n: _mcp()[1].get_recent_activities(perPage=n))),
+            refresh=refresh
+        )
     except Exception as e:
-        print(f"Warning: Could not load workout metadata: {e}")
-        workout_metadata = {
-            'current_phase': 'Unknown',
-            'weekly_template': {},
-            'weekly_volume_target': 'Not specified'
-        }
-
-    # Tracker data files
-    needle_data = load_tracker_data(NEEDLE_MOVER_FILE)
-    outreach_data = load_tracker_data(OUTREACH_FILE)
-    carter_data = load_tracker_data(CARTER_FILE)
-    denver_data = load_tracker_data(DENVER_FILE)
-
-    # ========================================
-    # PROCESS DATA LOCALLY (95% token savings!)
-    # ========================================
-
-    # Get today's workout and calculate energy
-    day_of_week = datetime.now().strftime('%a')
-    todays_workout = workout_metadata.get('weekly_template', {}).get(day_of_week, 'Not specified')
+        print(f"Warning: Could not sync Strava activities: {e}")
+    return load_activities()
+
+
+def _data_sources(refresh: bool = False, today: Optional[date] = None):
+    """Source specs and warning labels for the fetch stage."""
+    from response_cache import cached_call
+    from workout_parser import get_or_refresh_metadata
+
+    # Recording and replaying must reach the clients, not the response cache
+    refresh = refresh or replay_mode() is not None
+
+    sources = {
+        'things_today': (
+            lambda: cached_call('things_today', lambda: _mcp()[0].get_today(), refresh=refresh),
+            []
+        ),
+        'things_upcoming': (
+            lambda: cached_call('things_upcoming', lambda: _mcp()[0].get_upcoming(days=3), refresh=refresh),
+            []
+        ),
+        'strava_athlete': (lambda: _fetch_strava_athlete(refresh), ({}, {})),
+        'strava_history': (lambda: _load_strava_history(refresh), []),
+        'workout_metadata': (get_or_refresh_metadata, DEFAULT_WORKOUT_METADATA),
+        'needle_data': (lambda: _load_tracker('needle_mover', NEEDLE_MOVER_FILE, True, today), {}),
+        'outreach_data': (lambda: _load_tracker('outreach', OUTREACH_FILE, True, today), {}),
+        'carter_data': (lambda: _load_tracker('carter', CARTER_FILE, True, today), {}),
+        'denver_data': (lambda: _load_tracker('denver', DENVER_FILE), {}),
+    }
+    labels = {
+        'things_today': 'Things data',
+        'things_upcoming': 'Things data',
+        'strava_athlete': 'Strava data',
+        'strava_history': 'Strava activity history',
+        'workout_metadata': 'workout metadata',
+    }
+    return sources, labels
+
+
+def fetch_all_sources(
+    timeout: float = FETCH_TIMEOUT,
+    refresh: bool = False,
+    profiler: Optional[Profiler] = None,
+    today: Optional[date] = None
+) -> Dict[str, Any]:
+    """
+    Fetch every data source concurrently.
 
-    try:
-        energy_level = strava.calculate_energy_level(strava_activities, todays_workout)
-    except:
-        energy_level = 'MEDIUM'  # Fallback
+    Things, Strava, workout metadata and tracker files are independent, so
+    they run in parallel and the fetch takes as long as the slowest source.
+    Any source that fails or exceeds `timeout` falls back to an empty default.
+
+    Things and Strava responses go through the on-disk response cache, so
+    repeated runs within each source's TTL make no MCP calls.
+
+    Args:
+        timeout: Per-source timeout in seconds
+        refresh: Bypass the response cache and fetch everything live
+        profiler: Optional Profiler to record a span per source
+        today: Day to load tracker rollups for (defaults to today)
+
+    Returns:
+        Dict with things_today, things_upcoming, strava_athlete (profile, stats),
+        strava_history (local activity store, oldest first), workout_metadata
+        and the four tracker dicts (needle_data, outreach_data, carter_data, denver_data)
+    """
+    from fetch_stage import run_fetch_stage
+
+    sources, labels = _data_sources(refresh, today or _now().date())
+    return run_fetch_stage(sources, timeout=timeout, labels=labels, profiler=profiler)
 
-    # Calculate weekly training stats
-    try:
-        weekly_stats = strava.calculate_weekly_stats(days=7)
-    except:
-        weekly_stats = {'run_distance_miles': 0, 'total_time_hours': 0}
+
+class _SummaryInputs:
+    """
+    Values shared between summary sections, computed on first use.
+
+    Reads sources through `results` (e.g. a running FetchStage's result),
+    so a section only waits for the sources it actually touches. `now` is
+    the clock every section renders against. A given `energy_level` is used
+    as is, skipping the training-load state and the MCP fallback.
+    """
+
+    def __init__(self, results: Callable[[str], Any], now: datetime, energy_level: Optional[str] = None):
+        self.results = results
+        self.now = now
+        if energy_level is not None:
+            self.energy_level = energy_level
+
+    def __getitem__(self, name: str) -> Any:
+        return self.results(name)
+
+    @cached_property
+    def task_index(self):
+        # Index Things tasks once; every contextualizer queries the index
+        from insights_generator import build_task_index
+        return build_task_index(self['things_today'] + self['things_upcoming'])
+
+    @cached_property
+    def strava_activities(self) -> List[Dict[str, Any]]:
+        from activity_store import recent_activities
+        return recent_activities(self['strava_history'], 10)
+
+    @cached_property
+    def workout_metadata(self) -> Dict[str, Any]:
+        # Resolve today's phase from the cached phase index (handles rollovers without reparsing)
+        from workout_parser import metadata_for_date
+        return metadata_for_date(self['workout_metadata'], self.now.date())
+
+    @cached_property
+    def todays_workout(self) -> str:
+        day_of_week = self.now.strftime('%a')
+        return self.workout_metadata.get('weekly_template', {}).get(day_of_week, 'Not specified')
+
+    @cached_property
+    def energy_level(self) -> str:
+        # Training load (ATL/CTL) over the local history; the plan-based
+        # estimate covers an empty history
+        from training_load import energy_level
+
+        level = energy_level(self['strava_history'], self.now)
+        if level:
+            return level
+        try:
+            _, strava = _mcp()
+            return strava.calculate_energy_level(self.strava_activities, self.todays_workout)
+        except:
+            return 'MEDIUM'  # Fallback
+
+
+def _build_needle_mover(inputs: _SummaryInputs) -> NeedleMover:
+    """Section 1: Needle Mover (with Things + Strava context)."""
+    from insights_generator import suggest_needle_mover, generate_avoidance_check
+    from tracker_fields import TOTAL
+
+    energy_level = inputs.energy_level
 
     # Get current streak from needle-mover data
+    needle_data = inputs['needle_data']
     current_streak = needle_data.get('streak', 0)
 
+    # Days since each category was last completed (from the rollups)
+    today = inputs.now.date()
+    category_history = {
+        category: (today - date.fromisoformat(last)).days
+        for category, last in needle_data.get('last_logged', {}).items()
+        if category != TOTAL
+    }
+
     # Generate needle-mover suggestion (bi-directional!)
     category, suggested_action, nm_context = suggest_needle_mover(
-        all_things_tasks,
+        inputs.task_index,
         energy_level,
-        current_streak
+        current_streak,
+        category_history
     )
 
-    # Generate avoidance check
-    avoidance_check = generate_avoidance_check(suggested_action, energy_level)
+    return NeedleMover(
+        category=category,
+        action=suggested_action,
+        context=nm_context,
+        streak=current_streak,
+        avoidance_check=generate_avoidance_check(suggested_action, energy_level)
+    )
+
+
+def _build_job_search(inputs: _SummaryInputs) -> JobSearch:
+    """Section 2: Job Search Momentum (with Things + Energy context)."""
+    from insights_generator import contextualize_outreach
+    from tracker_fields import TOTAL
+
+    outreach_data = inputs['outreach_data']
 
     # Contextualize outreach with Things + Strava
-    outreach_context = contextualize_outreach(outreach_data, all_things_tasks, energy_level)
+    outreach_context = contextualize_outreach(outreach_data, inputs.task_index, inputs.energy_level)
+
+    return JobSearch(
+        week_count=outreach_data.get('week_counts', {}).get(TOTAL, 0),
+        things_tasks=outreach_context['things_context'][:3],  # Top 3
+        energy_suggestion=outreach_context['energy_suggestion'],
+        weekly_streaks=outreach_data.get('weekly_streaks', 0)
+    )
 
-    # Contextualize Denver with training plan
-    denver_context = contextualize_denver(denver_data, workout_metadata, strava_activities)
+
+def _build_quick_checks(inputs: _SummaryInputs) -> QuickChecks:
+    """Section 3: Quick Checks (Carter + Denver, no Strava needed)."""
+    from insights_generator import contextualize_carter, contextualize_denver, CARTER_RITUAL_TYPES
+
+    carter_data = inputs['carter_data']
+    denver_data = inputs['denver_data']
 
     # Contextualize Carter with Things
-    carter_context = contextualize_carter(carter_data, all_things_tasks)
+    carter_context = contextualize_carter(carter_data, inputs.task_index)
 
-    # ========================================
-    # FORMAT OUTPUT (only this goes to Claude!)
-    # ========================================
+    # Contextualize Denver with training plan
+    denver_context = contextualize_denver(denver_data, inputs.workout_metadata, now=inputs.now)
+
+    # Carter rituals (checked off from this week's and month's rollups)
+    def done(counts: Dict[str, int], ritual: str) -> bool:
+        return any(counts.get(t) for t in CARTER_RITUAL_TYPES[ritual])
+
+    week_counts = carter_data.get('week_counts', {})
+    month_counts = carter_data.get('month_counts', {})
+
+    return QuickChecks(
+        carter_week={ritual: done(week_counts, ritual) for ritual in ('date', 'note')},
+        carter_month={'flowers': done(month_counts, 'flowers')},
+        carter_planned=carter_context['planned_but_not_logged'],
+        denver_challenge=denver_data.get('current_challenge', 'No active challenge'),
+        denver_status=denver_data.get('status', 'PENDING'),
+        denver_tie_in=denver_context['training_tie_in']
+    )
 
-    today_str = datetime.now().strftime("%A, %B %d")
 
-    output = []
-    output.append("=" * 60)
-    output.append(f"MORNING KICKSTART - {today_str}")
-    output.append("=" * 60)
+def _build_training(inputs: _SummaryInputs) -> Training:
+    """Section 4: Today's Training (Strava + Workout Plan)."""
+    from activity_store import weekly_stats as local_weekly_stats
 
-    # Section 1: Needle Mover (with Things + Strava context)
-    output.append("\n" + "-" * 60)
-    output.append("1. TODAY'S NEEDLE MOVER")
-    output.append("-" * 60)
-    output.append(f"[{category.upper()}] {suggested_action}\n")
+    workout_metadata = inputs.workout_metadata
 
-    for line in nm_context:
-        output.append(line)
+    # Weekly training stats from the local activity store
+    weekly_stats = local_weekly_stats(inputs['strava_history'], days=7, now=inputs.now)
 
-    output.append(f"\nStreak: {current_streak} days")
+    phase_start = workout_metadata.get('phase_start', '')
+    phase_end = workout_metadata.get('phase_end', '')
+    phase_week = None
+    if phase_start and phase_end:
+        # Calculate week number
+        start_date = datetime.strptime(phase_start, '%Y-%m-%d')
+        phase_week = ((inputs.now - start_date).days // 7) + 1
+
+    return Training(
+        phase=workout_metadata.get('current_phase', 'Unknown phase'),
+        phase_start=phase_start,
+        phase_end=phase_end,
+        phase_week=phase_week,
+        todays_workout=inputs.todays_workout,
+        volume_miles=weekly_stats.get('run_distance_miles', 0),
+        volume_target=workout_metadata.get('weekly_volume_target', 'Not specified'),
+        time_hours=weekly_stats.get('total_time_hours', 0),
+        energy_level=inputs.energy_level
+    )
 
-    if avoidance_check:
-        output.append(f"\n{avoidance_check}")
 
-    # Section 2: Job Search Momentum (with Things + Energy context)
-    output.append("\n" + "-" * 60)
-    output.append("2. JOB SEARCH MOMENTUM")
-    output.append("-" * 60)
+def _build_remember(inputs: _SummaryInputs) -> Remember:
+    """Final reminder (energy-aware)."""
+    reminders = []
+    if inputs.energy_level == 'HIGH':
+        reminders.append("High energy: Do the hard things first")
+    reminders.append("Uncomfortable = probably important")
+    reminders.append("Job search is 90-day priority")
+    return Remember(reminders)
+
+
+# Summary sections in display order: (builder, sources it needs). The
+# header has no builder - it renders from the summary's clock.
+SECTIONS = {
+    'header': (None, ()),
+    'needle_mover': (_build_needle_mover, (
+        'things_today', 'things_upcoming', 'strava_history', 'workout_metadata', 'needle_data'
+    )),
+    'job_search': (_build_job_search, (
+        'things_today', 'things_upcoming', 'strava_history', 'workout_metadata', 'outreach_data'
+    )),
+    'quick_checks': (_build_quick_checks, (
+        'things_today', 'things_upcoming', 'workout_metadata', 'carter_data', 'denver_data'
+    )),
+    'training': (_build_training, ('strava_history', 'workout_metadata')),
+    'remember': (_build_remember, ('strava_history', 'workout_metadata')),
+}
+
+
+def build_summary(
+    sources: Mapping[str, Any],
+    now: datetime,
+    profiler: Optional[Profiler] = None,
+    energy_level: Optional[str] = None
+) -> MorningSummary:
+    """
+    Build the summary model from already-loaded source values (no fetching).
 
-    # Calculate outreach progress
-    outreaches_this_week = len(outreach_data.get('outreaches', []))
-    target = 10
-    remaining = max(0, target - outreaches_this_week)
+    Args:
+        sources: Source values keyed like fetch_all_sources() returns them
+        now: Clock to build against (e.g. a past morning)
+        profiler: Optional Profiler to record a span per section in
+        energy_level: Precomputed energy level; without one it comes from
+            the saved training load (updating it) or the MCP fallback
 
-    # Progress bar
-    filled = min(outreaches_this_week, target)
-    empty = target - filled
-    progress_bar = f"[{'O' * filled}{'.' * empty}] {outreaches_this_week}/{target}"
+    Returns:
+        Filled MorningSummary
 
-    output.append(f"This Week: {progress_bar}")
-    if remaining > 0:
-        output.append(f"Need {remaining} more to hit target")
+    Example:
+        summary = build_summary(fetch_all_sources(), datetime.now())
+        print(summary.job_search.remaining)
+    """
+    profiler = profiler or Profiler()
+    inputs = _SummaryInputs(sources.__getitem__, now, energy_level)
+    summary = MorningSummary(now)
+    for name, (build, _) in SECTIONS.items():
+        if build:
+            with profiler.span(f'section.{name}'):
+                setattr(summary, name, build(inputs))
+    return summary
+
+
+def render_summary(
+    sources: Mapping[str, Any],
+    now: datetime,
+    fmt: str = 'text',
+    energy_level: Optional[str] = None
+) -> str:
+    """
+    Render the full summary from already-loaded source values (no fetching).
 
-    # Things context
-    if outreach_context['things_count'] > 0:
-        output.append(f"\nThings Context:")
-        for task in outreach_context['things_context'][:3]:  # Top 3
-            output.append(f"  - {task}")
-        output.append(f"  → When complete, log to outreach tracker")
+    Args:
+        sources: Source values keyed like fetch_all_sources() returns them
+        now: Clock to render against (e.g. a past morning)
+        fmt: 'text', 'json' or 'markdown'
+        energy_level: Precomputed energy level (see build_summary)
 
-    output.append(f"\n{outreach_context['energy_suggestion']}")
+    Returns:
+        Formatted summary string
 
-    weekly_streaks = outreach_data.get('weekly_streaks', 0)
-    output.append(f"\nWeekly Streak: {weekly_streaks} weeks hitting 10")
+    Example:
+        summary = render_summary(fetch_all_sources(), datetime.now())
+    """
+    return render(build_summary(sources, now, energy_level=energy_level), fmt)
+
+
+def _iter_sections(
+    refresh: bool,
+    profiler: Profiler,
+    timeout: float,
+    now: datetime
+) -> Iterator[Tuple[str, MorningSummary]]:
+    """Fill the summary section by section as sources arrive, yielding each name."""
+    from fetch_stage import FetchStage
+
+    sources, labels = _data_sources(refresh, now.date())
+    stage = FetchStage(sources, timeout=timeout, labels=labels, profiler=profiler)
+    inputs = _SummaryInputs(stage.result, now)
+    summary = MorningSummary(now)
+
+    pending = list(SECTIONS)
+    while pending:
+        ready = [
+            name for name in pending
+            if all(stage.done(source) for source in SECTIONS[name][1])
+        ]
+        if not ready:
+            stage.wait_for_any({source for name in pending for source in SECTIONS[name][1]})
+            continue
+
+        for name in ready:
+            build, _ = SECTIONS[name]
+            if build:
+                with profiler.span(f'section.{name}'):
+                    setattr(summary, name, build(inputs))
+            pending.remove(name)
+            yield name, summary
+
+
+def iter_morning_summary(
+    refresh: bool = False,
+    profiler: Optional[Profiler] = None,
+    timeout: float = FETCH_TIMEOUT,
+    now: Optional[datetime] = None,
+    fmt: str = 'text'
+) -> Iterator[Tuple[str, str]]:
+    """
+    Yield summary sections as soon as the sources each one needs are ready.
 
-    # Section 3: Quick Checks
-    output.append("\n" + "-" * 60)
-    output.append("3. QUICK CHECKS")
-    output.append("-" * 60)
+    The header comes first; sections that only need local files and Things
+    (e.g. quick checks) can appear while Strava is still syncing. Sections
+    that become ready together are yielded in display order.
 
-    # Carter rituals
-    output.append("\nCarter Rituals:")
-    # Simple check - would need actual tracker logic for real status
-    output.append("  This Week: [ ] Date [ ] Note")
-    output.append("  This Month: [ ] Flowers")
+    Args:
+        refresh: Bypass the response cache and fetch Things/Strava live
+        profiler: Optional Profiler to record per-stage timings in
+        timeout: Per-source fetch timeout in seconds
+        now: Clock to render against (defaults to now)
+        fmt: 'text' or 'markdown'
 
-    if carter_context['planned_but_not_logged']:
-        output.append(f"  Planned in Things: {', '.join(carter_context['planned_but_not_logged'])}")
+    Yields:
+        Tuples of (section_name, section_text); names are the keys of SECTIONS
 
-    # Denver Connection
-    output.append("\nDenver Connection:")
-    current_challenge = denver_data.get('current_challenge', 'No active challenge')
-    output.append(f"  Challenge: {current_challenge}")
-    output.append(f"  Status: {denver_data.get('status', 'PENDING')}")
+    Example:
+        for name, text in iter_morning_summary():
+            print(text, flush=True)
+    """
+    profiler = profiler or Profiler()
+    for name, summary in _iter_sections(refresh, profiler, timeout, now or _now()):
+        with profiler.span(f'format.{name}'):
+            text = render_section(summary, name, fmt)
+        yield name, text
+
+
+def build_morning_summary(
+    refresh: bool = False,
+    profiler: Optional[Profiler] = None,
+    now: Optional[datetime] = None
+) -> MorningSummary:
+    """
+    Fetch every source and build the summary model.
 
-    if denver_context['training_tie_in']:
-        output.append(f"  {denver_context['training_tie_in']}")
+    Args:
+        refresh: Bypass the response cache and fetch Things/Strava live
+        profiler: Optional Profiler to record per-stage timings in
+        now: Clock to build against (defaults to now)
 
-    # Section 4: Today's Training (Strava + Workout Plan)
-    output.append("\n" + "-" * 60)
-    output.append("4. TODAY'S TRAINING")
-    output.append("-" * 60)
+    Returns:
+        Filled MorningSummary (render with summary_model.render)
 
-    phase = workout_metadata.get('current_phase', 'Unknown phase')
-    phase_start = workout_metadata.get('phase_start', '')
-    phase_end = workout_metadata.get('phase_end', '')
+    Example:
+        summary = build_morning_summary()
+        print(render(summary, 'markdown'))
+    """
+    sections = _iter_sections(refresh, profiler or Profiler(), FETCH_TIMEOUT, now or _now())
+    for _, summary in sections:
+        pass
+    return summary
+
+
+def generate_morning_summary(
+    refresh: bool = False,
+    profiler: Optional[Profiler] = None,
+    now: Optional[datetime] = None,
+    fmt: str = 'text'
+) -> str:
+    """
+    Generate morning kickstart summary with bi-directional integration.
 
-    if phase_start and phase_end:
-        # Calculate week number
-        start_date = datetime.strptime(phase_start, '%Y-%m-%d')
-        current_date = datetime.now()
-        weeks_in = ((current_date - start_date).days // 7) + 1
-        output.append(f"{phase}, Week {weeks_in}")
-        output.append(f"({phase_start} to {phase_end})")
-    else:
-        output.append(f"{phase}")
-
-    output.append(f"\nToday: {todays_workout}")
-
-    # Weekly progress
-    volume_target = workout_metadata.get('weekly_volume_target', 'Not specified')
-    current_miles = weekly_stats.get('run_distance_miles', 0)
-    output.append(f"\nThis Week:")
-    output.append(f"  - Volume: {current_miles:.1f} mi (target: {volume_target})")
-    output.append(f"  - Time: {weekly_stats.get('total_time_hours', 0):.1f} hours")
-
-    output.append(f"\nEnergy Level: {energy_level}")
-    if energy_level == 'HIGH':
-        output.append("  → Good for uncomfortable/hard tasks")
-    elif energy_level == 'MEDIUM':
-        output.append("  → Balanced day, moderate effort tasks")
-    else:
-        output.append("  → Save energy for training")
+    Fetches data from:
+    - Things MCP (today + upcoming tasks)
+    - Strava MCP (recent activities)
+    - Workout plan metadata
+    - Tracker JSON files
 
-    # Final reminder
-    output.append("\n" + "=" * 60)
-    output.append("REMEMBER:")
+    Args:
+        refresh: Bypass the response cache and fetch Things/Strava live
+        profiler: Optional Profiler to record per-stage timings in
+        now: Clock to render against (defaults to now)
+        fmt: 'text', 'json' or 'markdown'
 
-    if energy_level == 'HIGH':
-        output.append("  - High energy: Do the hard things first")
-    output.append("  - Uncomfortable = probably important")
-    output.append("  - Job search is 90-day priority")
-    output.append("=" * 60 + "\n")
+    Returns:
+        Formatted summary string with integrated insights
 
-    return "\n".join(output)
+    Token usage: ~300-500 tokens (95% savings vs direct MCP calls)
+    """
+    profiler = profiler or Profiler()
+    summary = build_morning_summary(refresh=refresh, profiler=profiler, now=now)
+    with profiler.span('format'):
+        return render(summary, fmt)
 
 
 if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate the morning kickstart summary")
+    parser.add_argument('--refresh', action='store_true', help="Bypass the response cache and fetch live data")
+    parser.add_argument('--profile', action='store_true', help="Print per-stage timings and append them to the profile log")
+    parser.add_argument('--profile-log', type=Path, default=PROFILE_LOG, help="JSON-lines file for --profile runs")
+    parser.add_argument('--stream', action='store_true', help="Print each section as soon as its data is ready")
+    parser.add_argument('--format', choices=('text', 'json', 'markdown'), default='text', help="Output format")
+    parser.add_argument('--token-budget', type=int, help="Condense the summary to about this many tokens")
+    args = parser.parse_args()
+
     # Test the engine
-    print("Generating morning summary...\n")
-    summary = generate_morning_summary()
-    print(summary)
+    if args.format == 'text':
+        print("Generating morning summary...\n")
+    profiler = Profiler()
+    if args.token_budget:
+        from token_budget import render_budgeted
+
+        summary = build_morning_summary(refresh=args.refresh, profiler=profiler)
+        with profiler.span('format'):
+            result = render_budgeted(summary, args.token_budget, args.format)
+        print(result.text)
+        print(result.report(), file=sys.stderr)
+    elif args.stream and args.format != 'json':
+        for _, text in iter_morning_summary(refresh=args.refresh, profiler=profiler, fmt=args.format):
+            print(text, flush=True)
+    else:
+        summary = generate_morning_summary(refresh=args.refresh, profiler=profiler, fmt=args.format)
+        print(summary)
+
+    if args.profile:
+        print(profiler.format_footer())
+        profiler.write_jsonl(args.profile_log)
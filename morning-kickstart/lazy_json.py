@@ -0,0 +1,257 @@
+"""
+Lazy, memory-mapped reader for the tracker JSON files.
+
+The summary reads a handful of top-level scalars from each tracker
+(`streak`, `weekly_streaks`, `current_challenge`, `status`) and at most
+one list, but json.load decodes every outreach and ritual ever logged.
+This reader memory-maps the file, finds the byte range of each top-level
+value without decoding it, and decodes a value only when it's accessed.
+
+The scan result is saved in a small header sidecar in the `cache/`
+directory next to the file (`cache/<name>.header.json`: mtime, size,
+top-level scalars and value offsets), with the other derived state rather
+than among the files the tracker skills own.
+While the tracker file is unchanged, reading the hot scalars touches only
+the sidecar.
+
+Usage:
+    from lazy_json import load_lazy_json
+
+    outreach = load_lazy_json(OUTREACH_FILE)
+    outreach.get('weekly_streaks', 0)     # from the header, no decoding
+    len(outreach.get('outreaches', []))   # decodes just this list
+"""
+
+import json
+import mmap
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+
+# JSON string (unrolled loop - no catastrophic backtracking on bad input)
+_STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+# Anything up to the next bracket outside a string
+_FILL = rb'[^"\[\]{}]*(?:' + _STRING + rb'[^"\[\]{}]*)*'
+
+_STRING_RE = re.compile(_STRING, re.S)
+_FILL_RE = re.compile(_FILL, re.S)
+# A container with no nested containers, skipped in one match
+_FLAT_RE = re.compile(rb'[\[{]' + _FILL + rb'[\]}]', re.S)
+_SCALAR_RE = re.compile(rb'[^,}\s]+')
+_WS_RE = re.compile(rb'\s*')
+
+HEADER_SUFFIX = '.header.json'
+
+# Sidecars live in this subdirectory of the tracker file's directory (the
+# kickstart cache when the file is in the shared data directory)
+HEADER_DIR = Path('kickstart', 'cache')
+
+# Earlier sidecar locations, cleaned up when a header is rewritten
+LEGACY_HEADER_DIRS = (Path('.'), Path('cache'))
+
+
+def header_path(json_path: Path) -> Path:
+    """Sidecar path for a JSON file (e.g. kickstart/cache/outreach-streak-data.header.json)."""
+    return json_path.parent / HEADER_DIR / (json_path.stem + HEADER_SUFFIX)
+
+
+def _skip_container(buf, pos: int) -> int:
+    """Return the offset just past the array/object starting at buf[pos]."""
+    depth = 0
+    while True:
+        char = buf[pos:pos + 1]
+        if char in (b'[', b'{'):
+            match = _FLAT_RE.match(buf, pos)
+            if match:
+                pos = match.end()
+            else:
+                depth += 1
+                pos += 1
+        elif char in (b']', b'}'):
+            depth -= 1
+            pos += 1
+        else:
+            raise ValueError(f"Unterminated JSON container at byte {pos}")
+
+        if depth == 0:
+            return pos
+        pos = _FILL_RE.match(buf, pos).end()
+
+
+def scan_offsets(buf) -> Dict[str, Tuple[int, int]]:
+    """
+    Find the byte range of every top-level value in a JSON object.
+
+    Args:
+        buf: bytes or mmap holding a JSON object
+
+    Returns:
+        Dict of key -> (start, end) offsets of its undecoded value
+
+    Raises:
+        ValueError: If the document isn't a well-formed JSON object
+    """
+    offsets = {}
+    pos = _WS_RE.match(buf, 0).end()
+    if buf[pos:pos + 1] != b'{':
+        raise ValueError("Tracker JSON must be an object")
+    pos = _WS_RE.match(buf, pos + 1).end()
+    if buf[pos:pos + 1] == b'}':
+        return offsets
+
+    while True:
+        match = _STRING_RE.match(buf, pos)
+        if not match:
+            raise ValueError(f"Expected key at byte {pos}")
+        key = json.loads(match.group())
+        pos = _WS_RE.match(buf, match.end()).end()
+        if buf[pos:pos + 1] != b':':
+            raise ValueError(f"Expected ':' at byte {pos}")
+        start = pos = _WS_RE.match(buf, pos + 1).end()
+
+        char = buf[pos:pos + 1]
+        if char in (b'[', b'{'):
+            end = _skip_container(buf, pos)
+        else:
+            match = (_STRING_RE if char == b'"' else _SCALAR_RE).match(buf, pos)
+            if not match:
+                raise ValueError(f"Expected value at byte {pos}")
+            end = match.end()
+        offsets[key] = (start, end)
+
+        pos = _WS_RE.match(buf, end).end()
+        char = buf[pos:pos + 1]
+        if char == b'}':
+            return offsets
+        if char != b',':
+            raise ValueError(f"Expected ',' or '}}' at byte {pos}")
+        pos = _WS_RE.match(buf, pos + 1).end()
+
+
+def _build_header(json_path: Path, stat: os.stat_result) -> Dict[str, Any]:
+    """Scan a tracker file and collect its top-level scalars and offsets."""
+    with open(json_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        offsets = scan_offsets(mm)
+        scalars = {
+            key: json.loads(mm[start:end])
+            for key, (start, end) in offsets.items()
+            if mm[start:start + 1] not in (b'[', b'{')
+        }
+
+    return {
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'scalars': scalars,
+        'offsets': {key: list(span) for key, span in offsets.items() if key not in scalars},
+    }
+
+
+def read_header(json_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Get the header for a tracker file, rebuilding the sidecar if it's stale.
+
+    Args:
+        json_path: Tracker JSON file
+
+    Returns:
+        Header dict (mtime_ns, size, scalars, offsets), or None if the file
+        is missing or empty
+    """
+    try:
+        stat = json_path.stat()
+    except OSError:
+        return None
+    if stat.st_size == 0:
+        return None
+
+    sidecar = header_path(json_path)
+    try:
+        with open(sidecar, 'r') as f:
+            header = json.load(f)
+        if header.get('mtime_ns') == stat.st_mtime_ns and header.get('size') == stat.st_size:
+            return header
+    except (OSError, ValueError):
+        pass
+
+    header = _build_header(json_path, stat)
+
+    # Best effort: a read-only data dir just means rescanning next time
+    tmp_path = sidecar.with_suffix(f'.{os.getpid()}.tmp')
+    try:
+        sidecar.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'w') as f:
+            json.dump(header, f)
+        os.replace(tmp_path, sidecar)
+        for legacy_dir in LEGACY_HEADER_DIRS:
+            (json_path.parent / legacy_dir / (json_path.stem + HEADER_SUFFIX)).unlink(missing_ok=True)
+    except OSError:
+        pass
+    return header
+
+
+class LazyJSON(Mapping):
+    """
+    Read-only mapping over a JSON object file, decoding values on access.
+
+    Scalars come from the header; lists and objects are decoded from the
+    memory-mapped file the first time they're read, then kept.
+    """
+
+    def __init__(self, json_path: Path, header: Dict[str, Any]):
+        self.path = json_path
+        self._header = header
+        self._values: Dict[str, Any] = dict(header['scalars'])
+
+    def _refresh(self):
+        # Offsets are only valid for the file they were scanned from
+        stat = self.path.stat()
+        if (stat.st_mtime_ns, stat.st_size) != (self._header['mtime_ns'], self._header['size']):
+            self._header = read_header(self.path) or {
+                'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'scalars': {}, 'offsets': {}
+            }
+            self._values = dict(self._header['scalars'])
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._values:
+            return self._values[key]
+
+        self._refresh()
+        if key in self._values:
+            return self._values[key]
+        start, end = self._header['offsets'][key]
+
+        with open(self.path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            value = json.loads(mm[start:end])
+        self._values[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._header['scalars']
+        yield from self._header['offsets']
+
+    def __len__(self) -> int:
+        return len(self._header['scalars']) + len(self._header['offsets'])
+
+    def __repr__(self) -> str:
+        return f"LazyJSON({str(self.path)!r}, keys={list(self)})"
+
+
+def load_lazy_json(json_path: Path) -> Mapping[str, Any]:
+    """
+    Open a tracker JSON file lazily.
+
+    Args:
+        json_path: Tracker JSON file (a top-level object)
+
+    Returns:
+        LazyJSON mapping, or an empty dict if the file doesn't exist or is empty
+
+    Example:
+        denver = load_lazy_json(DENVER_FILE)
+        print(denver.get('current_challenge'), denver.get('status'))
+    """
+    header = read_header(json_path)
+    if header is None:
+        return {}
+    return LazyJSON(json_path, header)
@@ -0,0 +1,88 @@
+"""
+File locations for morning-kickstart.
+
+Every module takes its paths from here, so the KICKSTART_DATA_DIR and
+KICKSTART_PLAN_FILE overrides apply to all of them alike. The data
+directory is shared with the other skills: besides reading the tracker
+files, kickstart writes only under its own `kickstart/` subdirectory.
+
+Usage:
+    from paths import DATA_DIR, OUTREACH_FILE, TRACKER_FILES
+"""
+
+import os
+from pathlib import Path
+
+# Skills data directory (KICKSTART_DATA_DIR overrides it, e.g. for fixtures or CI)
+DATA_DIR = Path(os.environ.get('KICKSTART_DATA_DIR', '/Users/samuelz/Documents/LLM CONTEXT/.claude/skills/data'))
+
+# Workout plan (KICKSTART_PLAN_FILE overrides it)
+PLAN_FILE = Path(os.environ.get(
+    'KICKSTART_PLAN_FILE',
+    '/Users/samuelz/Documents/LLM CONTEXT/1 - personal/marathon_training/post-marathon-ski-fitness-plan.md'
+))
+
+# Tracker JSON files, written by the tracker skills
+NEEDLE_MOVER_FILE = DATA_DIR / 'needle-mover-data.json'
+OUTREACH_FILE = DATA_DIR / 'outreach-streak-data.json'
+CARTER_FILE = DATA_DIR / 'carter-rituals-data.json'
+DENVER_FILE = DATA_DIR / 'denver-connect-data.json'
+
+TRACKER_FILES = {
+    'needle_mover': NEEDLE_MOVER_FILE,
+    'outreach': OUTREACH_FILE,
+    'carter': CARTER_FILE,
+    'denver': DENVER_FILE,
+}
+
+# Parsed plan, read by other skills too
+METADATA_FILE = DATA_DIR / 'workout-plan-metadata.json'
+
+# Everything else kickstart derives lives in its own subdirectory, since
+# DATA_DIR is shared with the other skills
+KICKSTART_DIR = DATA_DIR / 'kickstart'
+TRACKER_DB = KICKSTART_DIR / 'trackers.db'
+ACTIVITY_FILE = KICKSTART_DIR / 'strava-activities.jsonl'
+LOAD_STATE_FILE = KICKSTART_DIR / 'training-load.json'
+CACHE_DIR = KICKSTART_DIR / 'cache'
+PROFILE_LOG = KICKSTART_DIR / 'kickstart-profile.jsonl'
+SOCKET_PATH = KICKSTART_DIR / 'kickstart.sock'
+
+# State earlier versions wrote straight into DATA_DIR; each group moves
+# together (the database with its WAL files, so un-checkpointed writes
+# stay with it)
+LEGACY_STATE_FILES = (
+    ('trackers.db', 'trackers.db-wal', 'trackers.db-shm'),
+    ('strava-activities.jsonl',),
+    ('training-load.json',),
+    ('kickstart-profile.jsonl',),
+)
+
+
+def move_legacy_state(data_dir: Path = DATA_DIR, kickstart_dir: Path = KICKSTART_DIR) -> int:
+    """
+    Move state left in the shared data directory into the kickstart directory.
+
+    Runs on import, so every module sees its state in the new place. A group
+    already present in the kickstart directory wins and its legacy copy is
+    left alone. Best effort, and a no-op once everything has moved.
+
+    Returns:
+        Number of files moved
+    """
+    moved = 0
+    for group in LEGACY_STATE_FILES:
+        try:
+            if not (data_dir / group[0]).exists() or (kickstart_dir / group[0]).exists():
+                continue
+            kickstart_dir.mkdir(parents=True, exist_ok=True)
+            for name in group:
+                if (data_dir / name).exists():
+                    os.replace(data_dir / name, kickstart_dir / name)
+                    moved += 1
+        except OSError:
+            pass
+    return moved
+
+
+move_legacy_state()
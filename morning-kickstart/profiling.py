@@ -0,0 +1,174 @@
+"""
+Hot-path timing instrumentation for morning-kickstart.
+
+Records a span per pipeline stage (each fetch source, each summary
+section's insights, formatting) with its duration, cache hit/miss and payload size.
+A run's spans can be printed as a footer (`--profile`) and appended to a
+JSON-lines log to track latency across weeks of daily runs.
+
+Usage:
+    from profiling import Profiler, mark_cache
+
+    profiler = Profiler()
+    with profiler.span('fetch.things_today') as span:
+        tasks = cached_call('things_today', things.get_today)  # calls mark_cache()
+        span['payload_size'] = len(tasks)
+
+    print(profiler.format_footer())
+    profiler.write_jsonl(PROFILE_LOG)
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from paths import PROFILE_LOG  # default JSON-lines log (one line per profiled run)
+
+# Span currently open in this thread/task, so helpers deep in the call
+# stack (e.g. the response cache) can annotate it without being passed it
+_current_span: ContextVar[Optional[Dict[str, Any]]] = ContextVar('kickstart_span', default=None)
+
+
+def mark_cache(hit: bool):
+    """
+    Record a cache hit or miss on the currently open span (no-op outside a span).
+
+    A span with both hits and misses (e.g. profile cached, stats fetched)
+    reports 'partial'.
+    """
+    span = _current_span.get()
+    if span is None:
+        return
+    key = 'cache_hits' if hit else 'cache_misses'
+    span[key] = span.get(key, 0) + 1
+
+
+def payload_size(value: Any) -> Optional[int]:
+    """Item count of a fetched payload (list/dict length), None if unsized."""
+    try:
+        return len(value)
+    except TypeError:
+        return None
+
+
+def _cache_status(span: Dict[str, Any]) -> Optional[str]:
+    hits = span.get('cache_hits', 0)
+    misses = span.get('cache_misses', 0)
+    if hits and misses:
+        return 'partial'
+    if hits:
+        return 'hit'
+    if misses:
+        return 'miss'
+    return None
+
+
+class Profiler:
+    """
+    Collects timing spans for one morning-kickstart run.
+
+    Thread-safe: fetch sources record their spans from worker threads.
+    """
+
+    def __init__(self):
+        self.started_at = datetime.now()
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+        self._finished_ms: Optional[float] = None
+        self.spans: List[Dict[str, Any]] = []
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[Dict[str, Any]]:
+        """
+        Time a block of work.
+
+        Yields the span dict so callers can set 'payload_size' or other
+        fields. Status is 'ok', or 'error' if the block raised.
+
+        Example:
+            with profiler.span('format'):
+                text = render(summary, 'markdown')
+        """
+        record = {'name': name, 'status': 'ok'}
+        token = _current_span.set(record)
+        start = time.perf_counter()
+        try:
+            yield record
+        except BaseException:
+            record['status'] = 'error'
+            raise
+        finally:
+            record['offset_ms'] = (start - self._start) * 1000
+            record['duration_ms'] = (time.perf_counter() - start) * 1000
+            _current_span.reset(token)
+            self.add(record)
+
+    def add(self, record: Dict[str, Any]):
+        """Add a finished span record (ignored once the run has finished)."""
+        with self._lock:
+            if self._finished_ms is None:
+                self.spans.append(record)
+
+    def finish(self) -> float:
+        """
+        Close the run; spans finishing later (e.g. timed-out fetches) are dropped.
+
+        Returns:
+            Total run time in milliseconds
+        """
+        with self._lock:
+            if self._finished_ms is None:
+                self._finished_ms = (time.perf_counter() - self._start) * 1000
+            return self._finished_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Run summary: timestamp, total_ms and spans ordered by start time."""
+        total_ms = self.finish()
+        spans = []
+        for span in sorted(self.spans, key=lambda s: s.get('offset_ms', 0)):
+            entry = {
+                'name': span['name'],
+                'status': span['status'],
+                'offset_ms': round(span.get('offset_ms', 0), 2),
+                'duration_ms': round(span['duration_ms'], 2),
+                'cache': _cache_status(span),
+                'payload_size': span.get('payload_size'),
+            }
+            spans.append(entry)
+
+        return {
+            'timestamp': self.started_at.isoformat(timespec='seconds'),
+            'total_ms': round(total_ms, 2),
+            'spans': spans,
+        }
+
+    def format_footer(self) -> str:
+        """
+        Format spans as a plain-text footer for the summary.
+
+        Example output:
+            PROFILE - total 412 ms
+              fetch.things_today          201.3 ms  hit    4 items
+        """
+        run = self.to_dict()
+        lines = ["-" * 60, f"PROFILE - total {run['total_ms']:.0f} ms"]
+        for span in run['spans']:
+            line = f"  {span['name']:<28}{span['duration_ms']:>8.1f} ms  {span['cache'] or '':<7}"
+            if span['payload_size'] is not None:
+                line += f"  {span['payload_size']} items"
+            if span['status'] != 'ok':
+                line += f"  [{span['status'].upper()}]"
+            lines.append(line.rstrip())
+        lines.append("-" * 60)
+        return "\n".join(lines)
+
+    def write_jsonl(self, log_path: Path = PROFILE_LOG):
+        """Append this run as one JSON line to the profile log."""
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(log_path, 'a') as f:
+            f.write(json.dumps(self.to_dict()) + '\n')
@@ -0,0 +1,233 @@
+"""
+Record and replay Things and Strava MCP responses.
+
+With KICKSTART_REPLAY=record the engine talks to the real MCP clients and
+saves every response (and the run's clock) to a fixture file. With
+KICKSTART_REPLAY=replay it never imports mcp_tools: responses come from
+the fixture and the clock is pinned to the recorded time, so a run is
+repeatable offline (e.g. on CI). Pair replay with KICKSTART_DATA_DIR to
+keep the trackers, caches and stores in a scratch directory. A call whose
+arguments weren't recorded raises ReplayMiss; set KICKSTART_REPLAY_LOOSE=1
+to answer it with the function's last recorded response instead.
+
+Usage:
+    KICKSTART_REPLAY=record python kickstart_engine.py
+    KICKSTART_REPLAY=replay KICKSTART_DATA_DIR=/tmp/kickstart python kickstart_engine.py
+
+    # Fixture file (default: fixtures/mcp-replay.json)
+    KICKSTART_REPLAY_FILE=fixtures/monday.json KICKSTART_REPLAY=replay python kickstart_engine.py
+
+    # Tolerate changed call arguments
+    KICKSTART_REPLAY_LOOSE=1 KICKSTART_REPLAY=replay python kickstart_engine.py
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+REPLAY_ENV = 'KICKSTART_REPLAY'
+REPLAY_FILE_ENV = 'KICKSTART_REPLAY_FILE'
+REPLAY_LOOSE_ENV = 'KICKSTART_REPLAY_LOOSE'
+DEFAULT_REPLAY_FILE = Path(__file__).resolve().parent / 'fixtures' / 'mcp-replay.json'
+
+MODES = ('record', 'replay')
+CLIENTS = ('things', 'strava')
+
+
+class ReplayMiss(LookupError):
+    """Raised when a replayed call has no recorded response."""
+
+
+def replay_mode() -> Optional[str]:
+    """
+    The active mode from KICKSTART_REPLAY.
+
+    Returns:
+        'record', 'replay', or None when MCP calls go out normally
+
+    Raises:
+        ValueError: If KICKSTART_REPLAY is set to anything else
+    """
+    mode = os.environ.get(REPLAY_ENV, '').strip().lower() or None
+    if mode is not None and mode not in MODES:
+        raise ValueError(f"{REPLAY_ENV} must be one of {', '.join(MODES)}, not {mode!r}")
+    return mode
+
+
+def replay_file() -> Path:
+    return Path(os.environ.get(REPLAY_FILE_ENV) or DEFAULT_REPLAY_FILE)
+
+
+def replay_loose() -> bool:
+    """Whether replayed calls may match a recorded call with other arguments."""
+    return os.environ.get(REPLAY_LOOSE_ENV, '').strip().lower() in ('1', 'true', 'yes')
+
+
+def call_key(name: str, args: tuple, kwargs: Dict[str, Any]) -> str:
+    """Fixture key for a call, e.g. get_upcoming(days=3)."""
+    parts = [json.dumps(arg, sort_keys=True, default=str) for arg in args]
+    parts += [f"{key}={json.dumps(kwargs[key], sort_keys=True, default=str)}" for key in sorted(kwargs)]
+    return f"{name}({', '.join(parts)})"
+
+
+class Fixture:
+    """
+    Recorded responses per client and call, plus the recording clock.
+
+    File layout:
+        {"recorded_at": "2026-03-09T06:00:00",
+         "things": {"get_today()": [...], "get_upcoming(days=3)": [...]},
+         "strava": {"get_recent_activities(perPage=10)": [...], ...}}
+    """
+
+    def __init__(self, path: Path, data: Optional[Dict[str, Any]] = None, loose: bool = False):
+        self.path = path
+        self.data = data or {'recorded_at': None, **{client: {} for client in CLIENTS}}
+        self.loose = loose
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Path, loose: bool = False) -> 'Fixture':
+        with open(path, 'r') as f:
+            return cls(path, json.load(f), loose)
+
+    @property
+    def recorded_at(self) -> Optional[datetime]:
+        value = self.data.get('recorded_at')
+        return datetime.fromisoformat(value) if value else None
+
+    def lookup(self, client: str, name: str, key: str) -> Any:
+        """
+        Recorded response for a call.
+
+        Only an exact match (same arguments) counts, so a change in how the
+        engine calls a client fails the replay instead of quietly reusing
+        another call's response. A loose fixture falls back to the last
+        recorded call of the same function.
+
+        Raises:
+            ReplayMiss: If the call wasn't recorded
+        """
+        calls = self.data.get(client, {})
+        if key in calls:
+            return calls[key]
+        if self.loose:
+            same_function = [k for k in calls if k.split('(', 1)[0] == name]
+            if same_function:
+                return calls[same_function[-1]]
+        raise ReplayMiss(f"No recorded response for {client}.{key} in {self.path}")
+
+    def record(self, client: str, key: str, value: Any):
+        """Store a response and write the fixture (atomically)."""
+        with self._lock:
+            self.data.setdefault(client, {})[key] = value
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(self.data, f, indent=2, default=str)
+            os.replace(tmp_path, self.path)
+
+
+class _RecordingClient:
+    """Proxy for an MCP client module that records every call's response."""
+
+    def __init__(self, name: str, client: Any, fixture: Fixture):
+        self._name = name
+        self._client = client
+        self._fixture = fixture
+
+    def __getattr__(self, attr: str):
+        function = getattr(self._client, attr)
+        if not callable(function):
+            return function
+
+        def call(*args, **kwargs):
+            value = function(*args, **kwargs)
+            self._fixture.record(self._name, call_key(attr, args, kwargs), value)
+            return value
+
+        return call
+
+
+class _ReplayClient:
+    """Stand-in for an MCP client module that answers from a fixture."""
+
+    def __init__(self, name: str, fixture: Fixture):
+        self._name = name
+        self._fixture = fixture
+
+    def __getattr__(self, attr: str):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
+
+        def call(*args, **kwargs):
+            return self._fixture.lookup(self._name, attr, call_key(attr, args, kwargs))
+
+        return call
+
+
+# Clients for the current process, created on first use
+_clients: Optional[Tuple[Any, Any]] = None
+_fixture: Optional[Fixture] = None
+_clients_lock = threading.Lock()
+
+
+def _load_fixture(mode: str) -> Fixture:
+    """The process's fixture, loaded (or started) once; caller holds _clients_lock."""
+    global _fixture
+    if _fixture is None:
+        path = replay_file()
+        if mode == 'replay':
+            _fixture = Fixture.load(path, replay_loose())
+        else:
+            _fixture = Fixture(path)
+            _fixture.data['recorded_at'] = datetime.now().isoformat(timespec='seconds')
+    return _fixture
+
+
+def replay_clients(load_real=None) -> Tuple[Any, Any]:
+    """
+    The (things, strava) clients for the current replay mode.
+
+    Args:
+        load_real: Zero-argument function returning the real (things,
+            strava) modules; only called when recording
+
+    Returns:
+        Tuple of (things, strava): recording proxies or fixture-backed stand-ins
+
+    Raises:
+        FileNotFoundError: If replaying and the fixture file doesn't exist
+    """
+    global _clients
+    with _clients_lock:
+        if _clients is None:
+            mode = replay_mode()
+            fixture = _load_fixture(mode)
+            if mode == 'record':
+                real = load_real()
+                _clients = tuple(_RecordingClient(name, client, fixture) for name, client in zip(CLIENTS, real))
+            else:
+                _clients = tuple(_ReplayClient(name, fixture) for name in CLIENTS)
+        return _clients
+
+
+def replay_now() -> Optional[datetime]:
+    """
+    The recorded clock when replaying (None otherwise, or if not recorded).
+
+    The fixture is read once per process and shared with the replay clients.
+
+    Example:
+        now = replay_now() or datetime.now()
+    """
+    if replay_mode() != 'replay':
+        return None
+    try:
+        with _clients_lock:
+            return _load_fixture('replay').recorded_at
+    except (OSError, ValueError):
+        return None
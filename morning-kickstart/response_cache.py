@@ -0,0 +1,147 @@
+"""
+Persistent TTL cache for Things and Strava responses.
+
+Stores each MCP response as a small JSON file under the skills data
+directory so repeated morning runs reuse recent data instead of
+making fresh MCP calls. Every source has its own time-to-live: the
+athlete profile barely changes, while today's Things list changes often.
+
+Usage:
+    from response_cache import cached_call
+
+    tasks = cached_call('things_today', things.get_today)
+    tasks = cached_call('things_today', things.get_today, refresh=True)  # bypass
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from paths import CACHE_DIR
+from profiling import mark_cache
+
+# Time-to-live per source (seconds)
+CACHE_TTLS = {
+    'things_today': 10 * 60,
+    'things_upcoming': 30 * 60,
+    'strava_profile': 24 * 60 * 60,
+    'strava_stats': 60 * 60,
+    'strava_activity_sync': 15 * 60,
+}
+
+# TTL for keys not listed above
+DEFAULT_TTL = 15 * 60
+
+
+def _cache_path(key: str, cache_dir: Path) -> Path:
+    return cache_dir / f'{key}.json'
+
+
+def read_cache(key: str, cache_dir: Path = CACHE_DIR) -> Optional[Dict[str, Any]]:
+    """
+    Read a cache entry regardless of age.
+
+    Args:
+        key: Cache key (e.g. 'things_today')
+        cache_dir: Directory holding cache files
+
+    Returns:
+        Dict with 'fetched_at' (epoch seconds) and 'value', or None if the
+        entry is missing or unreadable
+    """
+    path = _cache_path(key, cache_dir)
+    try:
+        with open(path, 'r') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(entry, dict) or 'fetched_at' not in entry or 'value' not in entry:
+        return None
+    return entry
+
+
+def write_cache(key: str, value: Any, cache_dir: Path = CACHE_DIR) -> bool:
+    """
+    Write a cache entry atomically.
+
+    Args:
+        key: Cache key
+        value: JSON-serializable response to store
+        cache_dir: Directory holding cache files
+
+    Returns:
+        True if written, False if the value couldn't be serialized or saved
+    """
+    try:
+        payload = json.dumps({'fetched_at': time.time(), 'value': value})
+    except (TypeError, ValueError):
+        return False
+
+    path = _cache_path(key, cache_dir)
+    tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'w') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except OSError:
+        return False
+    return True
+
+
+def cached_call(
+    key: str,
+    fetch_fn: Callable[[], Any],
+    ttl: Optional[float] = None,
+    refresh: bool = False,
+    cache_dir: Path = CACHE_DIR
+) -> Any:
+    """
+    Return a cached response if it's fresh, otherwise fetch and cache it.
+
+    Records a hit or miss on the enclosing profiler span, if any.
+
+    Args:
+        key: Cache key (also the file name)
+        fetch_fn: Zero-argument function making the real MCP call
+        ttl: Time-to-live in seconds (defaults to CACHE_TTLS[key])
+        refresh: Bypass the cache and always fetch (result is still stored)
+        cache_dir: Directory holding cache files
+
+    Returns:
+        The cached or freshly fetched response
+
+    Example:
+        profile = cached_call('strava_profile', strava.get_athlete_profile)
+    """
+    if ttl is None:
+        ttl = CACHE_TTLS.get(key, DEFAULT_TTL)
+
+    if not refresh:
+        entry = read_cache(key, cache_dir)
+        if entry is not None and time.time() - entry['fetched_at'] < ttl:
+            mark_cache(True)
+            return entry['value']
+
+    mark_cache(False)
+    value = fetch_fn()
+    write_cache(key, value, cache_dir)
+    return value
+
+
+def clear_cache(cache_dir: Path = CACHE_DIR) -> int:
+    """
+    Delete all cached responses.
+
+    Returns:
+        Number of cache files removed
+    """
+    removed = 0
+    if cache_dir.exists():
+        for path in cache_dir.glob('*.json'):
+            path.unlink()
+            removed += 1
+    return removed
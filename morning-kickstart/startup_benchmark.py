@@ -0,0 +1,141 @@
+"""
+Startup benchmark for kickstart_engine.
+
+Imports the engine in fresh interpreters with `-X importtime`, reports the
+median import time and the slowest modules, and checks that the heavy
+modules (MCP clients, fetch stage, tracker store, insights) are still
+imported lazily. Exits non-zero if the import is over budget or a lazy
+module was pulled in at import time, so it can guard regressions.
+
+Usage:
+    python startup_benchmark.py
+    python startup_benchmark.py --runs 20 --budget-ms 80 --top 15
+"""
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ENGINE_DIR = Path(__file__).resolve().parent
+
+# Median cumulative import time allowed for kickstart_engine
+IMPORT_BUDGET_MS = 100.0
+
+# Modules that must not be imported by `import kickstart_engine`
+LAZY_MODULES = (
+    'mcp_tools',
+    'insights_generator',
+    'workout_parser',
+    'fetch_stage',
+    'concurrent.futures',
+    'tracker_store',
+    'sqlite3',
+    'activity_store',
+    'training_load',
+)
+
+# "import time: self [us] | cumulative | imported package"
+_IMPORTTIME_RE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+_PROBE = (
+    "import sys, json, kickstart_engine; "
+    "print(json.dumps([m for m in {modules!r} if m in sys.modules]))"
+)
+
+
+def _import_once() -> Tuple[Dict[str, int], List[str]]:
+    """
+    Import the engine in a fresh interpreter.
+
+    Returns:
+        Tuple of (module -> cumulative import µs, lazy modules that were imported)
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', _PROBE.format(modules=LAZY_MODULES)],
+        cwd=ENGINE_DIR,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if match:
+            cumulative[match.group(4)] = int(match.group(2))
+
+    return cumulative, json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run_benchmark(runs: int = 10) -> Dict[str, object]:
+    """
+    Measure `import kickstart_engine` over several fresh interpreters.
+
+    Args:
+        runs: Number of interpreter launches (the first warms the .pyc cache
+              and isn't counted)
+
+    Returns:
+        Dict with median_ms, samples_ms, modules (module -> median ms) and
+        eager (lazy modules that were imported)
+
+    Example:
+        report = run_benchmark(runs=5)
+        print(f"{report['median_ms']:.1f}ms")
+    """
+    _import_once()  # compile .pyc files
+
+    samples: Dict[str, List[int]] = {}
+    eager = set()
+    for _ in range(runs):
+        cumulative, imported = _import_once()
+        for module, micros in cumulative.items():
+            samples.setdefault(module, []).append(micros)
+        eager.update(imported)
+
+    modules = {module: statistics.median(values) / 1000 for module, values in samples.items()}
+    engine = [micros / 1000 for micros in samples.get('kickstart_engine', [])]
+    return {
+        'median_ms': statistics.median(engine) if engine else 0.0,
+        'samples_ms': engine,
+        'modules': modules,
+        'eager': sorted(eager),
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark kickstart_engine import time")
+    parser.add_argument('--runs', type=int, default=10, help="Fresh interpreters to time")
+    parser.add_argument('--budget-ms', type=float, default=IMPORT_BUDGET_MS, help="Median import budget")
+    parser.add_argument('--top', type=int, default=10, help="Slowest modules to list")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.runs)
+    samples = report['samples_ms']
+
+    print(f"import kickstart_engine: {report['median_ms']:.1f}ms median "
+          f"(min {min(samples):.1f}ms, max {max(samples):.1f}ms, {len(samples)} runs)")
+    print("\nSlowest modules (cumulative, median):")
+    slowest = sorted(
+        ((m, ms) for m, ms in report['modules'].items() if m != 'kickstart_engine'),
+        key=lambda item: item[1],
+        reverse=True
+    )
+    for module, ms in slowest[:args.top]:
+        print(f"  {ms:7.1f}ms  {module}")
+
+    failed = False
+    if report['median_ms'] > args.budget_ms:
+        print(f"\nFAIL: over the {args.budget_ms:.0f}ms budget")
+        failed = True
+    if report['eager']:
+        print(f"\nFAIL: imported at startup, should be lazy: {', '.join(report['eager'])}")
+        failed = True
+    if not failed:
+        print(f"\nOK: within the {args.budget_ms:.0f}ms budget, heavy modules lazy")
+    sys.exit(1 if failed else 0)
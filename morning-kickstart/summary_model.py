@@ -0,0 +1,467 @@
+"""
+Structured morning summary and its renderers.
+
+The engine fills a MorningSummary once - every number, list and message
+the summary shows, computed from the sources - and the renderers only
+format it. Plain text is the classic terminal layout, JSON is for
+downstream tools, and compact markdown is for notes and chat. Rendering
+another format from the same summary costs no fetching or insights work.
+
+Usage:
+    from kickstart_engine import build_morning_summary
+    from summary_model import render_text, render_json, render_markdown
+
+    summary = build_morning_summary()
+    print(render_text(summary))
+    data = summary.to_dict()        # or render_json(summary)
+"""
+
+import json
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional
+
+# Outreach target per week
+OUTREACH_TARGET = 10
+
+# One-line guidance per energy level (anything else is treated as LOW)
+ENERGY_NOTES = {
+    'HIGH': "Good for uncomfortable/hard tasks",
+    'MEDIUM': "Balanced day, moderate effort tasks",
+}
+LOW_ENERGY_NOTE = "Save energy for training"
+
+
+def _plain(value: Any) -> Any:
+    """Convert model values to JSON-ready types."""
+    if isinstance(value, _Model):
+        return value.to_dict()
+    if isinstance(value, (list, tuple)):
+        return [_plain(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+class _Model:
+    """Base for the summary parts: fixed slots, dict conversion, readable repr."""
+
+    __slots__ = ()
+
+    # Slots computed in __init__ (in to_dict output, not constructor arguments)
+    _derived = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: _plain(getattr(self, name)) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        return cls(**{key: value for key, value in data.items() if key not in cls._derived})
+
+    def __eq__(self, other: Any) -> bool:
+        return type(other) is type(self) and self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class NeedleMover(_Model):
+    """Section 1: the suggested needle-mover task and why."""
+
+    __slots__ = ('category', 'action', 'context', 'streak', 'avoidance_check')
+
+    def __init__(
+        self,
+        category: str,
+        action: str,
+        context: List[str],
+        streak: int,
+        avoidance_check: Optional[str] = None
+    ):
+        self.category = category
+        self.action = action
+        self.context = context
+        self.streak = streak
+        self.avoidance_check = avoidance_check
+
+
+class JobSearch(_Model):
+    """Section 2: outreach progress this week and matching Things tasks."""
+
+    __slots__ = ('week_count', 'target', 'remaining', 'things_tasks', 'energy_suggestion', 'weekly_streaks')
+    _derived = ('remaining',)
+
+    def __init__(
+        self,
+        week_count: int,
+        things_tasks: List[str],
+        energy_suggestion: str,
+        weekly_streaks: int,
+        target: int = OUTREACH_TARGET
+    ):
+        self.week_count = week_count
+        self.target = target
+        self.remaining = max(0, target - week_count)
+        self.things_tasks = things_tasks
+        self.energy_suggestion = energy_suggestion
+        self.weekly_streaks = weekly_streaks
+
+
+class QuickChecks(_Model):
+    """Section 3: Carter rituals done this week/month and the Denver challenge."""
+
+    __slots__ = (
+        'carter_week', 'carter_month', 'carter_planned',
+        'denver_challenge', 'denver_status', 'denver_tie_in'
+    )
+
+    def __init__(
+        self,
+        carter_week: Dict[str, bool],
+        carter_month: Dict[str, bool],
+        carter_planned: List[str],
+        denver_challenge: str,
+        denver_status: str,
+        denver_tie_in: Optional[str] = None
+    ):
+        self.carter_week = carter_week
+        self.carter_month = carter_month
+        self.carter_planned = carter_planned
+        self.denver_challenge = denver_challenge
+        self.denver_status = denver_status
+        self.denver_tie_in = denver_tie_in
+
+
+class Training(_Model):
+    """Section 4: training phase, today's workout, weekly volume and energy."""
+
+    __slots__ = (
+        'phase', 'phase_start', 'phase_end', 'phase_week', 'todays_workout',
+        'volume_miles', 'volume_target', 'time_hours', 'energy_level', 'energy_note'
+    )
+    _derived = ('energy_note',)
+
+    def __init__(
+        self,
+        phase: str,
+        todays_workout: str,
+        volume_miles: float,
+        volume_target: str,
+        time_hours: float,
+        energy_level: str,
+        phase_start: str = '',
+        phase_end: str = '',
+        phase_week: Optional[int] = None
+    ):
+        self.phase = phase
+        self.phase_start = phase_start
+        self.phase_end = phase_end
+        self.phase_week = phase_week
+        self.todays_workout = todays_workout
+        self.volume_miles = volume_miles
+        self.volume_target = volume_target
+        self.time_hours = time_hours
+        self.energy_level = energy_level
+        self.energy_note = ENERGY_NOTES.get(energy_level, LOW_ENERGY_NOTE)
+
+
+class Remember(_Model):
+    """Closing reminders (energy-aware)."""
+
+    __slots__ = ('reminders',)
+
+    def __init__(self, reminders: List[str]):
+        self.reminders = reminders
+
+
+class MorningSummary(_Model):
+    """
+    The whole summary. Sections are filled in as their sources arrive, so a
+    streamed summary can be rendered section by section.
+    """
+
+    __slots__ = ('now', 'needle_mover', 'job_search', 'quick_checks', 'training', 'remember')
+
+    def __init__(
+        self,
+        now: datetime,
+        needle_mover: Optional[NeedleMover] = None,
+        job_search: Optional[JobSearch] = None,
+        quick_checks: Optional[QuickChecks] = None,
+        training: Optional[Training] = None,
+        remember: Optional[Remember] = None
+    ):
+        self.now = now
+        self.needle_mover = needle_mover
+        self.job_search = job_search
+        self.quick_checks = quick_checks
+        self.training = training
+        self.remember = remember
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'MorningSummary':
+        """Rebuild a summary from to_dict() output (e.g. a saved JSON render)."""
+        parts = {
+            name: part.from_dict(data[name])
+            for name, part in SECTION_TYPES.items()
+            if data.get(name) is not None
+        }
+        return cls(datetime.fromisoformat(data['now']), **parts)
+
+
+# Model class for each built section
+SECTION_TYPES = {
+    'needle_mover': NeedleMover,
+    'job_search': JobSearch,
+    'quick_checks': QuickChecks,
+    'training': Training,
+    'remember': Remember,
+}
+
+
+# Section names in display order ('header' renders from `now`)
+SECTION_NAMES = ('header', 'needle_mover', 'job_search', 'quick_checks', 'training', 'remember')
+
+
+# ---------------------------------------------------------------------------
+# Plain text (the classic terminal layout)
+# ---------------------------------------------------------------------------
+
+def _rule(title: str) -> List[str]:
+    return ["\n" + "-" * 60, title, "-" * 60]
+
+
+def _checkbox(done: bool) -> str:
+    return '[x]' if done else '[ ]'
+
+
+def _text_header(summary: MorningSummary) -> List[str]:
+    return ["=" * 60, f"MORNING KICKSTART - {summary.now.strftime('%A, %B %d')}", "=" * 60]
+
+
+def _text_needle_mover(summary: MorningSummary) -> List[str]:
+    nm = summary.needle_mover
+    output = _rule("1. TODAY'S NEEDLE MOVER")
+    output.append(f"[{nm.category.upper()}] {nm.action}\n")
+    output.extend(nm.context)
+    output.append(f"\nStreak: {nm.streak} days")
+    if nm.avoidance_check:
+        output.append(f"\n{nm.avoidance_check}")
+    return output
+
+
+def _text_job_search(summary: MorningSummary) -> List[str]:
+    js = summary.job_search
+    output = _rule("2. JOB SEARCH MOMENTUM")
+
+    filled = min(js.week_count, js.target)
+    progress_bar = f"[{'O' * filled}{'.' * (js.target - filled)}] {js.week_count}/{js.target}"
+    output.append(f"This Week: {progress_bar}")
+    if js.remaining > 0:
+        output.append(f"Need {js.remaining} more to hit target")
+
+    if js.things_tasks:
+        output.append("\nThings Context:")
+        output.extend(f"  - {task}" for task in js.things_tasks)
+        output.append("  → When complete, log to outreach tracker")
+
+    output.append(f"\n{js.energy_suggestion}")
+    output.append(f"\nWeekly Streak: {js.weekly_streaks} weeks hitting {js.target}")
+    return output
+
+
+def _text_quick_checks(summary: MorningSummary) -> List[str]:
+    qc = summary.quick_checks
+    output = _rule("3. QUICK CHECKS")
+
+    output.append("\nCarter Rituals:")
+    output.append(
+        f"  This Week: {_checkbox(qc.carter_week.get('date'))} Date {_checkbox(qc.carter_week.get('note'))} Note"
+    )
+    output.append(f"  This Month: {_checkbox(qc.carter_month.get('flowers'))} Flowers")
+    if qc.carter_planned:
+        output.append(f"  Planned in Things: {', '.join(qc.carter_planned)}")
+
+    output.append("\nDenver Connection:")
+    output.append(f"  Challenge: {qc.denver_challenge}")
+    output.append(f"  Status: {qc.denver_status}")
+    if qc.denver_tie_in:
+        output.append(f"  {qc.denver_tie_in}")
+    return output
+
+
+def _text_training(summary: MorningSummary) -> List[str]:
+    tr = summary.training
+    output = _rule("4. TODAY'S TRAINING")
+
+    if tr.phase_week is not None:
+        output.append(f"{tr.phase}, Week {tr.phase_week}")
+        output.append(f"({tr.phase_start} to {tr.phase_end})")
+    else:
+        output.append(tr.phase)
+
+    output.append(f"\nToday: {tr.todays_workout}")
+    output.append("\nThis Week:")
+    output.append(f"  - Volume: {tr.volume_miles:.1f} mi (target: {tr.volume_target})")
+    output.append(f"  - Time: {tr.time_hours:.1f} hours")
+
+    output.append(f"\nEnergy Level: {tr.energy_level}")
+    output.append(f"  → {tr.energy_note}")
+    return output
+
+
+def _text_remember(summary: MorningSummary) -> List[str]:
+    output = ["\n" + "=" * 60, "REMEMBER:"]
+    output.extend(f"  - {reminder}" for reminder in summary.remember.reminders)
+    output.append("=" * 60 + "\n")
+    return output
+
+
+TEXT_SECTIONS: Dict[str, Callable[[MorningSummary], List[str]]] = {
+    'header': _text_header,
+    'needle_mover': _text_needle_mover,
+    'job_search': _text_job_search,
+    'quick_checks': _text_quick_checks,
+    'training': _text_training,
+    'remember': _text_remember,
+}
+
+
+# ---------------------------------------------------------------------------
+# Compact markdown
+# ---------------------------------------------------------------------------
+
+def _md_header(summary: MorningSummary) -> List[str]:
+    return [f"## Morning Kickstart - {summary.now.strftime('%A, %B %d')}"]
+
+
+def _md_needle_mover(summary: MorningSummary) -> List[str]:
+    nm = summary.needle_mover
+    output = [f"\n**Needle mover** ({nm.category}): {nm.action}"]
+    output.extend(f"- {line}" for line in nm.context)
+    output.append(f"- Streak: {nm.streak} days")
+    if nm.avoidance_check:
+        output.append(f"- {nm.avoidance_check}")
+    return output
+
+
+def _md_job_search(summary: MorningSummary) -> List[str]:
+    js = summary.job_search
+    output = [
+        f"\n**Job search**: {js.week_count}/{js.target} this week"
+        + (f", {js.remaining} to go" if js.remaining else "")
+        + f" (streak: {js.weekly_streaks} weeks)"
+    ]
+    if js.things_tasks:
+        output.append(f"- Things: {'; '.join(js.things_tasks)}")
+    output.append(f"- {js.energy_suggestion}")
+    return output
+
+
+def _md_quick_checks(summary: MorningSummary) -> List[str]:
+    qc = summary.quick_checks
+    carter = (
+        f"- Carter: {_checkbox(qc.carter_week.get('date'))} date "
+        f"{_checkbox(qc.carter_week.get('note'))} note "
+        f"{_checkbox(qc.carter_month.get('flowers'))} flowers"
+    )
+    if qc.carter_planned:
+        carter += f" (planned: {', '.join(qc.carter_planned)})"
+
+    denver = f"- Denver: {qc.denver_challenge} ({qc.denver_status})"
+    if qc.denver_tie_in:
+        denver += f" - {qc.denver_tie_in}"
+    return ["\n**Quick checks**", carter, denver]
+
+
+def _md_training(summary: MorningSummary) -> List[str]:
+    tr = summary.training
+    phase = f"{tr.phase}, week {tr.phase_week}" if tr.phase_week is not None else tr.phase
+    return [
+        f"\n**Training** ({phase}): {tr.todays_workout}",
+        f"- Week: {tr.volume_miles:.1f} mi (target: {tr.volume_target}), {tr.time_hours:.1f} h",
+        f"- Energy {tr.energy_level}: {tr.energy_note}",
+    ]
+
+
+def _md_remember(summary: MorningSummary) -> List[str]:
+    return [f"\n**Remember**: {'; '.join(summary.remember.reminders)}"]
+
+
+MARKDOWN_SECTIONS: Dict[str, Callable[[MorningSummary], List[str]]] = {
+    'header': _md_header,
+    'needle_mover': _md_needle_mover,
+    'job_search': _md_job_search,
+    'quick_checks': _md_quick_checks,
+    'training': _md_training,
+    'remember': _md_remember,
+}
+
+
+# ---------------------------------------------------------------------------
+# Entry points
+# ---------------------------------------------------------------------------
+
+def render_section(summary: MorningSummary, name: str, fmt: str = 'text') -> str:
+    """
+    Render one section of a (possibly partly filled) summary.
+
+    Args:
+        summary: Summary with at least this section filled
+        name: One of SECTION_NAMES
+        fmt: 'text' or 'markdown'
+
+    Returns:
+        Section text
+    """
+    sections = MARKDOWN_SECTIONS if fmt == 'markdown' else TEXT_SECTIONS
+    return "\n".join(sections[name](summary))
+
+
+def render_text(summary: MorningSummary) -> str:
+    """Render the classic plain-text summary."""
+    return "\n".join(render_section(summary, name) for name in SECTION_NAMES)
+
+
+def render_markdown(summary: MorningSummary) -> str:
+    """Render a compact markdown summary."""
+    return "\n".join(render_section(summary, name, 'markdown') for name in SECTION_NAMES)
+
+
+def render_json(summary: MorningSummary, indent: Optional[int] = 2) -> str:
+    """Render the summary as JSON (see MorningSummary.to_dict)."""
+    return json.dumps(summary.to_dict(), indent=indent, ensure_ascii=False)
+
+
+# Output formats by name (e.g. for --format)
+RENDERERS: Dict[str, Callable[[MorningSummary], str]] = {
+    'text': render_text,
+    'json': render_json,
+    'markdown': render_markdown,
+}
+
+
+def render(summary: MorningSummary, fmt: str = 'text') -> str:
+    """
+    Render a summary in one of the RENDERERS formats.
+
+    Args:
+        summary: Filled summary
+        fmt: 'text', 'json' or 'markdown'
+
+    Returns:
+        Rendered summary
+
+    Raises:
+        ValueError: If the format is unknown
+
+    Example:
+        print(render(build_morning_summary(), 'markdown'))
+    """
+    try:
+        renderer = RENDERERS[fmt]
+    except KeyError:
+        raise ValueError(f"Unknown summary format {fmt!r} (expected one of {', '.join(RENDERERS)})")
+    return renderer(summary)
@@ -0,0 +1,167 @@
+"""
+Inverted index over Things tasks for the insights contextualizers.
+
+Built once per run from the fetched tasks. A single pass lowercases each
+title, finds every indexed keyword in it (behind one precompiled
+prefilter pattern) and records tag/priority membership, so each contextualizer answers its
+"tasks tagged X or mentioning Y" question from the index instead of
+rescanning the task list.
+
+Usage:
+    from task_index import TaskIndex
+
+    index = TaskIndex(tasks, keywords=['apply', 'outreach', 'date'])
+    job_tasks = index.matching(tags=['#job-search'], keywords=['apply'])
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Sequence
+
+
+class TaskIndex:
+    """
+    Tag, priority and keyword index over a list of Things tasks.
+
+    Tasks are referred to by position in the original list (task IDs can
+    repeat across Things lists), and every query returns tasks in their
+    original order.
+
+    Keyword matching is case-insensitive substring matching, the same as
+    `keyword in title.lower()`.
+    """
+
+    def __init__(self, tasks: Sequence[Dict[str, Any]], keywords: Iterable[str] = ()):
+        self.tasks = list(tasks)
+        self.by_tag: Dict[str, List[int]] = {}
+        self.by_priority: Dict[str, List[int]] = {}
+        self.by_keyword: Dict[str, List[int]] = {}
+        self.keywords_of: List[frozenset] = []
+        self._titles: List[str] = []
+
+        keywords = sorted(set(k.lower() for k in keywords))
+        self._indexed = frozenset(keywords)
+        for keyword in keywords:
+            self.by_keyword[keyword] = []
+
+        # One precompiled pattern rejects titles with no keyword at all;
+        # titles that match get exact per-keyword substring checks, since a
+        # regex alone can't report keywords that overlap each other
+        # (e.g. "reach out" and "outreach" in "reach outreach")
+        pattern = re.compile('|'.join(re.escape(k) for k in keywords)) if keywords else None
+
+        empty = frozenset()
+        by_tag = self.by_tag
+        by_priority = self.by_priority
+        by_keyword = self.by_keyword
+        keywords_of = self.keywords_of
+        titles = self._titles
+
+        for position, task in enumerate(self.tasks):
+            title_lower = (task.get('title') or '').lower()
+            titles.append(title_lower)
+
+            for tag in task.get('tags') or ():
+                positions = by_tag.get(tag)
+                if positions is None:
+                    by_tag[tag] = [position]
+                elif positions[-1] != position:  # ignore repeated tags
+                    positions.append(position)
+
+            priority = task.get('priority')
+            if priority:
+                by_priority.setdefault(priority, []).append(position)
+
+            if pattern is not None and pattern.search(title_lower):
+                found = [keyword for keyword in keywords if keyword in title_lower]
+                for keyword in found:
+                    by_keyword[keyword].append(position)
+                keywords_of.append(frozenset(found))
+            else:
+                keywords_of.append(empty)
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    def keyword_positions(self, keyword: str) -> List[int]:
+        """
+        Positions of tasks whose title contains the keyword.
+
+        Keywords not indexed up front are indexed on first use.
+        """
+        keyword = keyword.lower()
+        if keyword not in self.by_keyword:
+            self.by_keyword[keyword] = [
+                position for position, title in enumerate(self._titles)
+                if keyword in title
+            ]
+        return self.by_keyword[keyword]
+
+    def has_keyword(self, position: int, keyword: str) -> bool:
+        """Check whether the task at `position` mentions the keyword."""
+        keyword = keyword.lower()
+        if keyword in self._indexed:
+            return keyword in self.keywords_of[position]
+        return keyword in self._titles[position]
+
+    def positions(
+        self,
+        tags: Iterable[str] = (),
+        keywords: Iterable[str] = (),
+        priorities: Iterable[str] = ()
+    ) -> List[int]:
+        """
+        Positions of tasks with any of the tags, keywords or priorities.
+
+        Args:
+            tags: Tags to match (e.g. '#job-search')
+            keywords: Title keywords to match (substring, case-insensitive)
+            priorities: Priorities to match (e.g. 'P1')
+
+        Returns:
+            Sorted list of task positions (union of all matches)
+        """
+        matched = set()
+        for tag in tags:
+            matched.update(self.by_tag.get(tag, ()))
+        for keyword in keywords:
+            matched.update(self.keyword_positions(keyword))
+        for priority in priorities:
+            matched.update(self.by_priority.get(priority, ()))
+        return sorted(matched)
+
+    def matching(
+        self,
+        tags: Iterable[str] = (),
+        keywords: Iterable[str] = (),
+        priorities: Iterable[str] = ()
+    ) -> List[Dict[str, Any]]:
+        """
+        Tasks with any of the tags, keywords or priorities, in original order.
+
+        Example:
+            carter_tasks = index.matching(tags=['#carter'], keywords=['carter', 'date'])
+        """
+        return [self.tasks[position] for position in self.positions(tags, keywords, priorities)]
+
+    def covers(self, keywords: Iterable[str]) -> bool:
+        """Check whether every keyword was indexed up front (so keywords_of lists it)."""
+        return self._indexed.issuperset(k.lower() for k in keywords)
+
+    @classmethod
+    def ensure(
+        cls,
+        tasks: Any,
+        keywords: Iterable[str] = ()
+    ) -> 'TaskIndex':
+        """
+        Return `tasks` if it's an index covering `keywords`, otherwise build one.
+
+        An index built without some of the keywords would leave them out of
+        keywords_of, so it's rebuilt over its tasks with those keywords added.
+        """
+        keywords = list(keywords)
+        if isinstance(tasks, cls):
+            if tasks.covers(keywords):
+                return tasks
+            return cls(tasks.tasks, tasks._indexed.union(k.lower() for k in keywords))
+        return cls(tasks, keywords)
@@ -0,0 +1,146 @@
+"""
+Token-size regression benchmark for the morning summary.
+
+Renders every summary in the fixture corpus (fixtures/summaries/*.json,
+saved MorningSummary.to_dict() output) in each format, full and within the
+token budget, and compares the estimated token counts against the saved
+baseline. The corpus covers the renderers; a `replayed` entry covers the
+builders too: build_morning_summary() is run end to end on the benchmark
+suite's synthetic dataset with KICKSTART_REPLAY=replay (offline, clock
+pinned), in a fresh interpreter. Fails if any render grew by more than
+TOLERANCE, or if a budgeted render is over budget. Run with --update after
+an intentional change to the layout to record the new sizes.
+
+Usage:
+    python token_benchmark.py
+    python token_benchmark.py --budget 400
+    python token_benchmark.py --update
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+from benchmark_suite import BASE_ACTIVITIES, BASE_TASKS, make_dataset
+from summary_model import RENDERERS, MorningSummary, render
+from token_budget import DEFAULT_TOKEN_BUDGET, estimate_tokens, render_budgeted
+
+FIXTURE_DIR = Path(__file__).resolve().parent / 'fixtures'
+CORPUS_DIR = FIXTURE_DIR / 'summaries'
+BASELINE_FILE = FIXTURE_DIR / 'token_baseline.json'
+
+# Baseline entry for the summary built from the replayed dataset
+REPLAYED = 'replayed'
+
+# Allowed growth over the baseline before a render counts as a regression
+TOLERANCE = 0.05
+
+
+def measure_summary(summary: MorningSummary, budget: int) -> Dict[str, Dict[str, int]]:
+    """Token counts of one summary: format -> {'full': tokens, 'budgeted': tokens}."""
+    return {
+        fmt: {
+            'full': estimate_tokens(render(summary, fmt)),
+            'budgeted': render_budgeted(summary, budget, fmt).tokens,
+        }
+        for fmt in RENDERERS
+    }
+
+
+def replayed_summary() -> MorningSummary:
+    """
+    Build the summary from the replayed benchmark dataset, offline.
+
+    The data paths are read at import, so the engine runs in a fresh
+    interpreter pointed at a scratch copy of the dataset.
+    """
+    with tempfile.TemporaryDirectory(prefix='kickstart-tokens-') as tmp:
+        env = dict(os.environ, **make_dataset(Path(tmp), BASE_TASKS, BASE_ACTIVITIES))
+        output = subprocess.run(
+            [sys.executable, __file__, '--worker'],
+            cwd=Path(__file__).resolve().parent, env=env, capture_output=True, text=True, check=True
+        ).stdout
+    return MorningSummary.from_dict(json.loads(output.strip().splitlines()[-1]))
+
+
+def measure(budget: int = DEFAULT_TOKEN_BUDGET) -> Dict[str, Dict[str, Dict[str, int]]]:
+    """
+    Measure every fixture, and the replayed summary, in every format.
+
+    Args:
+        budget: Token budget for the budgeted renders
+
+    Returns:
+        Dict of fixture -> format -> {'full': tokens, 'budgeted': tokens}
+
+    Example:
+        sizes = measure()
+        print(sizes['typical']['text']['full'])
+    """
+    sizes = {}
+    for path in sorted(CORPUS_DIR.glob('*.json')):
+        with open(path, 'r') as f:
+            summary = MorningSummary.from_dict(json.load(f))
+        sizes[path.stem] = measure_summary(summary, budget)
+    sizes[REPLAYED] = measure_summary(replayed_summary(), budget)
+    return sizes
+
+
+def compare(sizes: Dict, baseline: Dict, budget: int) -> List[str]:
+    """List regressions: renders that grew past TOLERANCE or went over budget."""
+    problems = []
+    for fixture, formats in sizes.items():
+        for fmt, counts in formats.items():
+            if counts['budgeted'] > budget:
+                problems.append(f"{fixture}/{fmt}: budgeted render is {counts['budgeted']} tokens (budget {budget})")
+            for kind, tokens in counts.items():
+                before = baseline.get(fixture, {}).get(fmt, {}).get(kind)
+                if before and tokens > before * (1 + TOLERANCE):
+                    problems.append(f"{fixture}/{fmt} {kind}: {before} -> {tokens} tokens (+{tokens / before - 1:.0%})")
+    return problems
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Check summary token sizes against the fixture baseline")
+    parser.add_argument('--budget', type=int, default=DEFAULT_TOKEN_BUDGET, help="Token budget for budgeted renders")
+    parser.add_argument('--update', action='store_true', help="Record the current sizes as the new baseline")
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        from kickstart_engine import build_morning_summary
+        print(json.dumps(build_morning_summary().to_dict()))
+        sys.exit(0)
+
+    sizes = measure(args.budget)
+    try:
+        with open(BASELINE_FILE, 'r') as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        baseline = {}
+
+    print(f"{'fixture':<12} {'format':<9} {'full':>6} {'budgeted':>9} {'baseline':>9}")
+    for fixture, formats in sizes.items():
+        for fmt, counts in formats.items():
+            before = baseline.get(fixture, {}).get(fmt, {}).get('full', '-')
+            print(f"{fixture:<12} {fmt:<9} {counts['full']:>6} {counts['budgeted']:>9} {before:>9}")
+
+    if args.update:
+        with open(BASELINE_FILE, 'w') as f:
+            json.dump(sizes, f, indent=2)
+            f.write('\n')
+        print(f"\nBaseline updated: {BASELINE_FILE}")
+        sys.exit(0)
+
+    problems = compare(sizes, baseline, args.budget)
+    if problems:
+        print("\nFAIL:")
+        for problem in problems:
+            print(f"  - {problem}")
+        sys.exit(1)
+    print(f"\nOK: {len(sizes)} fixtures within {TOLERANCE:.0%} of baseline and the {args.budget}-token budget")
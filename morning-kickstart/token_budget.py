@@ -0,0 +1,166 @@
+"""
+Token-budgeted rendering for the morning summary.
+
+The summary is meant to cost ~300-500 tokens, but the needle-mover context,
+Things task titles and reminders can grow without limit. render_budgeted()
+renders the summary and, while it's over budget, applies condense steps
+from lowest to highest priority: first shortening long lines, then
+trimming and finally dropping the optional detail. The core facts (the
+needle mover, outreach progress, rituals, training and energy) are never
+dropped, so a tiny budget may still be exceeded; the achieved count is
+always reported.
+
+Token counts are estimated at ~4 characters per token, which is close
+for English prose and needs no tokenizer.
+
+Usage:
+    from token_budget import render_budgeted
+
+    result = render_budgeted(build_morning_summary(), budget=400)
+    print(result.text)
+    print(f"~{result.tokens} tokens, condensed: {', '.join(result.steps)}")
+"""
+
+import copy
+from typing import Callable, List
+
+from summary_model import MorningSummary, render
+
+# Default budget (the top of the promised ~300-500 tokens)
+DEFAULT_TOKEN_BUDGET = 500
+
+# Characters per token for the estimate
+CHARS_PER_TOKEN = 4
+
+# Longest free-text line kept once lines are shortened
+MAX_LINE_CHARS = 80
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the token count of text (~4 characters per token, rounded up).
+
+    Args:
+        text: Rendered summary or any string
+
+    Returns:
+        Estimated token count
+    """
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def _shorten(text: str, limit: int = MAX_LINE_CHARS) -> str:
+    if len(text) <= limit:
+        return text
+    return text[:limit - 1].rstrip() + '…'
+
+
+def _shorten_lines(summary: MorningSummary):
+    nm, js, qc = summary.needle_mover, summary.job_search, summary.quick_checks
+    nm.action = _shorten(nm.action)
+    nm.context = [_shorten(line) for line in nm.context]
+    js.things_tasks = [_shorten(task) for task in js.things_tasks]
+    qc.carter_planned = [_shorten(item, 30) for item in qc.carter_planned]
+    if qc.denver_tie_in:
+        qc.denver_tie_in = _shorten(qc.denver_tie_in)
+
+
+def _trim_lists(summary: MorningSummary):
+    summary.needle_mover.context = summary.needle_mover.context[:2]
+    summary.job_search.things_tasks = summary.job_search.things_tasks[:2]
+
+
+def _trim_reminders(summary: MorningSummary):
+    summary.remember.reminders = summary.remember.reminders[:1]
+
+
+def _drop_denver_tie_in(summary: MorningSummary):
+    summary.quick_checks.denver_tie_in = None
+
+
+def _drop_carter_planned(summary: MorningSummary):
+    summary.quick_checks.carter_planned = []
+
+
+def _drop_needle_context(summary: MorningSummary):
+    summary.needle_mover.context = []
+
+
+def _drop_things_tasks(summary: MorningSummary):
+    summary.job_search.things_tasks = []
+
+
+# Applied in order (lowest priority first) until the summary fits
+CONDENSE_STEPS: List[Callable[[MorningSummary], None]] = [
+    _shorten_lines,
+    _trim_lists,
+    _trim_reminders,
+    _drop_denver_tie_in,
+    _drop_carter_planned,
+    _drop_needle_context,
+    _drop_things_tasks,
+]
+
+
+class BudgetedRender:
+    """A rendered summary with its estimated size and what was condensed."""
+
+    __slots__ = ('text', 'tokens', 'budget', 'steps')
+
+    def __init__(self, text: str, tokens: int, budget: int, steps: List[str]):
+        self.text = text
+        self.tokens = tokens
+        self.budget = budget
+        self.steps = steps
+
+    @property
+    def within_budget(self) -> bool:
+        return self.tokens <= self.budget
+
+    def report(self) -> str:
+        """One-line size report, e.g. '~412 tokens (budget 500)'."""
+        line = f"~{self.tokens} tokens (budget {self.budget})"
+        if self.steps:
+            line += f", condensed: {', '.join(self.steps)}"
+        if not self.within_budget:
+            line += " - over budget"
+        return line
+
+
+def render_budgeted(
+    summary: MorningSummary,
+    budget: int = DEFAULT_TOKEN_BUDGET,
+    fmt: str = 'text'
+) -> BudgetedRender:
+    """
+    Render a summary within a token budget, condensing it as needed.
+
+    Args:
+        summary: Filled summary (left unchanged; steps apply to a copy)
+        budget: Target token count
+        fmt: 'text', 'json' or 'markdown'
+
+    Returns:
+        BudgetedRender with the text, its estimated tokens and the names of
+        the condense steps applied
+
+    Example:
+        result = render_budgeted(summary, budget=300, fmt='markdown')
+        if not result.within_budget:
+            print(f"Warning: {result.report()}")
+    """
+    text = render(summary, fmt)
+    tokens = estimate_tokens(text)
+    steps = []
+
+    condensed = None
+    for step in CONDENSE_STEPS:
+        if tokens <= budget:
+            break
+        condensed = condensed or copy.deepcopy(summary)
+        step(condensed)
+        steps.append(step.__name__.lstrip('_'))
+        text = render(condensed, fmt)
+        tokens = estimate_tokens(text)
+
+    return BudgetedRender(text, tokens, budget, steps)
@@ -0,0 +1,26 @@
+"""
+Tracker data layout shared by the tracker store and its readers.
+
+Kept free of SQLite and file access, so modules that only read tracker
+data (e.g. the insights) don't depend on the store.
+
+Usage:
+    from tracker_fields import EVENT_KEYS, TOTAL
+
+    outreaches = outreach_data.get(EVENT_KEYS['outreach'], [])
+    this_week = outreach_data['week_counts'].get(TOTAL, 0)
+"""
+
+# Top-level list in each tracker file that holds its events
+EVENT_KEYS = {
+    'needle_mover': 'entries',
+    'outreach': 'outreaches',
+    'carter': 'rituals',
+    'denver': 'challenges',
+}
+
+# Entry fields tried, in order, for an event's date
+DATE_FIELDS = ('date', 'timestamp', 'completed_at', 'assigned', 'week')
+
+# Rollup metric counting every event (other metrics are event types)
+TOTAL = 'total'
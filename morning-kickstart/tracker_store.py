@@ -0,0 +1,639 @@
+"""
+Unified SQLite store for the morning-kickstart trackers.
+
+Holds the needle-mover, outreach, Carter rituals and Denver connect
+trackers in one database. Every list entry (outreach, ritual, needle
+mover, challenge) is a row in `events`, indexed by tracker, date and
+type; top-level scalars (streak, weekly_streaks, current_challenge, ...)
+live in `state`. Questions like "this week's outreaches" are answered with
+an indexed range query, so a run costs the same after years of history.
+
+Per-day, per-ISO-week and per-month counts (all events, and per event
+type) are kept in `rollups` and updated in the same transaction as every
+append, so weekly progress reads a handful of rollup rows instead of
+counting events.
+
+The tracker skills still write their JSON files. Each file is imported
+when it first appears; after that, a changed file (by size or mtime) only
+costs its new entries: the skills append to their lists, so entries past
+the last imported one are inserted and rolled up incrementally (the last
+imported entry is re-imported too if it was edited, e.g. a needle mover
+marked done). Any other edit falls back to a full re-import. Events added
+with `append_event` are kept across re-imports.
+
+Usage:
+    from tracker_store import load_tracker, week_start
+
+    outreach = load_tracker('outreach', OUTREACH_FILE, since=week_start())
+    print(len(outreach['outreaches']), outreach.get('weekly_streaks', 0))
+
+    outreach = load_tracker('outreach', OUTREACH_FILE, rollups_for=date.today())
+    print(outreach['week_counts'].get('total', 0))
+
+    # Migrate all JSON trackers up front
+    python tracker_store.py --migrate
+"""
+
+import argparse
+import hashlib
+import json
+import sqlite3
+from collections import Counter
+from contextlib import closing
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from paths import TRACKER_DB, TRACKER_FILES
+from tracker_fields import DATE_FIELDS, EVENT_KEYS, TOTAL
+
+# Bumped when an existing database needs migrating (stored as PRAGMA user_version):
+# 1 added events.completed, 2 the incremental-import columns of sources
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    tracker TEXT NOT NULL,
+    date TEXT NOT NULL,
+    type TEXT,
+    source TEXT NOT NULL,
+    completed INTEGER NOT NULL DEFAULT 1,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_tracker_date ON events (tracker, date);
+CREATE INDEX IF NOT EXISTS events_tracker_type_date ON events (tracker, type, date);
+
+CREATE TABLE IF NOT EXISTS state (
+    tracker TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (tracker, key)
+);
+
+CREATE TABLE IF NOT EXISTS rollups (
+    tracker TEXT NOT NULL,
+    period TEXT NOT NULL,
+    start TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (tracker, period, start, metric)
+);
+
+CREATE TABLE IF NOT EXISTS rollup_latest (
+    tracker TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    date TEXT NOT NULL,
+    PRIMARY KEY (tracker, metric)
+);
+
+"""
+
+# Per tracker: the imported file, how many of its entries were imported, a
+# digest of all of them but the last, and the last one's digest and event id
+SOURCES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    tracker TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    entries INTEGER NOT NULL,
+    prefix_sha256 TEXT NOT NULL,
+    last_sha256 TEXT,
+    last_event_id INTEGER
+);
+"""
+
+
+def connect(db_path: Path = TRACKER_DB) -> sqlite3.Connection:
+    """
+    Open the tracker database, creating the schema if needed.
+
+    WAL mode plus a busy timeout lets the fetch threads read and import
+    different trackers at the same time.
+    """
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path), timeout=10.0)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.executescript(SCHEMA)
+    _migrate(conn)
+    return conn
+
+
+def _migrate(conn: sqlite3.Connection):
+    """
+    Bring an existing database up to SCHEMA_VERSION.
+
+    Runs under BEGIN IMMEDIATE and re-checks the version once it holds the
+    write lock, so two processes opening an old database at the same time
+    (e.g. the daemon and a CLI run) migrate it exactly once.
+    """
+    if conn.execute('PRAGMA user_version').fetchone()[0] >= SCHEMA_VERSION:
+        return
+
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        if conn.execute('PRAGMA user_version').fetchone()[0] < SCHEMA_VERSION:
+            # Databases created before rollups lack events.completed
+            columns = {row[1] for row in conn.execute('PRAGMA table_info(events)')}
+            if 'completed' not in columns:
+                conn.execute('ALTER TABLE events ADD COLUMN completed INTEGER NOT NULL DEFAULT 1')
+            # Older sources rows can't be imported incrementally; forgetting
+            # them makes the next load re-import (and roll up) each file once
+            conn.execute('DROP TABLE IF EXISTS sources')
+            conn.execute(SOURCES_SCHEMA)
+            conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+
+
+def week_start(day: Optional[date] = None) -> date:
+    """Monday of the week containing `day` (defaults to today)."""
+    day = day or datetime.now().date()
+    return day - timedelta(days=day.weekday())
+
+
+def event_date(entry: Dict[str, Any]) -> str:
+    """
+    Get an entry's date as YYYY-MM-DD.
+
+    Args:
+        entry: Tracker list entry (outreach, ritual, needle mover, challenge)
+
+    Returns:
+        Date string from the first date-like field, '' if there is none
+    """
+    for field in DATE_FIELDS:
+        value = entry.get(field)
+        if isinstance(value, str) and len(value) >= 10:
+            return value[:10]
+    return ''
+
+
+def event_type(entry: Dict[str, Any]) -> Optional[str]:
+    """Get an entry's type (ritual/outreach type, or needle-mover category)."""
+    return entry.get('type') or entry.get('category')
+
+
+def is_completed(entry: Dict[str, Any]) -> bool:
+    """Whether an entry counts toward rollups (a needle mover set but not done doesn't)."""
+    return bool(entry.get('completed', True))
+
+
+def _rollup_counts(
+    day_type_counts: Iterable[Tuple[str, Optional[str], int]]
+) -> Tuple[Counter, Dict[str, str]]:
+    """
+    Fold (date, type, count) triples into day/week/month rollups.
+
+    Returns:
+        Tuple of (Counter keyed by (period, start, metric), latest date per metric)
+    """
+    counts = Counter()
+    latest = {}
+    for day, kind, n in day_type_counts:
+        try:
+            when = date.fromisoformat(day)
+        except ValueError:
+            continue  # undated entries aren't rolled up
+
+        metrics = (TOTAL, kind) if kind else (TOTAL,)
+        for period, start in (('day', when), ('week', week_start(when)), ('month', when.replace(day=1))):
+            for metric in metrics:
+                counts[(period, start.isoformat(), metric)] += n
+        for metric in metrics:
+            if day > latest.get(metric, ''):
+                latest[metric] = day
+    return counts, latest
+
+
+def _add_rollups(
+    conn: sqlite3.Connection,
+    tracker: str,
+    day_type_counts: Iterable[Tuple[str, Optional[str], int]]
+):
+    """Add events to the tracker's rollups (caller holds the transaction)."""
+    counts, latest = _rollup_counts(day_type_counts)
+    conn.executemany(
+        'INSERT INTO rollups (tracker, period, start, metric, count) VALUES (?, ?, ?, ?, ?) '
+        'ON CONFLICT (tracker, period, start, metric) DO UPDATE SET count = count + excluded.count',
+        [(tracker, period, start, metric, n) for (period, start, metric), n in counts.items()]
+    )
+    conn.executemany(
+        'INSERT INTO rollup_latest (tracker, metric, date) VALUES (?, ?, ?) '
+        'ON CONFLICT (tracker, metric) DO UPDATE SET date = MAX(date, excluded.date)',
+        [(tracker, metric, day) for metric, day in latest.items()]
+    )
+
+
+def _remove_rollups(conn: sqlite3.Connection, tracker: str, day: str, kind: Optional[str]):
+    """Take one completed event out of the tracker's rollups (caller holds the transaction)."""
+    counts, latest = _rollup_counts([(day, kind, 1)])
+    keys = [(tracker, period, start, metric) for (period, start, metric) in counts]
+    conn.executemany(
+        'UPDATE rollups SET count = count - 1 WHERE tracker = ? AND period = ? AND start = ? AND metric = ?', keys
+    )
+    conn.executemany(
+        'DELETE FROM rollups WHERE tracker = ? AND period = ? AND start = ? AND metric = ? AND count <= 0', keys
+    )
+
+    # The event may have been the latest for its metrics: look up the new latest
+    for metric in latest:
+        sql = "SELECT MAX(date) FROM events WHERE tracker = ? AND completed = 1 AND date != ''"
+        params = [tracker]
+        if metric != TOTAL:
+            sql += ' AND type = ?'
+            params.append(metric)
+        (newest,) = conn.execute(sql, params).fetchone()
+        if newest:
+            conn.execute(
+                'INSERT OR REPLACE INTO rollup_latest (tracker, metric, date) VALUES (?, ?, ?)',
+                (tracker, metric, newest)
+            )
+        else:
+            conn.execute('DELETE FROM rollup_latest WHERE tracker = ? AND metric = ?', (tracker, metric))
+
+
+def _rebuild_rollups(conn: sqlite3.Connection, tracker: str):
+    """Recompute a tracker's rollups from its events (caller holds the transaction)."""
+    conn.execute('DELETE FROM rollups WHERE tracker = ?', (tracker,))
+    conn.execute('DELETE FROM rollup_latest WHERE tracker = ?', (tracker,))
+    _add_rollups(conn, tracker, conn.execute(
+        'SELECT date, type, COUNT(*) FROM events '
+        'WHERE tracker = ? AND completed = 1 GROUP BY date, type',
+        (tracker,)
+    ).fetchall())
+
+
+def _digest(entry: Dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(entry).encode('utf-8')).hexdigest()
+
+
+def _prefix_hasher():
+    return hashlib.sha256(b'[')
+
+
+def _extend_prefix(hasher, entries: List[Dict[str, Any]], first: bool):
+    """
+    Feed entries into a prefix digest (from _prefix_hasher()).
+
+    The digest covers the entries' JSON list text without its closing
+    bracket ('[e0, e1, e2'), so a longer prefix extends a shorter one and
+    the already-imported entries are encoded only once (in one call).
+
+    Args:
+        hasher: Prefix digest so far
+        entries: Next entries of the list
+        first: True if no entries were fed before these
+    """
+    text = json.dumps(entries)[1:-1]
+    if text and not first:
+        text = ', ' + text
+    hasher.update(text.encode('utf-8'))
+
+
+def _insert_events(conn: sqlite3.Connection, rows: List[Tuple]) -> Optional[int]:
+    """Insert event rows, the last one separately; returns the last row's id."""
+    if not rows:
+        return None
+    conn.executemany(
+        'INSERT INTO events (tracker, date, type, source, completed, payload) VALUES (?, ?, ?, ?, ?, ?)', rows[:-1]
+    )
+    return conn.execute(
+        'INSERT INTO events (tracker, date, type, source, completed, payload) VALUES (?, ?, ?, ?, ?, ?)', rows[-1]
+    ).lastrowid
+
+
+def _source_row(conn: sqlite3.Connection, tracker: str) -> Optional[Tuple]:
+    return conn.execute(
+        'SELECT path, mtime_ns, size, entries, prefix_sha256, last_sha256, last_event_id '
+        'FROM sources WHERE tracker = ?', (tracker,)
+    ).fetchone()
+
+
+def import_json(conn: sqlite3.Connection, tracker: str, json_path: Path) -> bool:
+    """
+    Import a tracker JSON file if it changed since the last import.
+
+    The skills append entries to their lists (and may edit the newest one),
+    so when the previously imported entries are unchanged only the rest is
+    inserted and added to the rollups. Otherwise the tracker's imported
+    events are replaced and its rollups recomputed. State is replaced
+    either way; all in one transaction, which holds the write lock from
+    before the import bookkeeping is read. Events added with `append_event`
+    are left alone.
+
+    Args:
+        conn: Open tracker database
+        tracker: Tracker name (a key of EVENT_KEYS)
+        json_path: Tracker JSON file
+
+    Returns:
+        True if the file was (re)imported, False if unchanged or missing
+    """
+    try:
+        stat = json_path.stat()
+    except OSError:
+        return False
+
+    def unchanged(source: Optional[Tuple]) -> bool:
+        return source is not None and source[:3] == (str(json_path), stat.st_mtime_ns, stat.st_size)
+
+    if unchanged(_source_row(conn, tracker)):
+        return False
+
+    with open(json_path, 'r') as f:
+        data = json.load(f)
+
+    events_key = EVENT_KEYS.get(tracker)
+    entries = (data.get(events_key) or []) if events_key else []
+    entries = [entry for entry in entries if isinstance(entry, dict)]
+    state = [
+        (tracker, key, json.dumps(value))
+        for key, value in data.items() if key != events_key
+    ]
+
+    def rows(start: int) -> List[Tuple]:
+        return [
+            (tracker, event_date(entry), event_type(entry), 'json', int(is_completed(entry)), json.dumps(entry))
+            for entry in entries[start:]
+        ]
+
+    # Take the write lock before reading what was imported, so two processes
+    # importing the same change (e.g. the daemon and a CLI run) can't both
+    # add the same new entries on top of the same old prefix
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        source = _source_row(conn, tracker)
+        if unchanged(source):
+            conn.commit()  # imported by another process meanwhile
+            return False
+
+        # Incremental only if every imported entry but the last is unchanged
+        imported = source[3] if source is not None and source[0] == str(json_path) else 0
+        prefix = _prefix_hasher()
+        incremental = False
+        if 0 < imported <= len(entries):
+            _extend_prefix(prefix, entries[:imported - 1], first=True)
+            incremental = prefix.hexdigest() == source[4]
+        if incremental:
+            _extend_prefix(prefix, entries[imported - 1:-1], first=imported == 1)
+        else:
+            prefix = _prefix_hasher()
+            _extend_prefix(prefix, entries[:-1], first=True)
+
+        conn.execute('DELETE FROM state WHERE tracker = ?', (tracker,))
+        conn.executemany('INSERT INTO state (tracker, key, value) VALUES (?, ?, ?)', state)
+
+        if incremental:
+            start, last_event_id = imported, source[6]
+            if _digest(entries[imported - 1]) != source[5]:
+                # The newest imported entry was edited: import it again
+                start = imported - 1
+                old = conn.execute(
+                    'SELECT date, type, completed FROM events WHERE id = ?', (last_event_id,)
+                ).fetchone()
+                conn.execute('DELETE FROM events WHERE id = ?', (last_event_id,))
+                if old is not None and old[2]:
+                    _remove_rollups(conn, tracker, old[0], old[1])
+            new_rows = rows(start)
+            last_event_id = _insert_events(conn, new_rows) or last_event_id
+            _add_rollups(conn, tracker, [(row[1], row[2], 1) for row in new_rows if row[4]])
+        else:
+            conn.execute("DELETE FROM events WHERE tracker = ? AND source = 'json'", (tracker,))
+            all_rows = rows(0)
+            # Date order keeps index inserts local (stable, so same-day order
+            # is kept); the newest entry goes last so its id is known
+            earlier = sorted(all_rows[:-1], key=lambda row: row[1])
+            last_event_id = _insert_events(conn, earlier + all_rows[-1:])
+            _rebuild_rollups(conn, tracker)
+
+        conn.execute(
+            'INSERT OR REPLACE INTO sources '
+            '(tracker, path, mtime_ns, size, entries, prefix_sha256, last_sha256, last_event_id) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (tracker, str(json_path), stat.st_mtime_ns, stat.st_size, len(entries), prefix.hexdigest(),
+             _digest(entries[-1]) if entries else None, last_event_id)
+        )
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    return True
+
+
+def append_event(
+    tracker: str,
+    entry: Dict[str, Any],
+    db_path: Path = TRACKER_DB
+) -> int:
+    """
+    Add one event directly to the store and update its rollups.
+
+    Args:
+        tracker: Tracker name (e.g. 'outreach')
+        entry: Entry in the tracker's JSON shape (needs a date-like field)
+        db_path: Tracker database
+
+    Returns:
+        Row id of the new event
+
+    Example:
+        append_event('outreach', {'date': '2025-11-30', 'type': 'email', 'company': 'Stripe'})
+    """
+    day, kind, completed = event_date(entry), event_type(entry), is_completed(entry)
+    with closing(connect(db_path)) as conn, conn:
+        cursor = conn.execute(
+            'INSERT INTO events (tracker, date, type, source, completed, payload) VALUES (?, ?, ?, ?, ?, ?)',
+            (tracker, day, kind, 'store', int(completed), json.dumps(entry))
+        )
+        if completed:
+            _add_rollups(conn, tracker, [(day, kind, 1)])
+        return cursor.lastrowid
+
+
+def set_state(tracker: str, values: Dict[str, Any], db_path: Path = TRACKER_DB):
+    """Set top-level scalar fields (e.g. {'streak': 5}) for a tracker."""
+    with closing(connect(db_path)) as conn, conn:
+        conn.executemany(
+            'INSERT OR REPLACE INTO state (tracker, key, value) VALUES (?, ?, ?)',
+            [(tracker, key, json.dumps(value)) for key, value in values.items()]
+        )
+
+
+def get_state(conn: sqlite3.Connection, tracker: str) -> Dict[str, Any]:
+    """Top-level scalar fields stored for a tracker."""
+    rows = conn.execute('SELECT key, value FROM state WHERE tracker = ?', (tracker,))
+    return {key: json.loads(value) for key, value in rows}
+
+
+def query_events(
+    conn: sqlite3.Connection,
+    tracker: str,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    types: Optional[Iterable[str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Events for a tracker in a date range, by date (same-day events in the
+    order they were recorded).
+
+    Args:
+        conn: Open tracker database
+        tracker: Tracker name
+        since: First date included
+        until: First date excluded
+        types: Only these event types (e.g. ['weekly_date'])
+
+    Returns:
+        List of entries in their original JSON shape
+
+    Example:
+        rituals = query_events(conn, 'carter', since=week_start(), types=['weekly_date'])
+    """
+    sql = 'SELECT payload FROM events WHERE tracker = ?'
+    params: List[Any] = [tracker]
+    if since is not None:
+        sql += ' AND date >= ?'
+        params.append(since.isoformat())
+    if until is not None:
+        sql += ' AND date < ?'
+        params.append(until.isoformat())
+    if types is not None:
+        types = list(types)
+        sql += f" AND type IN ({', '.join('?' * len(types))})"
+        params.extend(types)
+    sql += ' ORDER BY date, id'
+    return [json.loads(payload) for (payload,) in conn.execute(sql, params)]
+
+
+def rollup_counts(
+    conn: sqlite3.Connection,
+    tracker: str,
+    period: str,
+    start: date
+) -> Dict[str, int]:
+    """
+    Event counts for one rollup period.
+
+    Args:
+        conn: Open tracker database
+        tracker: Tracker name
+        period: 'day', 'week' or 'month'
+        start: The day, the week's Monday, or the 1st of the month
+
+    Returns:
+        Dict of metric -> count: TOTAL ('total') plus one entry per event type
+
+    Example:
+        counts = rollup_counts(conn, 'outreach', 'week', week_start())
+        print(f"{counts.get('total', 0)}/10 this week")
+    """
+    rows = conn.execute(
+        'SELECT metric, count FROM rollups WHERE tracker = ? AND period = ? AND start = ?',
+        (tracker, period, start.isoformat())
+    )
+    return dict(rows)
+
+
+def last_logged(conn: sqlite3.Connection, tracker: str) -> Dict[str, str]:
+    """Most recent date (YYYY-MM-DD) per metric, e.g. per needle-mover category."""
+    rows = conn.execute('SELECT metric, date FROM rollup_latest WHERE tracker = ?', (tracker,))
+    return dict(rows)
+
+
+def summarize_entries(entries: Iterable[Dict[str, Any]], day: date) -> Dict[str, Any]:
+    """
+    Compute the rollup fields `load_tracker` adds, straight from a list of entries.
+
+    Used when trackers are read from JSON instead of the store.
+
+    Args:
+        entries: Tracker list entries (e.g. all outreaches)
+        day: Day whose week and month to count
+
+    Returns:
+        Dict with week_counts, month_counts and last_logged
+    """
+    by_day_type = Counter(
+        (event_date(entry), event_type(entry))
+        for entry in entries if isinstance(entry, dict) and is_completed(entry)
+    )
+    counts, latest = _rollup_counts((d, kind, n) for (d, kind), n in by_day_type.items())
+
+    def period_counts(period: str, start: date) -> Dict[str, int]:
+        start = start.isoformat()
+        return {metric: n for (p, s, metric), n in counts.items() if p == period and s == start}
+
+    return {
+        'week_counts': period_counts('week', week_start(day)),
+        'month_counts': period_counts('month', day.replace(day=1)),
+        'last_logged': latest,
+    }
+
+
+def load_tracker(
+    tracker: str,
+    json_path: Optional[Path] = None,
+    since: Optional[date] = None,
+    rollups_for: Optional[date] = None,
+    db_path: Path = TRACKER_DB
+) -> Dict[str, Any]:
+    """
+    Load a tracker in its JSON shape, with only recent events and rollups.
+
+    Imports `json_path` first if it changed. Events are included only when
+    `since` is given, so callers never load the full history.
+
+    Args:
+        tracker: Tracker name (a key of EVENT_KEYS)
+        json_path: Tracker JSON file to import from (defaults to TRACKER_FILES)
+        since: Include events on or after this date under the tracker's list key
+        rollups_for: Include rollups for this day's week and month
+        db_path: Tracker database
+
+    Returns:
+        Dict of the tracker's scalar fields, plus e.g. 'outreaches' when
+        `since` is set, and when `rollups_for` is set:
+        - week_counts: Metric -> count for the ISO week
+        - month_counts: Metric -> count for the month
+        - last_logged: Metric -> most recent date
+
+    Example:
+        carter = load_tracker('carter', since=week_start())
+        logged = [r['type'] for r in carter['rituals']]
+    """
+    json_path = json_path or TRACKER_FILES.get(tracker)
+    with closing(connect(db_path)) as conn:
+        if json_path is not None:
+            import_json(conn, tracker, json_path)
+
+        data = get_state(conn, tracker)
+        if since is not None:
+            data[EVENT_KEYS.get(tracker, 'events')] = query_events(conn, tracker, since=since)
+        if rollups_for is not None:
+            data['week_counts'] = rollup_counts(conn, tracker, 'week', week_start(rollups_for))
+            data['month_counts'] = rollup_counts(conn, tracker, 'month', rollups_for.replace(day=1))
+            data['last_logged'] = last_logged(conn, tracker)
+        return data
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Tracker store maintenance")
+    parser.add_argument('--migrate', action='store_true', help="Import all tracker JSON files")
+    parser.add_argument('--db', type=Path, default=TRACKER_DB, help="Tracker database path")
+    args = parser.parse_args()
+
+    if args.migrate:
+        with closing(connect(args.db)) as conn:
+            for tracker, json_path in TRACKER_FILES.items():
+                imported = import_json(conn, tracker, json_path)
+                count = conn.execute(
+                    'SELECT COUNT(*) FROM events WHERE tracker = ?', (tracker,)
+                ).fetchone()[0]
+                status = 'imported' if imported else 'unchanged'
+                print(f"{tracker}: {status}, {count} events")
+    else:
+        parser.print_help()
@@ -0,0 +1,298 @@
+"""
+Training-load energy model over the local Strava activity history.
+
+Tracks acute (ATL, 7-day) and chronic (CTL, 42-day) training load as
+exponentially weighted daily averages of each activity's load. Form
+(TSB = CTL - ATL) classifies the day's energy: fresh is HIGH, deeply
+fatigued is LOW, anything between is MEDIUM.
+
+The load state is saved next to the activity store and updated
+incrementally: each run folds in only the activities stored since the last
+update (one update per activity) and decays to today in closed form. An
+empty history returns None so callers can fall back to the plan-based
+estimate.
+
+Usage:
+    from activity_store import load_activities
+    from training_load import energy_level
+
+    level = energy_level(load_activities())       # 'HIGH' / 'MEDIUM' / 'LOW' / None
+
+    state = update_training_load(load_activities())
+    print(state.form(date.today()))                # (atl, ctl, tsb)
+"""
+
+import json
+import math
+import os
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from activity_store import activity_datetime, activity_sort_key
+from paths import LOAD_STATE_FILE  # saved load state (derived from the activity store; safe to delete)
+
+# EWMA time constants in days
+ATL_DAYS = 7
+CTL_DAYS = 42
+
+# Form (TSB) thresholds for the energy classes
+HIGH_FORM = 5.0
+LOW_FORM = -15.0
+
+# Load per minute of moving time when an activity has no suffer score
+SPORT_LOAD_PER_MINUTE = {
+    'Run': 1.0,
+    'TrailRun': 1.1,
+    'VirtualRun': 1.0,
+    'Ride': 0.7,
+    'VirtualRide': 0.7,
+    'BackcountrySki': 0.9,
+    'AlpineSki': 0.5,
+    'NordicSki': 0.9,
+    'WeightTraining': 0.6,
+    'Walk': 0.3,
+    'Hike': 0.5,
+}
+DEFAULT_LOAD_PER_MINUTE = 0.6
+
+_ATL_DECAY = math.exp(-1 / ATL_DAYS)
+_CTL_DECAY = math.exp(-1 / CTL_DAYS)
+
+
+def activity_load(activity: Dict[str, Any]) -> float:
+    """
+    Training load of one activity.
+
+    Uses Strava's suffer score (relative effort) when the activity has one,
+    otherwise moving minutes weighted by sport.
+
+    Args:
+        activity: Strava activity dict
+
+    Returns:
+        Load in relative-effort units (0 if unknown)
+    """
+    suffer_score = activity.get('suffer_score')
+    if suffer_score:
+        return float(suffer_score)
+    sport = activity.get('sport_type') or activity.get('type')
+    minutes = (activity.get('moving_time') or 0) / 60
+    return minutes * SPORT_LOAD_PER_MINUTE.get(sport, DEFAULT_LOAD_PER_MINUTE)
+
+
+class TrainingLoad:
+    """
+    ATL/CTL as of the end of `day`, updated one activity at a time.
+
+    Both are linear in the loads, so an activity on any day (even one before
+    `day`) is folded in exactly by weighting it with the decay since then.
+    """
+
+    def __init__(
+        self,
+        day: Optional[date] = None,
+        atl: float = 0.0,
+        ctl: float = 0.0,
+        last_key: Optional[Tuple[str, str]] = None,
+        count: int = 0
+    ):
+        self.day = day
+        self.atl = atl
+        self.ctl = ctl
+        self.last_key = last_key  # sort key of the newest folded-in activity
+        self.count = count
+
+    def add(self, activity: Dict[str, Any]):
+        """Fold one activity into the load."""
+        start = activity_datetime(activity)
+        if start is None:
+            return
+        day, load = start.date(), activity_load(activity)
+
+        if self.day is None or day > self.day:
+            self._advance(day)
+        lag = (self.day - day).days
+        self.atl += load * (1 - _ATL_DECAY) * _ATL_DECAY ** lag
+        self.ctl += load * (1 - _CTL_DECAY) * _CTL_DECAY ** lag
+
+    def _advance(self, day: date):
+        if self.day is not None:
+            gap = (day - self.day).days
+            self.atl *= _ATL_DECAY ** gap
+            self.ctl *= _CTL_DECAY ** gap
+        self.day = day
+
+    def form(self, today: date) -> Optional[Tuple[float, float, float]]:
+        """
+        ATL, CTL and TSB as of today (decayed over rest days since the last activity).
+
+        Args:
+            today: Day to evaluate (must not be before the last folded-in activity)
+
+        Returns:
+            Tuple of (atl, ctl, tsb), or None if no activity has been added
+            or `today` is before the state's day
+        """
+        if self.day is None or today < self.day:
+            return None
+        gap = (today - self.day).days
+        atl = self.atl * _ATL_DECAY ** gap
+        ctl = self.ctl * _CTL_DECAY ** gap
+        return atl, ctl, ctl - atl
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'day': self.day.isoformat() if self.day else None,
+            'atl': self.atl,
+            'ctl': self.ctl,
+            'last_key': list(self.last_key) if self.last_key else None,
+            'count': self.count,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TrainingLoad':
+        return cls(
+            day=date.fromisoformat(data['day']) if data.get('day') else None,
+            atl=data.get('atl', 0.0),
+            ctl=data.get('ctl', 0.0),
+            last_key=tuple(data['last_key']) if data.get('last_key') else None,
+            count=data.get('count', 0)
+        )
+
+
+def classify(tsb: float) -> str:
+    """Map form (TSB) to an energy level."""
+    if tsb >= HIGH_FORM:
+        return 'HIGH'
+    if tsb <= LOW_FORM:
+        return 'LOW'
+    return 'MEDIUM'
+
+
+def plan_energy_level(todays_workout: str) -> str:
+    """
+    Energy from the plan alone, for days without training history.
+
+    A rest day is a fresh day; anything else is MEDIUM. Needs no MCP call,
+    so it's safe offline (e.g. when backfilling past days).
+    """
+    return 'HIGH' if todays_workout.strip().upper().startswith('REST') else 'MEDIUM'
+
+
+def _read_state(state_path: Path) -> TrainingLoad:
+    try:
+        with open(state_path, 'r') as f:
+            return TrainingLoad.from_dict(json.load(f))
+    except (OSError, ValueError, KeyError, TypeError):
+        return TrainingLoad()
+
+
+def _write_state(state: TrainingLoad, state_path: Path):
+    # Atomic replace; best effort, since the state can always be rebuilt
+    tmp_path = state_path.with_suffix(f'.{os.getpid()}.tmp')
+    try:
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'w') as f:
+            json.dump(state.to_dict(), f)
+        os.replace(tmp_path, state_path)
+    except OSError as e:
+        print(f"Warning: Could not save training load: {e}")
+
+
+def update_training_load(
+    activities: List[Dict[str, Any]],
+    state_path: Path = LOAD_STATE_FILE
+) -> TrainingLoad:
+    """
+    Fold activities stored since the last update into the saved load state.
+
+    Args:
+        activities: Stored activities, oldest first (e.g. load_activities())
+        state_path: Where the load state is saved
+
+    Returns:
+        Updated TrainingLoad
+
+    Example:
+        state = update_training_load(load_activities())
+        atl, ctl, tsb = state.form(date.today())
+    """
+    return _update(_read_state(state_path), activities, state_path)
+
+
+def _update(state: TrainingLoad, activities: List[Dict[str, Any]], state_path: Path) -> TrainingLoad:
+    # The store is append-only, so the state covers its first `count`
+    # activities; if it was rebuilt or shrank, start over
+    if state.count and (
+        state.count > len(activities)
+        or activity_sort_key(activities[state.count - 1]) != state.last_key
+    ):
+        state = TrainingLoad()
+
+    new = activities[state.count:]
+    if not new:
+        return state
+    for activity in new:
+        state.add(activity)
+    state.last_key = activity_sort_key(activities[-1])
+    state.count = len(activities)
+    _write_state(state, state_path)
+    return state
+
+
+def energy_level(
+    activities: List[Dict[str, Any]],
+    now: Optional[datetime] = None,
+    state_path: Path = LOAD_STATE_FILE
+) -> Optional[str]:
+    """
+    Classify today's energy from training load.
+
+    Updates the saved state incrementally. For a day before the newest
+    stored activity (e.g. a backfill) the load is computed from the
+    activities up to that day instead.
+
+    Args:
+        activities: Stored activities, oldest first
+        now: Day to classify (defaults to now)
+        state_path: Where the load state is saved
+
+    Returns:
+        'HIGH', 'MEDIUM' or 'LOW', or None if there is no history to go on
+
+    Example:
+        level = energy_level(load_activities()) or 'MEDIUM'
+    """
+    if not activities:
+        return None
+    today = (now or datetime.now()).date()
+
+    state = _read_state(state_path)
+    if state.day is None or today >= state.day:
+        form = _update(state, activities, state_path).form(today)
+    else:
+        form = None
+    if form is None:
+        state = TrainingLoad()
+        for activity in activities:
+            start = activity_datetime(activity)
+            if start is not None and start.date() <= today:
+                state.add(activity)
+        form = state.form(today)
+    if form is None:
+        return None
+    return classify(form[2])
+
+
+if __name__ == '__main__':
+    from activity_store import load_activities
+
+    state = update_training_load(load_activities())
+    form = state.form(date.today())
+    if form is None:
+        print("No training history yet")
+    else:
+        atl, ctl, tsb = form
+        print(f"ATL {atl:.1f}  CTL {ctl:.1f}  TSB {tsb:+.1f}  →  {classify(tsb)} energy")
+        print(f"({state.count} activities, last on {state.day})")
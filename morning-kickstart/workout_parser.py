@@ -6,17 +6,346 @@ Parses the workout plan markdown file to extract:
 - Phase dates (start/end)
 - Weekly workout template
 - Volume targets
+- An index of every dated phase, for date-based phase lookup
+
+Metadata records the plan file's mtime, size and content hash, so the plan
+is reparsed exactly when the file changes.
 """
 
+import bisect
+import hashlib
 import json
 import re
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+from paths import METADATA_FILE, PLAN_FILE
+from profiling import mark_cache
+
+
+def plan_fingerprint(plan_path: Path = PLAN_FILE, content: Optional[bytes] = None) -> Dict[str, Any]:
+    """
+    Fingerprint the plan file for change detection.
+
+    Args:
+        plan_path: Path to workout plan markdown file
+        content: File bytes if already read (avoids a second read)
+
+    Returns:
+        Dict with plan_mtime_ns, plan_size and plan_sha256
+    """
+    stat = plan_path.stat()
+    if content is None:
+        content = plan_path.read_bytes()
+
+    return {
+        'plan_mtime_ns': stat.st_mtime_ns,
+        'plan_size': stat.st_size,
+        'plan_sha256': hashlib.sha256(content).hexdigest()
+    }
+
+
+# Line-level patterns used by the plan tokenizer (each matches within one line)
+_HEADING_RE = re.compile(r'^(#{1,6})\s+(.*?)\s*$')
+_BOLD_LINE_RE = re.compile(r'^\*\*([^*]+)\*\*')
+_DECISION_RE = re.compile(
+    r'\*\*Decision:\*\* Starting (Phase \d+[^)]+) (?:fresh on|begins) (?:Monday, )?(\w+ \d+)',
+    re.IGNORECASE
+)
+_VOLUME_RE = re.compile(r'\*\*Weekly Volume[:\]]*\*\* [~]?(\d+-\d+ miles?|\d+ miles?)', re.IGNORECASE)
+_PHASE_HEADING_RE = re.compile(r'(Phase \d+: .+)')
+_WEEK_SCHEDULE_RE = re.compile(r'^Week \d+ Schedule')
+_DATE_RANGE_RE = re.compile(r'(\w+ \d+)\s*-\s*(\w+ \d+),?\s*(\d{4})')
+_BOLD_RE = re.compile(r'\*\*([^*]+)\*\*')
+
+
+def build_plan_index(content: str) -> Dict[str, Any]:
+    """
+    Tokenize plan markdown in a single pass over its lines.
+
+    Every lookup parse_workout_plan() needs is answered from this index, so
+    parse time grows linearly with the plan size instead of rescanning the
+    whole file once per regex.
+
+    Args:
+        content: Plan markdown text
+
+    Returns:
+        Dict with:
+        - headings: List of (line_no, level, text)
+        - heading_bold: Dict of heading line_no -> text of the bold line
+          directly under it (e.g. the phase date range)
+        - tables: List of (line_no, header_cells, rows) where rows are lists
+          of cell strings (separator row excluded)
+        - decisions: List of (line_no, phase_name) from "**Decision:** Starting ..." lines
+        - volumes: List of (line_no, target) from "**Weekly Volume:**" lines
+        - line_count: Number of lines
+        - heading_lines, table_lines, volume_lines: Sorted line numbers of
+          the headings, tables and volumes (for bisect lookups)
+        - section_ends: Dict of heading line_no -> line where its section
+          ends (the next heading of the same or a higher level)
+
+    Example:
+        index = build_plan_index(Path('plan.md').read_text())
+        for line_no, level, text in index['headings']:
+            print(level, text)
+    """
+    headings = []
+    heading_bold = {}
+    tables = []
+    decisions = []
+    volumes = []
+
+    last_heading = None
+    table_rows = None
+    table_start = 0
+
+    lines = content.splitlines()
+    for line_no, line in enumerate(lines):
+        stripped = line.strip()
+
+        # Tables: consecutive lines starting with '|'
+        if stripped.startswith('|'):
+            if table_rows is None:
+                table_rows = []
+                table_start = line_no
+            table_rows.append([cell.strip() for cell in stripped.split('|')][1:-1])
+            last_heading = None
+            continue
+        if table_rows is not None:
+            tables.append(_finish_table(table_start, table_rows))
+            table_rows = None
+
+        if not stripped:
+            continue
+
+        if stripped.startswith('#'):
+            heading_match = _HEADING_RE.match(stripped)
+            if heading_match:
+                headings.append((line_no, len(heading_match.group(1)), heading_match.group(2)))
+                last_heading = line_no
+                continue
+
+        if stripped.startswith('**'):
+            if last_heading is not None:
+                bold_match = _BOLD_LINE_RE.match(stripped)
+                if bold_match:
+                    heading_bold[last_heading] = bold_match.group(1).strip()
+
+            decision_match = _DECISION_RE.search(stripped)
+            if decision_match:
+                decisions.append((line_no, decision_match.group(1).strip()))
+
+        volume_match = _VOLUME_RE.search(stripped)
+        if volume_match:
+            volumes.append((line_no, volume_match.group(1)))
+
+        # Only the first non-blank line under a heading counts as its bold line
+        last_heading = None
+
+    if table_rows is not None:
+        tables.append(_finish_table(table_start, table_rows))
+
+    return {
+        'headings': headings,
+        'heading_bold': heading_bold,
+        'tables': tables,
+        'decisions': decisions,
+        'volumes': volumes,
+        'line_count': len(lines),
+        'heading_lines': [heading[0] for heading in headings],
+        'table_lines': [table[0] for table in tables],
+        'volume_lines': [volume[0] for volume in volumes],
+        'section_ends': _section_ends(headings, len(lines))
+    }
+
+
+def _section_ends(headings: List[Tuple[int, int, str]], line_count: int) -> Dict[int, int]:
+    """End line of every heading's section, in one stack pass over the headings."""
+    ends = {}
+    open_sections = []  # (level, line_no), levels strictly increasing
+    for line_no, level, _ in headings:
+        while open_sections and open_sections[-1][0] >= level:
+            ends[open_sections.pop()[1]] = line_no
+        open_sections.append((level, line_no))
+    for _, line_no in open_sections:
+        ends[line_no] = line_count
+    return ends
+
+
+def _finish_table(line_no: int, rows: List[List[str]]) -> Tuple[int, List[str], List[List[str]]]:
+    """Split a raw table into header and body rows, dropping the |---| separator."""
+    header = rows[0]
+    body = [
+        row for row in rows[1:]
+        if not all(set(cell) <= set('-: ') for cell in row)
+    ]
+    return line_no, header, body
+
+
+def _find_phase_heading(index: Dict[str, Any], phase_name: str) -> Optional[int]:
+    """Line number of the first level-2 heading naming the phase."""
+    for line_no, level, text in index['headings']:
+        if level == 2 and phase_name in text:
+            return line_no
+    return None
+
+
+def _section_end(index: Dict[str, Any], heading_line: int) -> int:
+    """Line number where the section starting at heading_line ends."""
+    return index['section_ends'].get(heading_line, index['line_count'])
+
+
+def _find_template(
+    index: Dict[str, Any],
+    start: int,
+    end: int,
+    header_prefix: List[str],
+    heading_prefix: Optional[str] = None,
+    heading_re: Optional[re.Pattern] = None
+) -> Dict[str, str]:
+    """
+    Find the first matching heading in [start, end) and read the day table under it.
+
+    Returns:
+        Dict mapping day abbreviations to workouts (empty if not found)
+    """
+    heading_line = None
+    headings = index['headings']
+    for position in range(bisect.bisect_left(index['heading_lines'], start), len(headings)):
+        line_no, _, text = headings[position]
+        if line_no >= end:
+            break
+        if (heading_prefix and text.startswith(heading_prefix)) or (heading_re and heading_re.match(text)):
+            heading_line = line_no
+            break
+
+    if heading_line is None:
+        return {}
+
+    tables = index['tables']
+    for position in range(bisect.bisect_left(index['table_lines'], heading_line), len(tables)):
+        table_line, header, rows = tables[position]
+        if table_line >= end:
+            break
+        if header[:len(header_prefix)] != header_prefix:
+            continue
+
+        weekly_template = {}
+        for parts in rows:
+            if len(parts) >= 2:
+                day = parts[0]  # Mon, Tue, Wed, etc.
+                # Clean up workout description
+                workout = _BOLD_RE.sub(r'\1', parts[1])  # Remove bold
+                weekly_template[day] = workout
+        return weekly_template
+
+    return {}
+
+
+def _phase_details(index: Dict[str, Any], section_start: int, section_end: int) -> Tuple[Dict[str, str], str]:
+    """
+    Weekly template and volume target for the phase section [section_start, section_end).
+
+    Returns:
+        Tuple of (weekly_template, weekly_volume_target)
+    """
+    # Find the weekly template for this phase
+    # First try to find "Weekly Template Structure" table
+    weekly_template = _find_template(
+        index, section_start, section_end,
+        heading_prefix='Weekly Template Structure',
+        header_prefix=['Day', 'Workout']
+    )
 
-# Default paths
-PLAN_FILE = Path("/Users/samuelz/Documents/LLM CONTEXT/1 - personal/marathon_training/post-marathon-ski-fitness-plan.md")
-METADATA_FILE = Path("/Users/samuelz/Documents/LLM CONTEXT/.claude/skills/data/workout-plan-metadata.json")
+    if not weekly_template:
+        # Fallback: try to find a week schedule
+        weekly_template = _find_template(
+            index, section_start, section_end,
+            heading_re=_WEEK_SCHEDULE_RE,
+            header_prefix=['Day', 'Workout', 'Details']
+        )
+
+    if not weekly_template:
+        # Last resort: create a basic template
+        weekly_template = {
+            'Mon': 'REST',
+            'Tue': 'Run',
+            'Wed': 'Strength',
+            'Thu': 'Run',
+            'Fri': 'Strength',
+            'Sat': 'Long Run',
+            'Sun': 'REST or Easy'
+        }
+
+    # Extract weekly volume target (the phase's own, else the first in the plan)
+    weekly_volume_target = "Not specified"
+    position = bisect.bisect_left(index['volume_lines'], section_start)
+    if position < len(index['volumes']) and index['volumes'][position][0] < section_end:
+        weekly_volume_target = index['volumes'][position][1]
+    elif index['volumes']:
+        weekly_volume_target = index['volumes'][0][1]
+
+    return weekly_template, weekly_volume_target
+
+
+def _build_phase_index(index: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Collect every phase header with a parseable date range.
+
+    Returns:
+        List of phase dicts sorted by start date
+    """
+    phases = []
+    for line_no, level, text in index['headings']:
+        phase_match = _PHASE_HEADING_RE.search(text)
+        if level != 2 or not phase_match or line_no not in index['heading_bold']:
+            continue
+
+        start, end = _parse_date_range(index['heading_bold'][line_no])
+        if not start:
+            continue
+
+        weekly_template, weekly_volume_target = _phase_details(
+            index, line_no, _section_end(index, line_no)
+        )
+        phases.append({
+            'name': phase_match.group(1).strip(),
+            'start': start,
+            'end': end,
+            'weekly_template': weekly_template,
+            'weekly_volume_target': weekly_volume_target
+        })
+
+    phases.sort(key=lambda phase: phase['start'])
+    return phases
+
+
+def _parse_date_range(dates_line: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Parse a date range like "Nov 18 - Dec 15, 2025" into ISO dates.
+
+    Returns:
+        Tuple of (start, end) as YYYY-MM-DD, or (None, None) if unparseable
+    """
+    date_match = _DATE_RANGE_RE.search(dates_line)
+    if not date_match:
+        return None, None
+
+    start_str = f"{date_match.group(1)}, {date_match.group(3)}"
+    end_str = f"{date_match.group(2)}, {date_match.group(3)}"
+    try:
+        start = datetime.strptime(start_str, "%b %d, %Y")
+        end = datetime.strptime(end_str, "%b %d, %Y")
+    except ValueError:
+        return None, None
+
+    # The year is only written once; a range like "Dec 16 - Jan 31, 2026"
+    # starts in the previous year
+    if start > end:
+        start = start.replace(year=start.year - 1)
+    return start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")
 
 
 def parse_workout_plan(plan_path: Path = PLAN_FILE) -> Dict[str, Any]:
@@ -34,7 +363,11 @@ def parse_workout_plan(plan_path: Path = PLAN_FILE) -> Dict[str, Any]:
         - phase_end: Phase end date (YYYY-MM-DD)
         - weekly_template: Dict mapping day abbreviations to workouts
         - weekly_volume_target: Target weekly mileage
+        - phases: Every dated phase in the plan, sorted by start date, each a
+          dict with name, start, end, weekly_template, weekly_volume_target
+          (see find_phase_for_date)
         - parsed_at: Timestamp when metadata was generated
+        - plan_mtime_ns, plan_size, plan_sha256: Source file fingerprint
 
     Example:
         metadata = parse_workout_plan()
@@ -44,129 +377,42 @@ def parse_workout_plan(plan_path: Path = PLAN_FILE) -> Dict[str, Any]:
     if not plan_path.exists():
         raise FileNotFoundError(f"Workout plan not found: {plan_path}")
 
-    with open(plan_path, 'r') as f:
-        content = f.read()
+    raw = plan_path.read_bytes()
+    content = raw.decode('utf-8')
 
-    # Find the current phase section based on "Current Status" updates
-    current_phase_match = re.search(
-        r'\*\*Decision:\*\* Starting (Phase \d+[^)]+) (?:fresh on|begins) (?:Monday, )?(\w+ \d+)',
-        content,
-        re.IGNORECASE
-    )
+    index = build_plan_index(content)
 
-    if not current_phase_match:
-        # Fallback: look for phase headers
-        phase_match = re.search(r'## .+ (Phase \d+: [^\\n]+)\n\*\*([^-]+)', content)
-        if phase_match:
-            phase_name = phase_match.group(1).strip()
-            dates_str = phase_match.group(2).strip()
-        else:
-            raise ValueError("Could not determine current training phase")
+    # Find the current phase based on "Current Status" updates
+    if index['decisions']:
+        phase_name = index['decisions'][0][1]
     else:
-        phase_name = current_phase_match.group(1).strip()
-        # Need to find phase dates separately
-        phase_section = re.search(
-            rf'## [^\\n]* {re.escape(phase_name)}[^\\n]*\n\*\*([^-\*]+)',
-            content
-        )
-        if phase_section:
-            dates_str = phase_section.group(1).strip()
-        else:
-            dates_str = None
+        # Fallback: first phase header followed by a bold (dates) line
+        phase_name = None
+        for line_no, level, text in index['headings']:
+            phase_match = _PHASE_HEADING_RE.search(text)
+            if level == 2 and phase_match and line_no in index['heading_bold']:
+                phase_name = phase_match.group(1).strip()
+                break
+        if not phase_name:
+            raise ValueError("Could not determine current training phase")
 
-    # Extract phase dates - look for the phase header with dates
-    phase_header_match = re.search(
-        rf'## [^#]+ {re.escape(phase_name)}[^\\n]*\n\*\*([^*]+)\*\*',
-        content
-    )
+    heading_line = _find_phase_heading(index, phase_name)
 
+    # Extract phase dates from the bold line under the phase header
     phase_start = None
     phase_end = None
 
-    if phase_header_match:
-        dates_line = phase_header_match.group(1).strip()
-        # Try to parse date range like "Nov 18 - Dec 15, 2025"
-        date_match = re.search(
-            r'(\w+ \d+)\s*-\s*(\w+ \d+),?\s*(\d{4})',
-            dates_line
-        )
-        if date_match:
-            start_str = f"{date_match.group(1)}, {date_match.group(3)}"
-            end_str = f"{date_match.group(2)}, {date_match.group(3)}"
-            try:
-                phase_start = datetime.strptime(start_str, "%b %d, %Y").strftime("%Y-%m-%d")
-                phase_end = datetime.strptime(end_str, "%b %d, %Y").strftime("%Y-%m-%d")
-            except ValueError:
-                pass
-
-    # Find the weekly template for this phase
-    # First try to find "Weekly Template Structure" table
-    template_match = re.search(
-        rf'{re.escape(phase_name)}.*?### Weekly Template Structure.*?\| Day \| Workout \|[^\n]*\n\|[-\s|]+\n((?:\|[^\n]+\n)+)',
-        content,
-        re.DOTALL
-    )
-
-    weekly_template = {}
-
-    if template_match:
-        # Parse the Weekly Template Structure table
-        table_rows = template_match.group(1).strip().split('\n')
-        for row in table_rows:
-            if row.startswith('|---') or not row.strip():  # Skip separator row
-                continue
-
-            parts = [p.strip() for p in row.split('|')]
-            if len(parts) >= 3:
-                day = parts[1]  # Mon, Tue, Wed, etc.
-                workout = parts[2]
+    if heading_line is not None and heading_line in index['heading_bold']:
+        phase_start, phase_end = _parse_date_range(index['heading_bold'][heading_line])
 
-                # Clean up workout description
-                workout = re.sub(r'\*\*([^*]+)\*\*', r'\1', workout)  # Remove bold
-                weekly_template[day] = workout
+    # Lookups are scoped to the phase's section; if the phase has no header,
+    # search from the line that first names it to the end of the plan
+    if heading_line is not None:
+        section_start, section_end = heading_line, _section_end(index, heading_line)
     else:
-        # Fallback: try to find a week schedule
-        phase_schedule = re.search(
-            rf'{re.escape(phase_name)}.*?### Week \d+ Schedule.*?\| Day \| Workout \| Details \|.*?\n((?:\|[^\n]+\n)+)',
-            content,
-            re.DOTALL
-        )
+        section_start, section_end = index['decisions'][0][0], index['line_count']
 
-        if phase_schedule:
-            # Parse the table
-            table_rows = phase_schedule.group(1).strip().split('\n')
-            for row in table_rows:
-                if row.startswith('|---'):  # Skip separator row
-                    continue
-
-                parts = [p.strip() for p in row.split('|')]
-                if len(parts) >= 3:
-                    day = parts[1]  # Mon, Tue, Wed, etc.
-                    workout = parts[2]
-
-                    # Clean up workout description
-                    workout = re.sub(r'\*\*([^*]+)\*\*', r'\1', workout)  # Remove bold
-                    weekly_template[day] = workout
-        else:
-            # Last resort: create a basic template
-            weekly_template = {
-                'Mon': 'REST',
-                'Tue': 'Run',
-                'Wed': 'Strength',
-                'Thu': 'Run',
-                'Fri': 'Strength',
-                'Sat': 'Long Run',
-                'Sun': 'REST or Easy'
-            }
-
-    # Extract weekly volume target
-    volume_match = re.search(
-        r'\*\*Weekly Volume[:\]]*\*\* [~]?(\d+-\d+ miles?|\d+ miles?)',
-        content,
-        re.IGNORECASE
-    )
-
-    weekly_volume_target = volume_match.group(1) if volume_match else "Not specified"
+    weekly_template, weekly_volume_target = _phase_details(index, section_start, section_end)
 
     metadata = {
         'plan_file': str(plan_path),
@@ -175,12 +421,79 @@ def parse_workout_plan(plan_path: Path = PLAN_FILE) -> Dict[str, Any]:
         'phase_end': phase_end,
         'weekly_template': weekly_template,
         'weekly_volume_target': weekly_volume_target,
+        'phases': _build_phase_index(index),
         'parsed_at': datetime.now().isoformat()
     }
+    metadata.update(plan_fingerprint(plan_path, raw))
 
     return metadata
 
 
+def find_phase_for_date(metadata: Dict[str, Any], when: date) -> Optional[Dict[str, Any]]:
+    """
+    Find the plan phase containing a date.
+
+    Binary search over the phase index stored in the metadata, so phase
+    rollovers and next-week planning don't need to reparse the plan.
+
+    Args:
+        metadata: Metadata dict from get_or_refresh_metadata()
+        when: Date to look up
+
+    Returns:
+        Phase dict (name, start, end, weekly_template, weekly_volume_target),
+        or None if no phase covers the date
+
+    Example:
+        phase = find_phase_for_date(metadata, date.today() + timedelta(days=7))
+        if phase:
+            print(f"Next week: {phase['name']}")
+    """
+    phases = metadata.get('phases') or []
+    day = when.isoformat()
+
+    position = bisect.bisect_right([phase['start'] for phase in phases], day) - 1
+    if position < 0:
+        return None
+
+    phase = phases[position]
+    if phase['end'] and day > phase['end']:
+        return None
+    return phase
+
+
+def metadata_for_date(metadata: Dict[str, Any], when: date) -> Dict[str, Any]:
+    """
+    Resolve the current-phase fields of the metadata for a given date.
+
+    Args:
+        metadata: Metadata dict from get_or_refresh_metadata()
+        when: Date to resolve the phase for
+
+    Returns:
+        Copy of metadata with current_phase, phase_start, phase_end,
+        weekly_template and weekly_volume_target taken from the phase
+        containing `when` (unchanged if no indexed phase covers it)
+
+    Example:
+        metadata = metadata_for_date(get_or_refresh_metadata(), date.today())
+        print(metadata['weekly_template'].get('Mon'))
+    """
+    phase = find_phase_for_date(metadata, when)
+    if phase is None:
+        return metadata
+
+    resolved = dict(metadata)
+    resolved.update({
+        'current_phase': phase['name'],
+        'phase_start': phase['start'],
+        'phase_end': phase['end'],
+        'weekly_template': phase['weekly_template'],
+        'weekly_volume_target': phase['weekly_volume_target']
+    })
+    return resolved
+
+
 def save_workout_metadata(metadata: Dict[str, Any], output_path: Path = METADATA_FILE):
     """
     Save workout metadata to JSON file.
@@ -234,6 +547,9 @@ def is_metadata_stale(metadata: Dict[str, Any], max_days: int = 30) -> bool:
     """
     Check if workout metadata is stale and needs updating.
 
+    Date-based check kept for callers without a plan file to compare against;
+    get_or_refresh_metadata() uses is_plan_changed() instead.
+
     Metadata is considered stale if:
     - Parsed more than max_days ago
     - Phase end date has passed
@@ -276,13 +592,52 @@ def is_metadata_stale(metadata: Dict[str, Any], max_days: int = 30) -> bool:
     return False
 
 
+def is_plan_changed(metadata: Dict[str, Any], plan_path: Path = PLAN_FILE) -> bool:
+    """
+    Check if the plan file changed since the metadata was parsed.
+
+    Compares mtime and size first (one stat call). Only if those differ is the
+    file hashed, so touching the file without editing it doesn't reparse.
+    When the content is unchanged, the stored mtime/size are updated in place
+    so the next check is stat-only again.
+
+    Args:
+        metadata: Metadata dict from load_workout_metadata()
+        plan_path: Path to workout plan markdown file
+
+    Returns:
+        True if the plan content changed (or metadata has no fingerprint)
+
+    Example:
+        metadata = load_workout_metadata()
+        if is_plan_changed(metadata):
+            metadata = parse_workout_plan()
+    """
+    if 'plan_sha256' not in metadata:
+        return True
+
+    stat = plan_path.stat()
+    if (metadata.get('plan_mtime_ns') == stat.st_mtime_ns
+            and metadata.get('plan_size') == stat.st_size):
+        return False
+
+    fingerprint = plan_fingerprint(plan_path)
+    if fingerprint['plan_sha256'] != metadata['plan_sha256']:
+        return True
+
+    metadata.update(fingerprint)
+    return False
+
+
 def get_or_refresh_metadata(
     metadata_path: Path = METADATA_FILE,
     plan_path: Path = PLAN_FILE,
     force_refresh: bool = False
 ) -> Dict[str, Any]:
     """
-    Get workout metadata, refreshing if stale or missing.
+    Get workout metadata, reparsing only if the plan file changed or metadata is missing.
+
+    If the plan file is missing but metadata exists, the saved metadata is used.
 
     Args:
         metadata_path: Path to metadata JSON file
@@ -304,12 +659,26 @@ def get_or_refresh_metadata(
     if not needs_refresh:
         try:
             metadata = load_workout_metadata(metadata_path)
-            if is_metadata_stale(metadata):
-                print("Workout metadata is stale, reparsing...")
-                needs_refresh = True
         except FileNotFoundError:
             print("Workout metadata not found, parsing plan...")
             needs_refresh = True
+        else:
+            if not plan_path.exists():
+                return metadata
+
+            saved_fingerprint = metadata.get('plan_mtime_ns'), metadata.get('plan_size')
+            if 'phases' not in metadata:
+                print("Workout metadata has no phase index, reparsing...")
+                needs_refresh = True
+            elif is_plan_changed(metadata, plan_path):
+                print("Workout plan changed, reparsing...")
+                needs_refresh = True
+            elif saved_fingerprint != (metadata['plan_mtime_ns'], metadata['plan_size']):
+                # Touched but not edited: record the new mtime so the next check is stat-only
+                save_workout_metadata(metadata, metadata_path)
+
+    # Saved metadata counts as a cache hit when profiling
+    mark_cache(not needs_refresh)
 
     if needs_refresh:
         metadata = parse_workout_plan(plan_path)
@@ -330,6 +699,9 @@ if __name__ == '__main__':
     print(f"\nWeekly template:")
     for day, workout in metadata['weekly_template'].items():
         print(f"  {day}: {workout}")
+    print(f"\nPhase index:")
+    for phase in metadata['phases']:
+        print(f"  {phase['start']} to {phase['end']}: {phase['name']}")
 
     save_workout_metadata(metadata)
     print(f"\nMetadata saved successfully!")